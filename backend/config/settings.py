@@ -5,7 +5,7 @@ Centralized configuration for the trading system.
 Environment-specific settings (dev, staging, production).
 """
 from enum import Enum
-from typing import Dict, Tuple
+from typing import Dict, Optional, Tuple
 import os
 
 class Environment(str, Enum):
@@ -55,9 +55,15 @@ class Settings:
     
     # Cache
     CANDLE_CACHE_TTL: int = 300  # 5 minutes
+    CANDLE_CACHE_MAX_BYTES: int = 256 * 1024 * 1024  # 256 MB across all frames
     INDICATOR_CACHE_TTL: int = 60  # 1 minute
+    INDICATOR_CACHE_MAX_ENTRIES: int = 128  # One frame per symbol/interval
     NEWS_CACHE_TTL: int = 600  # 10 minutes
     
+    # Chart
+    CHART_CANDLES: int = 300  # Candles returned by /api/chartdata
+    CHART_MAX_CANDLES: int = 20000  # Upper bound for the limit parameter
+    
     # Strategy scanning
     SCAN_INTERVAL: int = 60  # seconds (every 60s)
     WATCHLIST_SCAN_LIMIT: int = 10  # Scan first 10 symbols
@@ -65,6 +71,12 @@ class Settings:
     # WebSocket
     WS_TICK_INTERVAL: int = 5  # seconds (send price every 5s)
     WS_STATUS_INTERVAL: int = 60  # seconds (send status every 60s)
+    WS_SEND_QUEUE_SIZE: int = 256  # Outbound messages buffered per client
+    WS_SLOW_CLIENT_POLICY: str = os.getenv("WS_SLOW_CLIENT_POLICY", "coalesce")  # drop_oldest | coalesce | disconnect
+    WS_TICK_BATCH_MAX_MS: int = 5000  # Longest tick batching window a client may request
+    WS_MAX_TOPICS_PER_CONNECTION: int = 50  # (symbol, interval) subscriptions per client
+    WS_NO_DATA_RETRY: int = 60  # seconds before re-polling a topic that returned no data
+    WS_NO_DATA_RETRY_MAX: int = 900  # Retry wait doubles per empty poll up to this
     
     # Trading
     MAX_ACTIVE_TRADES_PER_SYMBOL: int = 1  # One trade per symbol
@@ -117,6 +129,33 @@ class MarketHours:
     }
     
     FUTURES_SUFFIX = '=F'
+    
+    # yfinance ticker suffix → exchange (no suffix = US listing)
+    SUFFIX_MARKETS: Dict[str, MarketName] = {
+        '.NS': MarketName.NSE,
+        '.BO': MarketName.NSE,  # BSE keeps NSE hours
+        '.L': MarketName.LSE,
+    }
+    
+    @classmethod
+    def market_for(cls, symbol: str) -> Optional[MarketName]:
+        """Exchange a symbol trades on; None for 24/7 instruments (crypto, futures)."""
+        sym = symbol.upper()
+        if sym in cls.CRYPTO_SYMBOLS or sym.endswith(cls.FUTURES_SUFFIX) or sym.endswith('-USD'):
+            return None
+        for suffix, market in cls.SUFFIX_MARKETS.items():
+            if sym.endswith(suffix):
+                return market
+        return MarketName.NYSE
+    
+    @classmethod
+    def session_open(cls, symbol: str) -> Tuple[str, Tuple[int, int]]:
+        """(timezone, (hour, minute)) a symbol's trading day starts at; UTC midnight for 24/7."""
+        market = cls.market_for(symbol)
+        if market is None:
+            return 'UTC', (0, 0)
+        tz, open_time, _close = cls.HOURS[market]
+        return tz, open_time
 
 
 class IndicatorParams:
@@ -2,10 +2,13 @@
 backend/core/signal.py - Trade signal model
 
 Represents a BUY/SELL signal generated by a strategy.
+SignalBatch holds many signals column-wise (NumPy arrays) for long
+histories and multi-symbol scans.
 """
 from dataclasses import dataclass, asdict
-from typing import Optional, Literal
+from typing import Iterator, List, Optional, Literal, Sequence, Union
 from datetime import datetime
+import numpy as np
 
 
 @dataclass
@@ -95,3 +98,259 @@ class Signal:
             return round(((self.price - self.sl) / self.price) * 100, 2)
         else:
             return round(((self.sl - self.price) / self.price) * 100, 2)
+
+
+@dataclass(eq=False)
+class SignalBatch:
+    """
+    Columnar batch of signals from one strategy on one symbol.
+    
+    Struct-of-arrays counterpart of List[Signal]: one NumPy array per
+    field instead of one object per signal. Behaves like a read-only
+    sequence of Signal (len, iteration, indexing), so existing callers
+    keep working, while filtering, slicing and serialization stay
+    column-wise.
+    
+    Attributes:
+        symbol: Trading symbol (shared by all rows)
+        strategy: Strategy name (shared by all rows)
+        is_buy: bool array, True = BUY, False = SELL
+        price, sl, tp, rsi, atr, confidence: float64 arrays
+        time: int64 array of Unix timestamps
+    """
+    
+    symbol: str
+    strategy: str
+    is_buy: np.ndarray
+    price: np.ndarray
+    sl: np.ndarray
+    tp: np.ndarray
+    rsi: np.ndarray
+    atr: np.ndarray
+    confidence: np.ndarray
+    time: np.ndarray
+    
+    _FLOAT_FIELDS = ('price', 'sl', 'tp', 'rsi', 'atr', 'confidence')
+    # Decimal places used by Signal.to_dict (None = left as is)
+    _ROUNDING = {'price': 4, 'sl': 4, 'tp': 4, 'rsi': 2, 'atr': 4, 'confidence': None}
+    
+    def __post_init__(self):
+        """Coerce dtypes and validate integrity for all rows at once."""
+        self.is_buy = np.asarray(self.is_buy, dtype=bool)
+        for name in self._FLOAT_FIELDS:
+            setattr(self, name, np.asarray(getattr(self, name), dtype=np.float64))
+        self.time = np.asarray(self.time, dtype=np.int64)
+        
+        n = len(self.is_buy)
+        for name in self._FLOAT_FIELDS + ('time',):
+            assert len(getattr(self, name)) == n, f"Column {name} has wrong length"
+        
+        assert np.all((self.confidence >= 0) & (self.confidence <= 100)), \
+            "Confidence must be 0-100"
+        buy_ok = (self.sl < self.price) & (self.price < self.tp)
+        sell_ok = (self.tp < self.price) & (self.price < self.sl)
+        bad = np.flatnonzero(~np.where(self.is_buy, buy_ok, sell_ok))
+        if bad.size:
+            i = int(bad[0])
+            raise AssertionError(
+                f"{self._type_at(i)}: invalid SL({self.sl[i]}) / Price({self.price[i]}) "
+                f"/ TP({self.tp[i]}) ordering at row {i}")
+    
+    # ─────────────────────────────────────────────────────────────
+    # Construction
+    # ─────────────────────────────────────────────────────────────
+    
+    @classmethod
+    def empty(cls, symbol: str = "", strategy: str = "") -> 'SignalBatch':
+        """Batch with no rows."""
+        return cls(symbol, strategy, [], [], [], [], [], [], [], [])
+    
+    @classmethod
+    def from_signals(cls, signals: Sequence[Signal], symbol: str = "",
+                     strategy: str = "") -> 'SignalBatch':
+        """
+        Build a batch from Signal objects.
+        
+        Symbol and strategy are taken from the first signal when present.
+        """
+        signals = list(signals)
+        if signals:
+            symbol, strategy = signals[0].symbol, signals[0].strategy
+        return cls(
+            symbol=symbol,
+            strategy=strategy,
+            is_buy=[s.type == 'BUY' for s in signals],
+            price=[s.price for s in signals],
+            sl=[s.sl for s in signals],
+            tp=[s.tp for s in signals],
+            rsi=[s.rsi for s in signals],
+            atr=[s.atr for s in signals],
+            confidence=[s.confidence for s in signals],
+            time=[s.time for s in signals],
+        )
+    
+    @classmethod
+    def concat(cls, batches: Sequence['SignalBatch']) -> 'SignalBatch':
+        """
+        Concatenate batches of one symbol and strategy.
+        
+        Empty batches are skipped when checking labels. For several
+        symbols or strategies (multi-symbol scans) keep one batch each.
+        
+        Raises:
+            ValueError: If non-empty batches differ in symbol or strategy
+        """
+        batches = list(batches)
+        if not batches:
+            return cls.empty()
+        labelled = [b for b in batches if len(b)] or batches
+        first = labelled[0]
+        for b in labelled[1:]:
+            if (b.symbol, b.strategy) != (first.symbol, first.strategy):
+                raise ValueError(
+                    f"Cannot concat signals of {b.symbol}/{b.strategy} onto "
+                    f"{first.symbol}/{first.strategy}")
+        columns = {
+            name: np.concatenate([getattr(b, name) for b in batches])
+            for name in ('is_buy',) + cls._FLOAT_FIELDS + ('time',)
+        }
+        return cls(first.symbol, first.strategy, **columns)
+    
+    # ─────────────────────────────────────────────────────────────
+    # Sequence interface
+    # ─────────────────────────────────────────────────────────────
+    
+    def __len__(self) -> int:
+        return len(self.is_buy)
+    
+    def __iter__(self) -> Iterator[Signal]:
+        for i in range(len(self)):
+            yield self._row(i)
+    
+    def __getitem__(self, key: Union[int, slice, np.ndarray, list]) \
+            -> Union[Signal, 'SignalBatch']:
+        """Integer → Signal; slice, boolean mask or index array → SignalBatch."""
+        if isinstance(key, (int, np.integer)):
+            n = len(self)
+            if not -n <= key < n:
+                raise IndexError("SignalBatch index out of range")
+            return self._row(int(key) % n)
+        return self._take(key)
+    
+    @property
+    def type(self) -> np.ndarray:
+        """'BUY' / 'SELL' per row."""
+        return np.where(self.is_buy, 'BUY', 'SELL')
+    
+    def filter(self, mask: np.ndarray) -> 'SignalBatch':
+        """Rows where mask is True."""
+        return self._take(np.asarray(mask, dtype=bool))
+    
+    def since(self, timestamp: int) -> 'SignalBatch':
+        """Rows with time >= timestamp."""
+        return self.filter(self.time >= timestamp)
+    
+    def to_signals(self) -> List[Signal]:
+        """Materialize Signal objects."""
+        return list(self)
+    
+    # ─────────────────────────────────────────────────────────────
+    # Serialization
+    # ─────────────────────────────────────────────────────────────
+    
+    def to_dict(self) -> dict:
+        """
+        Column-wise dict for JSON serialization.
+        
+        Returns:
+            {'symbol', 'strategy', 'count', 'type': [...], 'price': [...], ...}
+            with the same rounding as Signal.to_dict
+        """
+        d = {
+            'symbol': self.symbol,
+            'strategy': self.strategy,
+            'count': len(self),
+            'type': self.type.tolist(),
+        }
+        for name, values in self._rounded_columns().items():
+            d[name] = values
+        d['time'] = self.time.tolist()
+        return d
+    
+    def iter_records(self) -> Iterator[dict]:
+        """
+        Yield one dict per row, identical to Signal.to_dict().
+        
+        Columns are rounded and converted to Python lists once, then
+        zipped lazily, so callers can stream rows without building
+        Signal objects.
+        """
+        cols = self._rounded_columns()
+        types = self.type.tolist()
+        times = self.time.tolist()
+        for i in range(len(self)):
+            yield {
+                'type': types[i],
+                'symbol': self.symbol,
+                'price': cols['price'][i],
+                'sl': cols['sl'][i],
+                'tp': cols['tp'][i],
+                'rsi': cols['rsi'][i],
+                'atr': cols['atr'][i],
+                'confidence': cols['confidence'][i],
+                'strategy': self.strategy,
+                'time': times[i],
+                'target_bars': None,
+                'target_time': None,
+                'target_datetime': None,
+            }
+    
+    def to_records(self) -> List[dict]:
+        """List of row dicts (same shape as [s.to_dict() for s in signals])."""
+        return list(self.iter_records())
+    
+    # ─────────────────────────────────────────────────────────────
+    # Internals
+    # ─────────────────────────────────────────────────────────────
+    
+    def _rounded_columns(self) -> dict:
+        """Float columns rounded like Signal.to_dict, as Python lists."""
+        out = {}
+        for name in self._FLOAT_FIELDS:
+            values = getattr(self, name)
+            decimals = self._ROUNDING[name]
+            if decimals is not None:
+                values = np.round(values, decimals)
+            out[name] = values.tolist()
+        return out
+    
+    def _type_at(self, i: int) -> str:
+        return 'BUY' if self.is_buy[i] else 'SELL'
+    
+    def _row(self, i: int) -> Signal:
+        return Signal(
+            type=self._type_at(i),
+            symbol=self.symbol,
+            price=float(self.price[i]),
+            sl=float(self.sl[i]),
+            tp=float(self.tp[i]),
+            rsi=float(self.rsi[i]),
+            atr=float(self.atr[i]),
+            confidence=float(self.confidence[i]),
+            strategy=self.strategy,
+            time=int(self.time[i]),
+        )
+    
+    def _take(self, key) -> 'SignalBatch':
+        return SignalBatch(
+            symbol=self.symbol,
+            strategy=self.strategy,
+            is_buy=self.is_buy[key],
+            price=self.price[key],
+            sl=self.sl[key],
+            tp=self.tp[key],
+            rsi=self.rsi[key],
+            atr=self.atr[key],
+            confidence=self.confidence[key],
+            time=self.time[key],
+        )
@@ -12,13 +12,49 @@ Functions:
     - supertrend(high, low, close, factor, atr_len) → Supertrend direction (-1/+1)
     - macd(close, fast, slow, signal) → (macd_line, signal_line, histogram)
     - bollinger_bands(close, period, std_dev) → (upper, middle, lower)
+    - vwap(high, low, close, volume) → cumulative VWAP
+    - session_vwap(high, low, close, volume, tz, session_open) → VWAP reset each session
     - crossover(series1, series2) → Boolean series
     - crossunder(series1, series2) → Boolean series
-    - apply_indicators(df) → df with all indicators computed
+    - apply_indicators(df, columns, inplace, dtype, dropna) → df with only the requested indicators
+    - apply_all_indicators(df, inplace, dtype, dropna) → df with all indicators computed
+    - compute_indicators(df, columns) → (df with every row kept, valid_from)
+    - warmup_mask(df) → rows dropna would drop (for inplace / dropna=False frames)
+
+Parameterized variants, memoized per frame (registry.py):
+    get_indicator(df, name, **params), e.g. get_indicator(df, 'supertrend', factor=2.0, atr_len=7)
+
+Multi-symbol (bars × symbols arrays, one pass for all symbols) in panel.py:
+    PricePanel, panel_indicators(panel), panel_ema/sma/rsi/atr/macd/bollinger
+
+Computed frames are cached per (symbol, interval, candles) in cache.py:
+    IndicatorCache().get_or_compute(symbol, interval, candles, columns)
+
+Streaming (O(1) per bar) counterparts live in incremental.py:
+    EMAState, RSIState, ATRState, MACDState, BollingerState, SupertrendState,
+    RollingStatsState, SMAState, VWAPState
+
+O(n) rolling mean/std kernels (prefix sums, 1-D or bars × columns) in rolling.py:
+    rolling_mean(values, window), rolling_mean_std(values, window)
 """
 import pandas as pd
 import numpy as np
-from typing import Tuple
+from typing import Iterable, Optional, Tuple
+
+from backend.domain.indicators.incremental import (
+    EMAState, RSIState, ATRState, MACDState, BollingerState, SupertrendState,
+    RollingStatsState, SMAState, VWAPState,
+)
+from backend.domain.indicators.rolling import rolling_mean, rolling_mean_std
+from backend.domain.indicators.plan import all_indicator_columns, plan_indicators, warmup_bars
+from backend.domain.indicators.cache import IndicatorCache
+from backend.domain.indicators.panel import (
+    PricePanel, panel_indicators, panel_ema, panel_sma, panel_rsi, panel_atr,
+    panel_macd, panel_bollinger,
+)
+from backend.domain.indicators.registry import (
+    register_indicator, get_indicator, indicator_key, frame_cache_stats,
+)
 
 
 # ─────────────────────────────────────────────────────────────────────
@@ -50,7 +86,7 @@ def sma(series: pd.Series, length: int) -> pd.Series:
     Returns:
         SMA series
     """
-    return series.rolling(window=length).mean()
+    return pd.Series(rolling_mean(series.to_numpy(dtype=float), length), index=series.index)
 
 
 # ─────────────────────────────────────────────────────────────────────
@@ -140,13 +176,105 @@ def bollinger_bands(close: pd.Series, period: int = 20, std_dev: float = 2.0) \
     Returns:
         Tuple of (Upper band, Middle (SMA), Lower band)
     """
-    middle = sma(close, period)
-    std = close.rolling(window=period).std()
+    # Mean and std from one prefix-sum pass (rolling.py)
+    mean, std = rolling_mean_std(close.to_numpy(dtype=float), period)
+    middle = pd.Series(mean, index=close.index)
+    std = pd.Series(std, index=close.index)
     upper = middle + (std * std_dev)
     lower = middle - (std * std_dev)
     return upper, middle, lower
 
 
+def vwap(high: pd.Series, low: pd.Series, close: pd.Series,
+         volume: pd.Series) -> pd.Series:
+    """
+    Volume Weighted Average Price, cumulative over the whole series.
+    
+    Args:
+        high, low, close: Price series
+        volume: Volume series
+    
+    Returns:
+        VWAP series (NaN until the first bar with volume)
+    """
+    tp = (high + low + close) / 3
+    return (tp * volume).cumsum() / volume.replace(0, np.nan).cumsum()
+
+
+def session_starts(index: pd.DatetimeIndex, tz: str = 'UTC',
+                   session_open: Tuple[int, int] = (0, 0)) -> np.ndarray:
+    """
+    Mark the first bar of each trading session.
+    
+    A session runs from session_open (local time in tz) to the next
+    day's open, so every bar belongs to exactly one session.
+    
+    Args:
+        index: Bar timestamps (tz-naive is taken as UTC)
+        tz: Market timezone (e.g. 'America/New_York')
+        session_open: (hour, minute) the session starts at
+    
+    Returns:
+        Boolean array, True on each session's first bar
+    """
+    if len(index) == 0:
+        return np.zeros(0, dtype=bool)
+    if index.tz is None:
+        index = index.tz_localize('UTC')
+    local = index.tz_convert(tz).tz_localize(None)
+    shifted = local - pd.Timedelta(hours=session_open[0], minutes=session_open[1])
+    day = shifted.to_numpy(dtype='datetime64[D]')
+    starts = np.empty(len(day), dtype=bool)
+    starts[0] = True
+    starts[1:] = day[1:] != day[:-1]
+    return starts
+
+
+def session_vwap(high: pd.Series, low: pd.Series, close: pd.Series, volume: pd.Series,
+                 tz: str = 'UTC', session_open: Tuple[int, int] = (0, 0)) -> pd.Series:
+    """
+    Volume Weighted Average Price anchored to each trading session.
+    
+    Computed with one cumulative sum over the whole series, from which
+    each session's opening offset is subtracted (group-wise cumsum).
+    
+    Args:
+        high, low, close: Price series (DatetimeIndex)
+        volume: Volume series
+        tz: Market timezone (see MarketHours.session_open)
+        session_open: (hour, minute) local session start
+    
+    Returns:
+        VWAP series (NaN until the session's first bar with volume)
+    """
+    tp = ((high + low + close) / 3).to_numpy(dtype=float)
+    vol = volume.to_numpy(dtype=float)
+    pv = tp * vol
+    missing = np.isnan(pv)
+    pv = np.where(missing, 0.0, pv)
+    vol = np.where(missing, 0.0, vol)
+    
+    starts = session_starts(close.index, tz, session_open)
+    session = np.cumsum(starts) - 1
+    cum_pv = np.cumsum(pv)
+    cum_v = np.cumsum(vol)
+    # Subtract the running totals as of each session's open
+    cum_pv -= (cum_pv - pv)[starts][session]
+    cum_v -= (cum_v - vol)[starts][session]
+    
+    with np.errstate(invalid='ignore', divide='ignore'):
+        values = np.where(cum_v > 0, cum_pv / cum_v, np.nan)
+    values[missing] = np.nan
+    return pd.Series(values, index=close.index)
+
+
+def is_intraday(index: pd.Index) -> bool:
+    """True if bars are shorter than a day (session anchoring applies)."""
+    if len(index) < 2 or not isinstance(index, pd.DatetimeIndex):
+        return False
+    return (index[-1] - index[0]) / (len(index) - 1) < pd.Timedelta(days=1)
+
+
 # ─────────────────────────────────────────────────────────────────────
 # Trend Indicators
 # ─────────────────────────────────────────────────────────────────────
@@ -174,49 +302,73 @@ def supertrend(high: pd.Series, low: pd.Series, close: pd.Series,
     hl2 = (high + low) / 2.0
     
     # Raw bands
-    raw_upper = hl2 + factor * atr_vals
-    raw_lower = hl2 - factor * atr_vals
+    raw_upper = (hl2 + factor * atr_vals).to_numpy(dtype=float)
+    raw_lower = (hl2 - factor * atr_vals).to_numpy(dtype=float)
+    close_arr = close.to_numpy(dtype=float)
     
-    n = len(close)
-    upper = np.zeros(n)
-    lower = np.zeros(n)
-    st_dir = np.zeros(n)   # +1 bearish, -1 bullish
+    n = len(close_arr)
+    if n == 0:
+        return pd.Series([], index=close.index, dtype=float)
     
-    close_arr = close.values
-    upper_arr = raw_upper.values
-    lower_arr = raw_lower.values
+    if _supertrend_kernel_jit is not None:
+        st_dir = _supertrend_kernel_jit(close_arr, raw_upper, raw_lower, np.empty(n))
+    else:
+        # Plain Python floats are much cheaper per element than NumPy scalars
+        st_dir = _supertrend_kernel(close_arr.tolist(), raw_upper.tolist(),
+                                    raw_lower.tolist(), [0.0] * n)
     
-    # Initialize first bar
-    upper[0] = upper_arr[0]
-    lower[0] = lower_arr[0]
-    st_dir[0] = 1  # Start bearish until proven otherwise
+    return pd.Series(st_dir, index=close.index, dtype=float)
+
+
+def _supertrend_kernel(close, raw_upper, raw_lower, out):
+    """
+    Supertrend band ratchet + direction, one pass.
+    
+    Band and direction state is carried in local scalars. The function is
+    written so it runs both as plain Python over lists and compiled by
+    numba over arrays.
     
-    for i in range(1, n):
+    Args:
+        close, raw_upper, raw_lower: Per-bar values (same length, >= 1)
+        out: Preallocated output (+1 bearish, -1 bullish per bar)
+    
+    Returns:
+        out
+    """
+    upper = raw_upper[0]
+    lower = raw_lower[0]
+    direction = 1.0  # Start bearish until proven otherwise
+    out[0] = direction
+    
+    for i in range(1, len(close)):
+        prev_close = close[i - 1]
+        
         # Lower band (support in uptrend) — only tighten upward
-        if lower_arr[i] > lower[i-1] or close_arr[i-1] < lower[i-1]:
-            lower[i] = lower_arr[i]
-        else:
-            lower[i] = lower[i-1]
+        if raw_lower[i] > lower or prev_close < lower:
+            lower = raw_lower[i]
         
         # Upper band (resistance in downtrend) — only tighten downward
-        if upper_arr[i] < upper[i-1] or close_arr[i-1] > upper[i-1]:
-            upper[i] = upper_arr[i]
-        else:
-            upper[i] = upper[i-1]
+        if raw_upper[i] < upper or prev_close > upper:
+            upper = raw_upper[i]
         
         # Direction
-        if st_dir[i-1] == 1:  # Previously bearish
-            if close_arr[i] > upper[i]:
-                st_dir[i] = -1  # Flip to bullish
-            else:
-                st_dir[i] = 1  # Stay bearish
-        else:  # Previously bullish
-            if close_arr[i] < lower[i]:
-                st_dir[i] = 1  # Flip to bearish
-            else:
-                st_dir[i] = -1  # Stay bullish
+        if direction == 1.0:  # Previously bearish
+            if close[i] > upper:
+                direction = -1.0  # Flip to bullish
+        elif close[i] < lower:  # Previously bullish
+            direction = 1.0  # Flip to bearish
+        
+        out[i] = direction
     
-    return pd.Series(st_dir, index=close.index, dtype=float)
+    return out
+
+
+# Optional: numba-compiled kernel when numba is installed
+try:
+    from numba import njit
+    _supertrend_kernel_jit = njit(cache=True)(_supertrend_kernel)
+except ImportError:
+    _supertrend_kernel_jit = None
 
 
 # ─────────────────────────────────────────────────────────────────────
@@ -245,63 +397,151 @@ def crossunder(series1: pd.Series, series2: pd.Series) -> pd.Series:
 # Batch Indicator Application
 # ─────────────────────────────────────────────────────────────────────
 
-def apply_all_indicators(df: pd.DataFrame) -> pd.DataFrame:
+def apply_indicators(df: pd.DataFrame, columns: Optional[Iterable[str]] = None,
+                     inplace: bool = False, dtype=None, dropna: bool = True,
+                     skip_existing: bool = False) -> pd.DataFrame:
     """
-    Apply all technical indicators to a OHLCV DataFrame.
+    Apply the technical indicators needed for `columns` to a OHLCV DataFrame.
     
-    Added columns:
-        - ema_9, ema_21, ema_50, ema_200
-        - rsi_14
-        - atr_14
-        - bb_upper, bb_middle, bb_lower
-        - macd, macd_signal, macd_hist
-        - supertrend
-        - crossover_9_21, crossunder_9_21
+    Uses the dependency plan in plan.py: only the requested columns and
+    the columns they depend on are computed (e.g. crossover_9_21 pulls in
+    ema_9 and ema_21), each once.
+    
+    Indicators are computed from the input columns without copying the
+    frame. The result is then either written into df (inplace) or built
+    once with only the kept rows, with no intermediate full copy.
     
     Args:
         df: DataFrame with OHLCV columns
+        columns: Indicator columns wanted (None = all)
+        inplace: Add the columns to df itself and return it. Rows are
+                 never dropped; use warmup_mask() to skip warmup bars.
+        dtype: Dtype for float indicator columns (e.g. np.float32 halves
+               their memory); None keeps float64
+        dropna: Drop warmup and NaN rows (ignored when inplace)
+        skip_existing: Don't recompute indicator columns df already has
+                       (extending a cached frame with more columns)
     
     Returns:
-        DataFrame with indicators added and NaN rows dropped
+        DataFrame with indicators added (NaN rows dropped if dropna)
     """
-    df = df.copy()
-    
     # Flatten MultiIndex columns if yfinance returns them
-    if isinstance(df.columns, pd.MultiIndex):
-        df.columns = df.columns.get_level_values(0)
+    names = df.columns
+    if isinstance(names, pd.MultiIndex):
+        names = names.get_level_values(0)
+    data = {name: df.iloc[:, i] for i, name in enumerate(names)}
     
     # Ensure required columns exist
     required = ['Open', 'High', 'Low', 'Close', 'Volume']
     for col in required:
-        if col not in df.columns:
+        if col not in data:
             raise ValueError(f"Missing required column: {col}")
     
-    c = df['Close']
-    h = df['High']
-    l = df['Low']
+    if columns is None:
+        columns = all_indicator_columns()
+    
+    computed = {}
+    available = data.keys() if skip_existing else ()
+    for node in plan_indicators(columns, available):
+        for name, values in zip(node.outputs, node.compute(data)):
+            data[name] = computed[name] = values
+    
+    if dtype is not None:
+        computed = {name: values.astype(dtype) if values.dtype.kind == 'f' else values
+                    for name, values in computed.items()}
+    
+    if inplace:
+        if isinstance(df.columns, pd.MultiIndex):
+            df.columns = names
+        for name, values in computed.items():
+            df[name] = values
+        return df
+    
+    data.update(computed)
+    if not dropna:
+        return pd.DataFrame(data, index=df.index)
+    
+    # Drop warmup bars (same start for every plan), then NaN rows. Each
+    # full-length column is released as soon as its kept rows are copied,
+    # and the frame takes the sliced arrays as they are.
+    keep = ~_warmup_mask(data.values(), len(df))
+    computed.clear()
+    kept = {name: data.pop(name).to_numpy()[keep] for name in list(data)}
+    return pd.DataFrame(kept, index=df.index[keep], copy=False)
+
+
+def compute_indicators(df: pd.DataFrame, columns: Optional[Iterable[str]] = None,
+                       dtype=None) -> Tuple[pd.DataFrame, int]:
+    """
+    Apply indicators keeping every row, and report where they become valid.
     
-    # Moving Averages
-    df['ema_9'] = ema(c, 9)
-    df['ema_21'] = ema(c, 21)
-    df['ema_50'] = ema(c, 50)
-    df['ema_200'] = ema(c, 200)
+    Unlike apply_indicators(dropna=True) no history is deleted: row
+    positions match the input, so appending bars or caching by position
+    doesn't require realigning the frame.
     
-    # Momentum
-    df['rsi_14'] = rsi(c, 14)
-    df['macd'], df['macd_signal'], df['macd_hist'] = macd(c, 12, 26, 9)
+    valid_from is the full pipeline's warmup whichever columns were
+    requested, i.e. the first row a dropna=True frame keeps. Strategies
+    gated on it start at the same bar as on a dropped frame, even when
+    their own plan becomes defined earlier.
     
-    # Volatility
-    df['atr_14'] = atr(h, l, c, 14)
-    df['bb_upper'], df['bb_middle'], df['bb_lower'] = bollinger_bands(c, 20, 2.0)
+    Args:
+        df: DataFrame with OHLCV columns
+        columns: Indicator columns wanted (None = all)
+        dtype: Dtype for float indicator columns (see apply_indicators)
     
-    # Trend
-    df['supertrend'] = supertrend(h, l, c, 3.0, 10)
+    Returns:
+        Tuple of (DataFrame with indicators, valid_from)
+    """
+    frame = apply_indicators(df, columns, dtype=dtype, dropna=False)
+    return frame, min(warmup_bars(), len(frame))
+
+
+def warmup_mask(df: pd.DataFrame, columns: Optional[Iterable[str]] = None) -> np.ndarray:
+    """
+    Rows apply_indicators(dropna=True) would drop.
     
-    # Crossovers
-    df['crossover_9_21'] = crossover(df['ema_9'], df['ema_21'])
-    df['crossunder_9_21'] = crossunder(df['ema_9'], df['ema_21'])
+    For frames built with inplace=True or dropna=False: strategies can
+    mask these bars instead of the frame being re-sliced.
     
-    # Drop NaN rows from indicator calculation
-    df.dropna(inplace=True)
+    Args:
+        df: DataFrame with indicator columns
+        columns: Columns to check (None = all)
     
-    return df
+    Returns:
+        Boolean array, True for warmup / NaN rows
+    """
+    columns = df.columns if columns is None else list(columns)
+    return _warmup_mask((df[c] for c in columns), len(df))
+
+
+def _warmup_mask(columns, n: int) -> np.ndarray:
+    """warmup_mask() over an iterable of equal-length Series/arrays."""
+    mask = np.zeros(n, dtype=bool)
+    mask[:warmup_bars()] = True
+    for values in columns:
+        mask |= pd.isna(np.asarray(values))
+    return mask
+
+
+def apply_all_indicators(df: pd.DataFrame, inplace: bool = False, dtype=None,
+                         dropna: bool = True) -> pd.DataFrame:
+    """
+    Apply all technical indicators to a OHLCV DataFrame.
+    
+    Added columns:
+        - ema_9, ema_21, ema_50, ema_200
+        - rsi_14
+        - atr_14
+        - bb_upper, bb_middle, bb_lower
+        - macd, macd_signal, macd_hist
+        - supertrend
+        - crossover_9_21, crossunder_9_21
+    
+    Args:
+        df: DataFrame with OHLCV columns
+        inplace, dtype, dropna: See apply_indicators()
+    
+    Returns:
+        DataFrame with indicators added (NaN rows dropped if dropna)
+    """
+    return apply_indicators(df, inplace=inplace, dtype=dtype, dropna=dropna)
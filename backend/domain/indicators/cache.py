@@ -0,0 +1,165 @@
+"""
+backend/domain/indicators/cache.py - Indicator result cache
+
+Keeps computed indicator frames so switching strategies (or reloading a
+chart) on unchanged candles doesn't recompute every indicator.
+
+Features:
+    - Keyed by (symbol, interval, last bar timestamp, row count, hash of
+      the last bar's OHLCV, plan signature): a new bar, a revision of the
+      still-forming last bar, or a change of indicator parameters
+      produces a different key. Earlier bars are never rewritten by the
+      provider, so the whole frame needn't be hashed.
+    - A cached frame grows as strategies ask for more columns: only the
+      columns it doesn't have yet are computed and merged in
+    - TTL expiry (Settings.INDICATOR_CACHE_TTL) and an entry limit; at
+      most one version is kept per (symbol, interval)
+    - Hit / partial-hit / miss counters
+
+Cached frames are shared between requests and must be treated as
+read-only.
+"""
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Iterable, Optional, Tuple
+import threading
+import time
+
+import pandas as pd
+
+from backend.config.settings import Settings
+from backend.domain.indicators.plan import OHLCV_COLUMNS, plan_signature
+
+
+# (symbol, interval, last_ts, rows, last bar hash, plan signature)
+IndicatorKey = Tuple[str, str, int, int, int, str]
+
+
+@dataclass
+class IndicatorEntry:
+    """A cached indicator frame with its bookkeeping."""
+
+    frame: pd.DataFrame
+    stored_at: float  # time.monotonic() when stored
+
+
+class IndicatorCache:
+    """
+    TTL + LRU cache of indicator frames.
+
+    Thread-safe; computation happens outside the lock.
+
+    Usage:
+        cache = IndicatorCache()
+        df, valid_from = cache.get_or_compute('BTC-USD', '5m', candles, ['rsi_14'])
+    """
+
+    def __init__(self, ttl: float = Settings.INDICATOR_CACHE_TTL,
+                 max_entries: int = Settings.INDICATOR_CACHE_MAX_ENTRIES):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[IndicatorKey, IndicatorEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.partial_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(symbol: str, interval: str, candles: pd.DataFrame) -> IndicatorKey:
+        """Key for a candle frame (identifies its content by last bar and length)."""
+        if len(candles) == 0:
+            return (symbol.upper(), interval, 0, 0, 0, plan_signature())
+        last_ts = int(pd.Timestamp(candles.index[-1]).value)
+        last_bar = hash(tuple(candles[list(OHLCV_COLUMNS)].iloc[-1].tolist()))
+        return (symbol.upper(), interval, last_ts, len(candles), last_bar, plan_signature())
+
+    def get_or_compute(self, symbol: str, interval: str, candles: pd.DataFrame,
+                       columns: Optional[Iterable[str]] = None) -> Tuple[pd.DataFrame, int]:
+        """
+        Indicator frame for candles, from cache when the candles are unchanged.
+
+        Args:
+            symbol: Trading symbol
+            interval: Timeframe
+            candles: OHLCV frame (not modified)
+            columns: Indicator columns needed (None = all)
+
+        Returns:
+            Tuple of (DataFrame with at least the requested columns,
+            valid_from); see compute_indicators()
+        """
+        # Imported lazily: this module is imported by the package __init__
+        from backend.domain.indicators import (
+            all_indicator_columns, apply_indicators, compute_indicators, warmup_bars,
+        )
+
+        columns = all_indicator_columns() if columns is None else list(columns)
+        key = self.make_key(symbol, interval, candles)
+        valid_from = min(warmup_bars(), len(candles))
+
+        cached = self._get(key)
+        if cached is not None:
+            missing = [c for c in columns if c not in cached.columns]
+            if not missing:
+                with self._lock:
+                    self.hits += 1
+                return cached, valid_from
+
+            with self._lock:
+                self.partial_hits += 1
+            frame = apply_indicators(cached, missing, dropna=False, skip_existing=True)
+        else:
+            with self._lock:
+                self.misses += 1
+            frame, valid_from = compute_indicators(candles, columns)
+
+        self._set(key, frame)
+        return frame, valid_from
+
+    def invalidate(self, symbol: Optional[str] = None) -> None:
+        """Drop entries for one symbol, or everything if symbol is None."""
+        with self._lock:
+            if symbol is None:
+                self._entries.clear()
+                return
+            for key in [k for k in self._entries if k[0] == symbol.upper()]:
+                del self._entries[key]
+
+    def stats(self) -> dict:
+        """Counters and size for monitoring."""
+        with self._lock:
+            lookups = self.hits + self.partial_hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'partial_hits': self.partial_hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+            }
+
+    def _get(self, key: IndicatorKey) -> Optional[pd.DataFrame]:
+        """Fresh cached frame for key, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry.stored_at > self.ttl:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry.frame
+
+    def _set(self, key: IndicatorKey, frame: pd.DataFrame) -> None:
+        """Store a frame, replacing older versions of the same symbol/interval."""
+        with self._lock:
+            for old in [k for k in self._entries if k[:2] == key[:2] and k != key]:
+                del self._entries[old]
+            self._entries[key] = IndicatorEntry(frame, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,417 @@
+"""
+backend/domain/indicators/incremental.py - Streaming indicator state
+
+Stateful counterparts of the batch functions in this package. Each keeps
+only the recursive state (EMA value, Wilder averages, Supertrend bands and
+direction, rolling window mean/variance, session VWAP sums) and folds in
+one bar in O(1), so a new or updated live bar doesn't require
+recomputing the whole history.
+
+Values match the batch functions bar for bar (same NaN warmup). Across
+NaN input bars the EMA-style states (EMA, RSI, ATR, MACD) weight the
+next value the way pandas ewm(adjust=False) does, and the rolling states
+(SMA, Bollinger) are NaN until the NaN leaves the window.
+
+Classes:
+    - EMAState(length)
+    - RSIState(length)
+    - ATRState(length)
+    - MACDState(fast, slow, signal_len)
+    - RollingStatsState(window) / SMAState(length)
+    - BollingerState(period, std_dev)
+    - SupertrendState(factor, atr_len)
+    - VWAPState(tz, session_open)
+
+Usage:
+    st = RSIState(14)
+    for close in history:
+        st.update(close)
+    st.update(live_close, replace_last=True)   # forming bar changed
+"""
+from collections import deque
+from typing import Optional, Tuple
+import math
+
+NaN = float('nan')
+
+
+class IncrementalIndicator:
+    """
+    Base for streaming indicators.
+
+    update() appends a bar. With replace_last=True it first rolls the
+    state back to before the previous update, so a still-forming bar can
+    be revised any number of times before the next bar arrives.
+
+    Subclasses list their mutable scalar fields in _STATE and implement
+    _step(); anything else they need to roll back is handled in
+    _save()/_restore().
+    """
+
+    _STATE: Tuple[str, ...] = ()
+
+    def __init__(self):
+        self._checkpoint = None
+        self.count = 0
+
+    def update(self, *bar, replace_last: bool = False):
+        """
+        Fold one bar into the state.
+
+        Args:
+            *bar: Bar values (see subclass)
+            replace_last: Revise the most recent bar instead of appending
+
+        Returns:
+            Indicator value(s) for this bar
+        """
+        if replace_last and self._checkpoint is not None:
+            self._restore(self._checkpoint)
+        self._checkpoint = self._save()
+        self.count += 1
+        return self._step(*bar)
+
+    def _step(self, *bar):
+        raise NotImplementedError
+
+    def _save(self):
+        return tuple(getattr(self, name) for name in self._STATE) + (self.count,)
+
+    def _restore(self, saved) -> None:
+        for name, value in zip(self._STATE, saved):
+            setattr(self, name, value)
+        self.count = saved[-1]
+
+
+def _ewm_step(value: float, weight: float, alpha: float, x: float) -> Tuple[float, float]:
+    """
+    One bar of pandas ewm(alpha, adjust=False).mean().
+
+    weight is the running value's weight. It also decays on NaN bars
+    (ignore_na=False), so the first value after a gap counts for more
+    against an older average, as in pandas.
+
+    Returns:
+        (value, weight) after the bar
+    """
+    if math.isnan(value):
+        return x, 1.0
+    weight *= 1.0 - alpha
+    if math.isnan(x):
+        return value, weight
+    if value != x:
+        # pandas gives the new bar the remaining weight when com == 1
+        new_weight = 1.0 - weight if alpha == 0.5 else alpha
+        value = (weight * value + new_weight * x) / (weight + new_weight)
+    return value, 1.0
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Moving Averages / Momentum
+# ─────────────────────────────────────────────────────────────────────
+
+class EMAState(IncrementalIndicator):
+    """EMA (matches ema(): ewm(span=length, adjust=False)). update(x) → ema."""
+
+    _STATE = ('value', 'weight')
+
+    def __init__(self, length: int):
+        super().__init__()
+        self.alpha = 2.0 / (length + 1)
+        self.value = NaN
+        self.weight = 1.0
+
+    def _step(self, x: float) -> float:
+        self.value, self.weight = _ewm_step(self.value, self.weight, self.alpha, x)
+        return self.value
+
+
+class RSIState(IncrementalIndicator):
+    """RSI (matches rsi()). update(close) → rsi (NaN on first bar / zero loss)."""
+
+    _STATE = ('prev_close', 'avg_gain', 'avg_loss', 'weight')
+
+    def __init__(self, length: int = 14):
+        super().__init__()
+        self.alpha = 1.0 / length  # Wilder smoothing: ewm(com=length-1)
+        self.prev_close = NaN
+        self.avg_gain = NaN
+        self.avg_loss = NaN
+        self.weight = 1.0
+
+    def _step(self, close: float) -> float:
+        delta = close - self.prev_close
+        self.prev_close = close
+
+        # Gain and loss are NaN on the same bars, so they share one weight
+        gain, loss = (NaN, NaN) if math.isnan(delta) else (max(delta, 0.0), max(-delta, 0.0))
+        self.avg_gain, _ = _ewm_step(self.avg_gain, self.weight, self.alpha, gain)
+        self.avg_loss, self.weight = _ewm_step(self.avg_loss, self.weight, self.alpha, loss)
+
+        if math.isnan(self.avg_loss) or self.avg_loss == 0:
+            return NaN
+        rs = self.avg_gain / self.avg_loss
+        return 100 - (100 / (1 + rs))
+
+
+class MACDState(IncrementalIndicator):
+    """MACD (matches macd()). update(close) → (macd, signal, histogram)."""
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal_len: int = 9):
+        super().__init__()
+        self.fast = EMAState(fast)
+        self.slow = EMAState(slow)
+        self.signal = EMAState(signal_len)
+
+    def _step(self, close: float) -> Tuple[float, float, float]:
+        macd_line = self.fast._step(close) - self.slow._step(close)
+        signal_line = self.signal._step(macd_line)
+        return macd_line, signal_line, macd_line - signal_line
+
+    def _save(self):
+        return (self.fast._save(), self.slow._save(), self.signal._save(), self.count)
+
+    def _restore(self, saved) -> None:
+        fast, slow, signal, self.count = saved
+        self.fast._restore(fast)
+        self.slow._restore(slow)
+        self.signal._restore(signal)
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Volatility
+# ─────────────────────────────────────────────────────────────────────
+
+class ATRState(IncrementalIndicator):
+    """ATR (matches atr()). update(high, low, close) → atr."""
+
+    _STATE = ('prev_close', 'value', 'weight')
+
+    def __init__(self, length: int = 14):
+        super().__init__()
+        self.alpha = 1.0 / length
+        self.prev_close = NaN
+        self.value = NaN
+        self.weight = 1.0
+
+    def _step(self, high: float, low: float, close: float) -> float:
+        tr = high - low
+        if not math.isnan(self.prev_close):
+            # NaN high/low keeps tr NaN (max() returns its NaN first argument)
+            tr = max(tr, abs(high - self.prev_close), abs(low - self.prev_close))
+        self.prev_close = close
+
+        self.value, self.weight = _ewm_step(self.value, self.weight, self.alpha, tr)
+        return self.value
+
+
+class RollingStatsState(IncrementalIndicator):
+    """
+    Rolling mean and sample std over the last `window` values
+    (matches rolling_mean_std()).
+    
+    update(x) → (mean, std), NaN until `window` values. Welford's update
+    with a remove step for the value leaving the window: O(1) per bar and
+    no running sum of squares to lose precision at high prices.
+    
+    NaN values are counted but left out of the running mean/m2, so the
+    output is NaN while one is in the window and recovers once it leaves.
+    """
+    
+    _STATE = ('mean', 'm2', 'nans')
+    
+    def __init__(self, window: int):
+        super().__init__()
+        self.window_len = window
+        self.window = deque()
+        self.mean = 0.0
+        self.m2 = 0.0  # Sum of squared deviations from the mean
+        self.nans = 0  # NaN values in the window
+        self._evicted: Optional[float] = None
+    
+    def _step(self, x: float) -> Tuple[float, float]:
+        self.window.append(x)
+        self._evicted = None
+        if len(self.window) > self.window_len:
+            self._evicted = self.window.popleft()
+        
+        add = not math.isnan(x)
+        remove = self._evicted is not None and not math.isnan(self._evicted)
+        if not add:
+            self.nans += 1
+        if self._evicted is not None and not remove:
+            self.nans -= 1
+        
+        n = len(self.window) - self.nans  # Values in mean/m2 after this bar
+        old = self._evicted
+        if add and remove:
+            # Replace the oldest value by x in one update
+            new_mean = self.mean + (x - old) / n
+            self.m2 += (x - old) * (x - new_mean + old - self.mean)
+            self.mean = new_mean
+        elif add:
+            delta = x - self.mean
+            self.mean += delta / n
+            self.m2 += delta * (x - self.mean)
+        elif remove and n == 0:
+            self.mean = self.m2 = 0.0
+        elif remove:
+            delta = old - self.mean
+            self.mean -= delta / n
+            self.m2 -= delta * (old - self.mean)
+        
+        if len(self.window) < self.window_len or self.nans:
+            return NaN, NaN
+        return self.mean, math.sqrt(max(0.0, self.m2 / (self.window_len - 1)))
+    
+    def _save(self):
+        return (self.mean, self.m2, self.nans, self._evicted, self.count)
+    
+    def _restore(self, saved) -> None:
+        # Undo the last append: drop the newest value, put back the evicted one
+        self.window.pop()
+        if self._evicted is not None:
+            self.window.appendleft(self._evicted)
+        self.mean, self.m2, self.nans, self._evicted, self.count = saved
+
+
+class SMAState(RollingStatsState):
+    """SMA (matches sma(), e.g. a volume average). update(x) → mean."""
+    
+    def _step(self, x: float) -> float:
+        return super()._step(x)[0]
+
+
+class BollingerState(RollingStatsState):
+    """
+    Bollinger Bands (matches bollinger_bands()).
+    
+    update(close) → (upper, middle, lower), NaN until `period` bars.
+    """
+    
+    def __init__(self, period: int = 20, std_dev: float = 2.0):
+        super().__init__(period)
+        self.period = period
+        self.std_dev = std_dev
+    
+    def _step(self, close: float) -> Tuple[float, float, float]:
+        middle, std = super()._step(close)
+        return middle + std * self.std_dev, middle, middle - std * self.std_dev
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Volume
+# ─────────────────────────────────────────────────────────────────────
+
+class VWAPState(IncrementalIndicator):
+    """
+    Session-anchored VWAP (matches session_vwap()).
+    
+    update(timestamp, high, low, close, volume) → vwap. The running sums
+    reset on the first bar at or after the next session open, so a live
+    tick costs O(1) instead of re-summing the history.
+    """
+    
+    _STATE = ('cum_pv', 'cum_v', 'session_end')
+    
+    def __init__(self, tz: str = 'UTC', session_open: Tuple[int, int] = (0, 0)):
+        super().__init__()
+        self.tz = tz
+        self.session_open = session_open
+        self.cum_pv = 0.0
+        self.cum_v = 0.0
+        self.session_end: Optional[int] = None  # ns epoch of the next session open
+    
+    def _next_open(self, ts) -> int:
+        """Epoch ns of the first session open after the session containing ts."""
+        import pandas as pd
+        
+        ts = pd.Timestamp(ts)
+        ts = ts.tz_localize('UTC') if ts.tz is None else ts
+        # Work in local wall-clock time so DST changes keep the open time
+        local = ts.tz_convert(self.tz).tz_localize(None)
+        hour, minute = self.session_open
+        opened = local.normalize() + pd.Timedelta(hours=hour, minutes=minute)
+        if opened > local:
+            opened -= pd.Timedelta(days=1)
+        nxt = (opened + pd.Timedelta(days=1)).tz_localize(
+            self.tz, ambiguous=False, nonexistent='shift_forward')
+        return nxt.value
+    
+    def _step(self, ts, high: float, low: float, close: float, volume: float) -> float:
+        ts_ns = _epoch_ns(ts)
+        if self.session_end is None or ts_ns >= self.session_end:
+            self.cum_pv = self.cum_v = 0.0
+            self.session_end = self._next_open(ts)
+        
+        tp = (high + low + close) / 3.0
+        if math.isnan(tp) or math.isnan(volume):
+            return NaN
+        self.cum_pv += tp * volume
+        self.cum_v += volume
+        return self.cum_pv / self.cum_v if self.cum_v > 0 else NaN
+
+
+def _epoch_ns(ts) -> int:
+    """Epoch nanoseconds of a Timestamp / datetime64 / epoch-seconds number."""
+    if isinstance(ts, (int, float)):
+        return int(ts * 1_000_000_000)
+    import pandas as pd
+    
+    ts = pd.Timestamp(ts)
+    return (ts.tz_localize('UTC') if ts.tz is None else ts).value
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Trend
+# ─────────────────────────────────────────────────────────────────────
+
+class SupertrendState(IncrementalIndicator):
+    """
+    Supertrend direction (matches supertrend()).
+
+    update(high, low, close) → -1 bullish / +1 bearish
+    """
+
+    _STATE = ('upper', 'lower', 'direction', 'prev_close')
+
+    def __init__(self, factor: float = 3.0, atr_len: int = 10):
+        super().__init__()
+        self.factor = factor
+        self.atr = ATRState(atr_len)
+        self.upper = NaN
+        self.lower = NaN
+        self.direction = NaN
+        self.prev_close = NaN
+
+    def _step(self, high: float, low: float, close: float) -> float:
+        atr_val = self.atr._step(high, low, close)
+        hl2 = (high + low) / 2.0
+        raw_upper = hl2 + self.factor * atr_val
+        raw_lower = hl2 - self.factor * atr_val
+
+        if math.isnan(self.direction):
+            # First bar: start bearish until proven otherwise
+            self.upper, self.lower, self.direction = raw_upper, raw_lower, 1.0
+        else:
+            # Lower band (support) only tightens upward, upper only downward
+            if raw_lower > self.lower or self.prev_close < self.lower:
+                self.lower = raw_lower
+            if raw_upper < self.upper or self.prev_close > self.upper:
+                self.upper = raw_upper
+
+            if self.direction == 1:
+                self.direction = -1.0 if close > self.upper else 1.0
+            else:
+                self.direction = 1.0 if close < self.lower else -1.0
+
+        self.prev_close = close
+        return self.direction
+
+    def _save(self):
+        return (self.upper, self.lower, self.direction, self.prev_close,
+                self.atr.prev_close, self.atr.value, self.count)
+
+    def _restore(self, saved) -> None:
+        (self.upper, self.lower, self.direction, self.prev_close,
+         self.atr.prev_close, self.atr.value, self.count) = saved
@@ -0,0 +1,173 @@
+"""
+backend/domain/indicators/panel.py - Multi-symbol (panel) indicators
+
+Indicators over 2-D arrays shaped (bars × symbols), computed along axis 0
+for every symbol at once. The recursive smoothers (EMA, Wilder) run as a
+single pandas call over the whole 2-D block, rolling windows through the
+prefix-sum kernels in rolling.py and the element-wise parts as plain
+NumPy, so a watchlist scan over 200
+symbols is a handful of large array operations instead of 200 per-symbol
+pipelines.
+
+Each column matches the single-series function in this package applied
+to that symbol's bars (rolling windows to within floating-point rounding).
+
+Usage:
+    panel = PricePanel.from_frames({'AAPL': df_aapl, 'MSFT': df_msft})
+    cols = panel_indicators(panel)           # {'ema_9': (bars × symbols), ...}
+    rsi_now = cols['rsi_14'][-1]             # latest RSI per symbol
+"""
+from dataclasses import dataclass
+from typing import Dict, List, Mapping, Tuple
+
+import numpy as np
+import pandas as pd
+
+from backend.domain.indicators.rolling import rolling_mean, rolling_mean_std
+
+
+@dataclass
+class PricePanel:
+    """
+    OHLCV for several symbols on a shared time axis.
+
+    Attributes:
+        symbols: Column order of every array
+        index: Shared bar timestamps (axis 0)
+        open, high, low, close, volume: float64 arrays (bars × symbols)
+    """
+
+    symbols: List[str]
+    index: pd.Index
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+    volume: np.ndarray
+
+    @classmethod
+    def from_frames(cls, frames: Mapping[str, pd.DataFrame], join: str = 'inner') -> "PricePanel":
+        """
+        Align per-symbol OHLCV frames into a panel.
+
+        Args:
+            frames: symbol → DataFrame with Open, High, Low, Close, Volume
+            join: 'inner' keeps bars every symbol has (exact per-symbol
+                  results); 'outer' keeps all bars with NaN gaps
+
+        Returns:
+            PricePanel
+        """
+        symbols = list(frames)
+        if not symbols:
+            raise ValueError("No frames given")
+
+        index = None
+        for df in frames.values():
+            if index is None:
+                index = df.index
+            elif join == 'inner':
+                index = index.intersection(df.index)
+            else:
+                index = index.union(df.index)
+
+        def field(name: str) -> np.ndarray:
+            return np.column_stack([
+                frames[s][name].reindex(index).to_numpy(dtype=float) for s in symbols
+            ])
+
+        return cls(symbols, index, field('Open'), field('High'), field('Low'),
+                   field('Close'), field('Volume'))
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def to_frame(self, values: np.ndarray) -> pd.DataFrame:
+        """Wrap a (bars × symbols) result with this panel's index and symbols."""
+        return pd.DataFrame(values, index=self.index, columns=self.symbols)
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Panel Indicators (arrays are bars × symbols)
+# ─────────────────────────────────────────────────────────────────────
+
+def _ewm(values: np.ndarray, **kwargs) -> np.ndarray:
+    """ewm(adjust=False).mean() down axis 0 for all columns in one call."""
+    return pd.DataFrame(values).ewm(adjust=False, **kwargs).mean().to_numpy()
+
+
+def _prev(values: np.ndarray) -> np.ndarray:
+    """Values shifted down one bar (first row NaN)."""
+    out = np.empty_like(values)
+    out[:1] = np.nan
+    out[1:] = values[:-1]
+    return out
+
+
+def panel_ema(values: np.ndarray, length: int) -> np.ndarray:
+    """EMA per column (matches ema())."""
+    return _ewm(values, span=length)
+
+
+def panel_sma(values: np.ndarray, length: int) -> np.ndarray:
+    """SMA per column (matches sma())."""
+    return rolling_mean(values, length)
+
+
+def panel_rsi(close: np.ndarray, length: int = 14) -> np.ndarray:
+    """RSI per column (matches rsi())."""
+    delta = close - _prev(close)
+    gain = np.where(delta > 0, delta, 0.0)
+    loss = np.where(delta < 0, -delta, 0.0)
+    # NaN deltas stay NaN, like Series.clip()
+    nan = np.isnan(delta)
+    gain[nan] = np.nan
+    loss[nan] = np.nan
+    avg_gain = _ewm(gain, com=length - 1)
+    avg_loss = _ewm(loss, com=length - 1)
+    avg_loss = np.where(avg_loss == 0, np.nan, avg_loss)
+    return 100 - (100 / (1 + avg_gain / avg_loss))
+
+
+def panel_atr(high: np.ndarray, low: np.ndarray, close: np.ndarray,
+              length: int = 14) -> np.ndarray:
+    """ATR per column (matches atr())."""
+    prev_close = _prev(close)
+    # fmax ignores NaN like DataFrame.max(axis=1): first bar's TR is H-L
+    tr = np.fmax(high - low, np.fmax(np.abs(high - prev_close), np.abs(low - prev_close)))
+    return _ewm(tr, com=length - 1)
+
+
+def panel_macd(close: np.ndarray, fast: int = 12, slow: int = 26, signal_len: int = 9) \
+        -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """MACD per column (matches macd()): (macd_line, signal_line, histogram)."""
+    macd_line = panel_ema(close, fast) - panel_ema(close, slow)
+    signal_line = panel_ema(macd_line, signal_len)
+    return macd_line, signal_line, macd_line - signal_line
+
+
+def panel_bollinger(close: np.ndarray, period: int = 20, std_dev: float = 2.0) \
+        -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Bollinger Bands per column (matches bollinger_bands()): (upper, middle, lower)."""
+    middle, std = rolling_mean_std(close, period)
+    return middle + std * std_dev, middle, middle - std * std_dev
+
+
+def panel_indicators(panel: PricePanel) -> Dict[str, np.ndarray]:
+    """
+    Standard indicator set for every symbol in the panel.
+
+    Args:
+        panel: Aligned OHLCV panel
+
+    Returns:
+        Column name (as in apply_all_indicators) → (bars × symbols) array.
+        Warmup rows are NaN; nothing is dropped.
+    """
+    close = panel.close
+    out = {f'ema_{n}': panel_ema(close, n) for n in (9, 21, 50, 200)}
+    out['rsi_14'] = panel_rsi(close, 14)
+    out['macd'], out['macd_signal'], out['macd_hist'] = panel_macd(close, 12, 26, 9)
+    out['atr_14'] = panel_atr(panel.high, panel.low, close, 14)
+    out['bb_upper'], out['bb_middle'], out['bb_lower'] = panel_bollinger(close, 20, 2.0)
+    return out
@@ -0,0 +1,173 @@
+"""
+backend/domain/indicators/plan.py - Lazy, dependency-aware indicator plan
+
+Every indicator column apply_all_indicators() can add is a node with the
+columns it reads. plan_indicators() resolves a requested column set to
+the nodes that produce it (plus their dependencies) in dependency order,
+so a chart load for one strategy computes only what that strategy and
+the chart need, each node exactly once.
+
+Each node also declares its warmup (leading NaN bars: 19 for BB(20),
+1 for RSI), so callers can keep every row and start reading at
+warmup_bars() instead of dropping history.
+
+Usage:
+    steps = plan_indicators(['crossover_9_21', 'rsi_14'])
+    # → ema_9, ema_21, rsi_14, crossover/crossunder_9_21 nodes
+    df = apply_indicators(df, ['crossover_9_21', 'rsi_14'])
+"""
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+import hashlib
+
+import pandas as pd
+
+OHLCV_COLUMNS = ('Open', 'High', 'Low', 'Close', 'Volume')
+
+
+@dataclass(frozen=True)
+class IndicatorNode:
+    """
+    One step of the indicator pipeline.
+
+    Attributes:
+        outputs: Columns this node writes
+        inputs: Columns it reads (OHLCV or other nodes' outputs)
+        compute: fn(columns) → one Series per output, in outputs order;
+                 columns maps name → Series (a DataFrame works too)
+        warmup: Leading bars its outputs are NaN for
+        params: Parameter values (part of plan_signature())
+    """
+
+    outputs: Tuple[str, ...]
+    inputs: Tuple[str, ...]
+    compute: Callable[[pd.DataFrame], Tuple[pd.Series, ...]]
+    warmup: int = 0
+    params: Tuple[Tuple[str, Any], ...] = ()
+
+
+def _default_nodes() -> List[IndicatorNode]:
+    """Nodes for the columns apply_all_indicators() adds."""
+    # Imported lazily: this module is imported by the package __init__
+    from backend.domain.indicators import (
+        ema, rsi, macd, atr, bollinger_bands, supertrend, crossover, crossunder,
+    )
+
+    def ema_node(length: int) -> IndicatorNode:
+        return IndicatorNode((f'ema_{length}',), ('Close',),
+                             lambda df: (ema(df['Close'], length),),
+                             params=(('length', length),))
+
+    return [
+        ema_node(9),
+        ema_node(21),
+        ema_node(50),
+        ema_node(200),
+        IndicatorNode(('rsi_14',), ('Close',),
+                      lambda df: (rsi(df['Close'], 14),), warmup=1,
+                      params=(('length', 14),)),
+        IndicatorNode(('macd', 'macd_signal', 'macd_hist'), ('Close',),
+                      lambda df: macd(df['Close'], 12, 26, 9),
+                      params=(('fast', 12), ('slow', 26), ('signal_len', 9))),
+        IndicatorNode(('atr_14',), ('High', 'Low', 'Close'),
+                      lambda df: (atr(df['High'], df['Low'], df['Close'], 14),),
+                      params=(('length', 14),)),
+        IndicatorNode(('bb_upper', 'bb_middle', 'bb_lower'), ('Close',),
+                      lambda df: bollinger_bands(df['Close'], 20, 2.0), warmup=19,
+                      params=(('period', 20), ('std_dev', 2.0))),
+        IndicatorNode(('supertrend',), ('High', 'Low', 'Close'),
+                      lambda df: (supertrend(df['High'], df['Low'], df['Close'], 3.0, 10),),
+                      params=(('factor', 3.0), ('atr_len', 10))),
+        IndicatorNode(('crossover_9_21', 'crossunder_9_21'), ('ema_9', 'ema_21'),
+                      lambda df: (crossover(df['ema_9'], df['ema_21']),
+                                  crossunder(df['ema_9'], df['ema_21']))),
+    ]
+
+
+_NODES: Optional[Dict[str, IndicatorNode]] = None
+_SIGNATURE: Optional[str] = None
+
+
+def _nodes_by_output() -> Dict[str, IndicatorNode]:
+    global _NODES
+    if _NODES is None:
+        _NODES = {out: node for node in _default_nodes() for out in node.outputs}
+    return _NODES
+
+
+def plan_signature() -> str:
+    """
+    Short hash of every node's outputs, inputs, params and warmup.
+
+    Part of indicator cache keys, so cached frames computed with other
+    parameters are never reused.
+    """
+    global _SIGNATURE
+    if _SIGNATURE is None:
+        nodes = dict.fromkeys(_nodes_by_output().values())
+        spec = repr([(n.outputs, n.inputs, n.params, n.warmup) for n in nodes])
+        _SIGNATURE = hashlib.sha1(spec.encode()).hexdigest()[:12]
+    return _SIGNATURE
+
+
+def all_indicator_columns() -> List[str]:
+    """Every column the plan can produce, in pipeline order."""
+    return list(_nodes_by_output().keys())
+
+
+def warmup_bars(columns: Optional[Iterable[str]] = None) -> int:
+    """
+    Leading bars a plan leaves undefined (NaN).
+
+    With columns=None it is the warmup of the full pipeline, which
+    apply_indicators(dropna=True) trims for every plan so a dropped frame
+    starts at the same bar whichever columns were requested. That is also
+    the valid_from row compute_indicators() reports.
+
+    Args:
+        columns: Requested columns (None = all)
+
+    Returns:
+        Largest warmup among the nodes the plan runs
+    """
+    nodes = _nodes_by_output().values() if columns is None else plan_indicators(columns)
+    return max((node.warmup for node in nodes), default=0)
+
+
+def plan_indicators(columns: Iterable[str],
+                    available: Iterable[str] = ()) -> List[IndicatorNode]:
+    """
+    Resolve requested columns to the nodes that must run.
+
+    Args:
+        columns: Wanted columns (OHLCV names are accepted and ignored)
+        available: Columns already computed; nodes producing only these
+                   are skipped (used to extend a cached frame)
+
+    Returns:
+        Nodes in dependency order, each listed once
+
+    Raises:
+        ValueError: If a column is neither OHLCV nor produced by any node
+    """
+    nodes = _nodes_by_output()
+    available = set(available)
+    ordered: List[IndicatorNode] = []
+    seen = set()
+
+    def visit(column: str) -> None:
+        if column in OHLCV_COLUMNS or column in available:
+            return
+        node = nodes.get(column)
+        if node is None:
+            raise ValueError(f"Unknown indicator column: {column}")
+        if id(node) in seen:
+            return
+        seen.add(id(node))
+        for dep in node.inputs:
+            visit(dep)
+        ordered.append(node)
+
+    for column in columns:
+        visit(column)
+    return ordered
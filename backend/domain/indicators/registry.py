@@ -0,0 +1,173 @@
+"""
+backend/domain/indicators/registry.py - Parameterized indicator registry
+
+Indicators are registered by name with their default parameters. A call
+get_indicator(df, name, **params) is memoized per frame under the key
+(name, params with defaults filled in), so strategies that need a variant
+not in the standard columns (Supertrend(2,7), VWAP, a volume SMA) share
+one computation per frame instead of copying the DataFrame to add a
+column.
+
+The cache is held per frame object and released when the frame is
+garbage collected. Frames are treated as read-only once indicators have
+been requested from them (the data service already shares them between
+requests).
+
+Usage:
+    st = get_indicator(df, 'supertrend', factor=2.0, atr_len=7)
+    upper, middle, lower = get_indicator(df, 'bollinger')
+    vol_ma = get_indicator(df, 'sma', source='Volume', length=20)
+    vwap = get_indicator(df, 'session_vwap', tz='America/New_York', session_open=(9, 30))
+"""
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Tuple
+import threading
+import weakref
+
+import pandas as pd
+
+
+@dataclass(frozen=True)
+class IndicatorSpec:
+    """
+    A registered indicator.
+
+    Attributes:
+        name: Registry name
+        compute: fn(df, **params) → Series or tuple of Series
+        defaults: Parameter names and default values
+    """
+
+    name: str
+    compute: Callable[..., Any]
+    defaults: Tuple[Tuple[str, Any], ...]
+
+
+_SPECS: Dict[str, IndicatorSpec] = {}
+_defaults_loaded = False
+
+_lock = threading.Lock()
+_frame_caches: Dict[int, Dict[Hashable, Any]] = {}
+_stats = {'hits': 0, 'misses': 0}
+
+
+def register_indicator(name: str, compute: Callable[..., Any], **defaults) -> None:
+    """
+    Register (or replace) an indicator.
+
+    Args:
+        name: Registry name
+        compute: fn(df, **params) returning a Series or tuple of Series
+        **defaults: Every accepted parameter with its default value
+    """
+    _SPECS[name] = IndicatorSpec(name, compute, tuple(defaults.items()))
+
+
+def _load_defaults() -> None:
+    """Register the package's indicators (lazily: avoids a circular import)."""
+    global _defaults_loaded
+    if _defaults_loaded:
+        return
+    from backend.domain.indicators import (
+        ema, sma, rsi, macd, atr, bollinger_bands, supertrend, vwap, session_vwap,
+    )
+
+    defaults = {
+        'ema': (lambda df, source, length: ema(df[source], length),
+                dict(source='Close', length=21)),
+        'sma': (lambda df, source, length: sma(df[source], length),
+                dict(source='Close', length=20)),
+        'rsi': (lambda df, length: rsi(df['Close'], length),
+                dict(length=14)),
+        'macd': (lambda df, fast, slow, signal_len: macd(df['Close'], fast, slow, signal_len),
+                 dict(fast=12, slow=26, signal_len=9)),
+        'atr': (lambda df, length: atr(df['High'], df['Low'], df['Close'], length),
+                dict(length=14)),
+        'bollinger': (lambda df, period, std_dev: bollinger_bands(df['Close'], period, std_dev),
+                      dict(period=20, std_dev=2.0)),
+        'supertrend': (lambda df, factor, atr_len:
+                       supertrend(df['High'], df['Low'], df['Close'], factor, atr_len),
+                       dict(factor=3.0, atr_len=10)),
+        'vwap': (lambda df: vwap(df['High'], df['Low'], df['Close'], df['Volume']),
+                 dict()),
+        'session_vwap': (lambda df, tz, session_open:
+                         session_vwap(df['High'], df['Low'], df['Close'], df['Volume'],
+                                      tz, session_open),
+                         dict(tz='UTC', session_open=(0, 0))),
+    }
+    for name, (compute, params) in defaults.items():
+        # Explicit register_indicator() calls made earlier take precedence
+        if name not in _SPECS:
+            register_indicator(name, compute, **params)
+    _defaults_loaded = True
+
+
+def _spec(name: str) -> IndicatorSpec:
+    _load_defaults()
+    spec = _SPECS.get(name)
+    if spec is None:
+        raise ValueError(f"Unknown indicator: {name}")
+    return spec
+
+
+def indicator_key(name: str, **params) -> Tuple[str, Tuple[Tuple[str, Any], ...]]:
+    """
+    Canonical cache key: (name, every parameter with defaults filled in).
+
+    get_indicator(df, 'supertrend') and
+    get_indicator(df, 'supertrend', factor=3.0, atr_len=10) share a key.
+
+    Raises:
+        ValueError: For an unknown indicator or parameter
+    """
+    spec = _spec(name)
+    accepted = dict(spec.defaults)
+    unknown = set(params) - set(accepted)
+    if unknown:
+        raise ValueError(f"Unknown parameter(s) for {name}: {', '.join(sorted(unknown))}")
+    return name, tuple((k, params.get(k, default)) for k, default in spec.defaults)
+
+
+def get_indicator(df: pd.DataFrame, name: str, **params) -> Any:
+    """
+    Compute an indicator on df, memoized per frame.
+
+    Args:
+        df: OHLCV frame (not modified)
+        name: Registered indicator name
+        **params: Indicator parameters (missing ones use the defaults)
+
+    Returns:
+        Series (or tuple of Series) aligned with df; shared, read-only
+    """
+    key = indicator_key(name, **params)
+    frame_id = id(df)
+
+    with _lock:
+        cache = _frame_caches.get(frame_id)
+        if cache is not None and key in cache:
+            _stats['hits'] += 1
+            return cache[key]
+        _stats['misses'] += 1
+
+    result = _SPECS[name].compute(df, **dict(key[1]))
+
+    with _lock:
+        cache = _frame_caches.get(frame_id)
+        if cache is None:
+            cache = _frame_caches[frame_id] = {}
+            # Drop the cache when the frame goes away (before its id is reused)
+            weakref.finalize(df, _frame_caches.pop, frame_id, None)
+        cache[key] = result
+    return result
+
+
+def frame_cache_stats() -> dict:
+    """Memoization counters for monitoring."""
+    with _lock:
+        return {
+            'frames': len(_frame_caches),
+            'entries': sum(len(c) for c in _frame_caches.values()),
+            'hits': _stats['hits'],
+            'misses': _stats['misses'],
+        }
@@ -0,0 +1,101 @@
+"""
+backend/domain/indicators/rolling.py - Rolling mean / std kernels
+
+Window sums from prefix sums, so a rolling mean and standard deviation
+cost O(n) regardless of the window length, and both come out of one
+pass over the data. Works on 1-D series and on 2-D (bars × columns)
+arrays along axis 0, so close and volume (or a whole panel) can share
+one call.
+
+Prefix sums are taken per block of bars, over values centered on the
+block mean: the running totals stay small, so the window sums don't
+lose precision on long histories or high-priced symbols.
+
+A window containing NaN yields NaN (like rolling(window) in pandas).
+
+Incremental (O(1) per bar) counterparts: RollingStatsState, SMAState
+and BollingerState in incremental.py.
+"""
+from typing import Tuple
+
+import numpy as np
+
+# Bars per prefix-sum block (bounds the magnitude of the running totals)
+_BLOCK = 4096
+
+
+def _segment_sums(seg: np.ndarray, window: int) -> np.ndarray:
+    """Trailing window sums over seg (rows window-1 onward), via one prefix sum."""
+    cs = np.zeros((seg.shape[0] + 1,) + seg.shape[1:])
+    np.cumsum(seg, axis=0, out=cs[1:])
+    return cs[window:] - cs[:-window]
+
+
+def _blocks(n: int, window: int):
+    """(start, stop) output ranges; each reads values[start - window + 1:stop]."""
+    return ((start, min(n, start + _BLOCK)) for start in range(window - 1, n, _BLOCK))
+
+
+def _nan_windows(nan: np.ndarray, window: int) -> np.ndarray:
+    """True where the trailing window contains a NaN."""
+    bad = np.zeros(nan.shape, dtype=bool)
+    counts = nan.astype(float)
+    for start, stop in _blocks(nan.shape[0], window):
+        bad[start:stop] = _segment_sums(counts[start - window + 1:stop], window) > 0
+    return bad
+
+
+def rolling_mean_std(values, window: int, ddof: int = 1) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Rolling mean and standard deviation in one pass.
+    
+    Args:
+        values: 1-D or 2-D (bars × columns) array-like
+        window: Window length (bars)
+        ddof: Delta degrees of freedom for std (1 = sample, like pandas)
+    
+    Returns:
+        Tuple of (mean, std) arrays shaped like values
+    """
+    x = np.asarray(values, dtype=float)
+    nan = np.isnan(x)
+    has_nan = bool(nan.any())
+    mean = np.full(x.shape, np.nan)
+    var = np.full(x.shape, np.nan)
+    
+    for start, stop in _blocks(x.shape[0], window):
+        seg = x[start - window + 1:stop]
+        if has_nan:
+            center = np.nan_to_num(np.nanmean(seg, axis=0))
+            dev = np.nan_to_num(seg - center)
+        else:
+            center = seg.mean(axis=0)
+            dev = seg - center
+        s1 = _segment_sums(dev, window)
+        s2 = _segment_sums(dev * dev, window)
+        m = s1 / window
+        mean[start:stop] = m + center
+        var[start:stop] = np.maximum((s2 - s1 * m) / (window - ddof), 0.0)
+    
+    std = np.sqrt(var)
+    if has_nan:
+        bad = _nan_windows(nan, window)
+        mean[bad] = np.nan
+        std[bad] = np.nan
+    return mean, std
+
+
+def rolling_mean(values, window: int) -> np.ndarray:
+    """Rolling mean (O(n)); see rolling_mean_std()."""
+    x = np.asarray(values, dtype=float)
+    nan = np.isnan(x)
+    has_nan = bool(nan.any())
+    mean = np.full(x.shape, np.nan)
+    
+    for start, stop in _blocks(x.shape[0], window):
+        seg = x[start - window + 1:stop]
+        mean[start:stop] = _segment_sums(np.nan_to_num(seg) if has_nan else seg, window) / window
+    
+    if has_nan:
+        mean[_nan_windows(nan, window)] = np.nan
+    return mean
@@ -6,9 +6,10 @@ Uses Template Method Pattern:
 - BaseStrategy handles common logic (signal building, confidence calculation)
 """
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional, Tuple, Union
 import pandas as pd
-from backend.core.signal import Signal
+import numpy as np
+from backend.core.signal import Signal, SignalBatch
 from backend.config.settings import IndicatorParams
 
 
@@ -21,7 +22,10 @@ class BaseStrategy(ABC):
         - description: Strategy description
         - signals_per_day_range: "1-3" format
         - best_for_timeframes: "5m, 15m" format
-        - generate_signals(df, ts_fn): Return list of signals
+        - generate_signals(df, ts_fn): Return signals (SignalBatch or list)
+    
+    Subclasses should declare:
+        - required_columns: OHLCV + indicator columns they read
     
     The run() method orchestrates the signal generation pipeline.
     """
@@ -34,11 +38,20 @@ class BaseStrategy(ABC):
     style: str = "General"
     color: str = "#888888"
     
+    # Columns generate_signals reads; the data layer computes only these
+    # indicators (plus their dependencies). None = all indicators.
+    required_columns: Optional[Tuple[str, ...]] = None
+    
+    # Bars after the first valid indicator row before a signal can fire
+    # (1 = needs the previous bar)
+    lookback_bars: int = 1
+    
     def __init__(self):
         """Initialize strategy."""
         pass
     
-    def run(self, df: pd.DataFrame, ts_fn, symbol: str = "") -> List[Signal]:
+    def run(self, df: pd.DataFrame, ts_fn, symbol: str = "",
+            valid_from: int = 0) -> SignalBatch:
         """
         Run the strategy on OHLCV data.
         
@@ -48,18 +61,31 @@ class BaseStrategy(ABC):
             df: OHLCV DataFrame with indicators pre-calculated
             ts_fn: Timestamp formatting function
             symbol: Trading symbol
+            valid_from: First row with all indicators defined (see
+                        compute_indicators); earlier rows are warmup
         
         Returns:
-            List of Signal objects
+            SignalBatch (iterates as Signal objects)
         """
         if df is None or df.empty:
-            return []
+            return SignalBatch.empty(symbol)
         
         # Call subclass implementation
-        return self.generate_signals(df, ts_fn, symbol)
+        signals = self.generate_signals(df, ts_fn, symbol)
+        if not isinstance(signals, SignalBatch):
+            signals = SignalBatch.from_signals(signals, symbol)
+        
+        # No signals on warmup bars (or before the strategy's lookback)
+        if valid_from > 0:
+            first = valid_from + self.lookback_bars
+            if first >= len(df):
+                return SignalBatch.empty(symbol, signals.strategy)
+            signals = signals.since(ts_fn(df.index[first]))
+        return signals
     
     @abstractmethod
-    def generate_signals(self, df: pd.DataFrame, ts_fn, symbol: str) -> List[Signal]:
+    def generate_signals(self, df: pd.DataFrame, ts_fn,
+                         symbol: str) -> Union[SignalBatch, List[Signal]]:
         """
         Generate signals from OHLCV data.
         
@@ -71,7 +97,7 @@ class BaseStrategy(ABC):
             symbol: Trading symbol
         
         Returns:
-            List of Signal objects
+            SignalBatch, or a list of Signal objects
         """
         pass
     
@@ -134,6 +160,82 @@ class BaseStrategy(ABC):
             time=int(ts_fn(df.index[i])),
         )
     
+    @staticmethod
+    def _build_signals(df: pd.DataFrame, idx: np.ndarray, is_buy: np.ndarray,
+                       atr_values: np.ndarray, rsi_values: np.ndarray,
+                       ts_fn, strategy_key: str, symbol: str = "") -> SignalBatch:
+        """
+        Build many signals at once (vectorized _build_signal).
+        
+        Close, confidence, SL and TP are computed for all hits in one
+        NumPy pass and stored column-wise; no per-signal objects are
+        created. Same formulas as _build_signal.
+        
+        Args:
+            df: DataFrame with Close
+            idx: Bar positions of the hits (ascending)
+            is_buy: Boolean per hit (True = BUY, False = SELL)
+            atr_values: ATR column (full length, indexed by idx)
+            rsi_values: RSI column (full length, indexed by idx)
+            ts_fn: Timestamp formatter (used when df has no DatetimeIndex)
+            strategy_key: Strategy identifier
+            symbol: Trading symbol (optional)
+        
+        Returns:
+            SignalBatch in bar order
+        """
+        idx = np.asarray(idx, dtype=np.intp)
+        if idx.size == 0:
+            return SignalBatch.empty(symbol, strategy_key)
+        
+        is_buy = np.asarray(is_buy, dtype=bool)
+        close = df['Close'].to_numpy(dtype=float)[idx]
+        atr_hit = np.asarray(atr_values, dtype=float)[idx]
+        rsi_hit = np.asarray(rsi_values, dtype=float)[idx]
+        
+        # Confidence: RSI distance from neutral in the signal direction
+        dist = np.maximum(0.0, np.where(is_buy, rsi_hit - 50.0, 50.0 - rsi_hit))
+        confidence = np.round(np.minimum(95.0, 50.0 + dist * 1.8), 1)
+        
+        # Stop Loss & Take Profit based on ATR (mirrored for SELL)
+        direction = np.where(is_buy, 1.0, -1.0)
+        sl = np.round(close - direction * atr_hit, 4)
+        tp = np.round(close + direction * atr_hit * 2.0, 4)
+        
+        # Timestamps in one pass (.values is UTC for tz-aware and naive
+        # indexes alike); ts_fn only for other index types
+        hit_index = df.index[idx]
+        if isinstance(hit_index, pd.DatetimeIndex):
+            times = hit_index.values.astype('datetime64[s]').astype(np.int64)
+        else:
+            times = [int(ts_fn(t)) for t in hit_index]
+        
+        return SignalBatch(
+            symbol=symbol,
+            strategy=strategy_key,
+            is_buy=is_buy,
+            price=np.round(close, 4),
+            sl=sl,
+            tp=tp,
+            rsi=np.round(rsi_hit, 2),
+            atr=np.round(atr_hit, 4),
+            confidence=confidence,
+            time=times,
+        )
+    
+    @classmethod
+    def _signals_from_masks(cls, df: pd.DataFrame, buy: np.ndarray, sell: np.ndarray,
+                            atr_values: np.ndarray, rsi_values: np.ndarray,
+                            ts_fn, strategy_key: str, symbol: str = "") -> SignalBatch:
+        """
+        Build signals for every bar where the BUY or SELL mask is set.
+        
+        BUY wins if both masks are set on the same bar.
+        """
+        idx = np.flatnonzero(buy | sell)
+        return cls._build_signals(df, idx, buy[idx], atr_values, rsi_values,
+                                  ts_fn, strategy_key, symbol)
+    
     @staticmethod
     def _rsi_distance_from_neutral(rsi: float) -> float:
         """
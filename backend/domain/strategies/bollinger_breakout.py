@@ -4,10 +4,11 @@ backend/domain/strategies/bollinger_breakout.py - Bollinger Breakout Strategy
 Price breaks Bollinger Band + RSI + volume confirmation
 Best for: Momentum breakouts (4-6 signals per day)
 """
-from typing import List
 import pandas as pd
+import numpy as np
 from backend.domain.strategies.base import BaseStrategy
-from backend.core.signal import Signal
+from backend.core.signal import SignalBatch
+from backend.domain.indicators import get_indicator
 
 
 class BollingerBreakoutStrategy(BaseStrategy):
@@ -27,65 +28,51 @@ class BollingerBreakoutStrategy(BaseStrategy):
     best_for_timeframes = "5m, 15m"
     style = "Breakout"
     color = "#f0b429"
+    required_columns = ('Close', 'Volume', 'rsi_14', 'atr_14', 'bb_upper', 'bb_lower')
+    lookback_bars = 20
     
-    def generate_signals(self, df: pd.DataFrame, ts_fn, symbol: str = "") -> List[Signal]:
+    def generate_signals(self, df: pd.DataFrame, ts_fn, symbol: str = "") -> SignalBatch:
         """
         Generate signals using Bollinger Breakout logic.
         
         Expects df to have columns: Close, High, Low, Volume, rsi_14, atr_14
         """
         if df is None or df.empty or len(df) < 20:
-            return []
+            return SignalBatch.empty(symbol)
         
         # Ensure required columns exist
         required = ['Close', 'Volume', 'rsi_14', 'atr_14']
         for col in required:
             if col not in df.columns:
-                return []
+                return SignalBatch.empty(symbol)
         
-        # Calculate Bollinger Bands if not present
-        if 'bb_upper' not in df.columns or 'bb_lower' not in df.columns:
-            df = df.copy()
-            sma = df['Close'].rolling(20).mean()
-            std = df['Close'].rolling(20).std()
-            df['bb_upper'] = sma + 2 * std
-            df['bb_lower'] = sma - 2 * std
+        # Use BB columns if present, else the memoized BB(20, 2)
+        if 'bb_upper' in df.columns and 'bb_lower' in df.columns:
+            bb_upper, bb_lower = df['bb_upper'], df['bb_lower']
+        else:
+            bb_upper, _, bb_lower = get_indicator(df, 'bollinger', period=20, std_dev=2.0)
         
-        signals = []
-        c = df['Close']
-        r = df['rsi_14']
-        a = df['atr_14']
-        v = df['Volume']
-        vm = v.rolling(20).mean()
+        c = df['Close'].to_numpy(dtype=float)
+        r = df['rsi_14'].to_numpy(dtype=float)
+        a = df['atr_14'].to_numpy(dtype=float)
+        v = df['Volume'].to_numpy(dtype=float)
+        vm = get_indicator(df, 'sma', source='Volume', length=20).to_numpy(dtype=float)
+        upper = bb_upper.to_numpy(dtype=float)
+        lower = bb_lower.to_numpy(dtype=float)
         
         # Previous values for crossover detection
-        c_prev = c.shift(1)
-        up_prev = df['bb_upper'].shift(1)
-        lo_prev = df['bb_lower'].shift(1)
+        c_prev = np.roll(c, 1)
+        up_prev = np.roll(upper, 1)
+        lo_prev = np.roll(lower, 1)
+        
+        vol_ok = v > vm * 1.3
+        
+        # BUY: break above upper BB / SELL: break below lower BB
+        buy = (c_prev <= up_prev) & (c > upper) & (r > 55) & vol_ok
+        sell = (c_prev >= lo_prev) & (c < lower) & (r < 45) & vol_ok & ~buy
         
         # Scan from bar 20 onward (need 20 bars for BB)
-        for i in range(20, len(df)):
-            price = float(c.iloc[i])
-            rsi_val = float(r.iloc[i])
-            atr_val = float(a.iloc[i])
-            vol_ok = float(v.iloc[i]) > float(vm.iloc[i]) * 1.3
-            
-            # BUY signal: break above upper BB
-            if (float(c_prev.iloc[i]) <= float(up_prev.iloc[i]) and
-                price > float(df['bb_upper'].iloc[i]) and
-                rsi_val > 55 and vol_ok):
-                
-                sig = self._build_signal(df, i, 'BUY', atr_val, rsi_val,
-                                       ts_fn, 'bollinger_breakout', symbol)
-                signals.append(sig)
-            
-            # SELL signal: break below lower BB
-            elif (float(c_prev.iloc[i]) >= float(lo_prev.iloc[i]) and
-                  price < float(df['bb_lower'].iloc[i]) and
-                  rsi_val < 45 and vol_ok):
-                
-                sig = self._build_signal(df, i, 'SELL', atr_val, rsi_val,
-                                       ts_fn, 'bollinger_breakout', symbol)
-                signals.append(sig)
+        buy[:20] = sell[:20] = False
         
-        return signals
+        return self._signals_from_masks(df, buy, sell, a, r, ts_fn,
+                                        'bollinger_breakout', symbol)
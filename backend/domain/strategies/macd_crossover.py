@@ -4,10 +4,11 @@ backend/domain/strategies/macd_crossover.py - MACD Crossover Strategy
 MACD/Signal cross + histogram confirm + RSI filter
 Best for: Trend trading (4-6 signals per day)
 """
-from typing import List
 import pandas as pd
+import numpy as np
 from backend.domain.strategies.base import BaseStrategy
-from backend.core.signal import Signal
+from backend.core.signal import SignalBatch
+from backend.domain.indicators import get_indicator
 
 
 class MACDCrossoverStrategy(BaseStrategy):
@@ -27,8 +28,9 @@ class MACDCrossoverStrategy(BaseStrategy):
     best_for_timeframes = "15m, 1H"
     style = "Trend"
     color = "#fb7185"
+    required_columns = ('Close', 'rsi_14', 'atr_14', 'macd', 'macd_signal', 'macd_hist')
     
-    def generate_signals(self, df: pd.DataFrame, ts_fn, symbol: str = "") -> List[Signal]:
+    def generate_signals(self, df: pd.DataFrame, ts_fn, symbol: str = "") -> SignalBatch:
         """
         Generate signals using MACD Crossover logic.
         
@@ -36,62 +38,36 @@ class MACDCrossoverStrategy(BaseStrategy):
         MACD, signal, and histogram will be calculated if not present
         """
         if df is None or df.empty or len(df) < 26:
-            return []
+            return SignalBatch.empty(symbol)
         
         # Ensure required columns exist
         required = ['Close', 'rsi_14', 'atr_14']
         for col in required:
             if col not in df.columns:
-                return []
+                return SignalBatch.empty(symbol)
         
-        # Calculate MACD if not present
-        if 'macd' not in df.columns or 'macd_signal' not in df.columns or 'macd_hist' not in df.columns:
-            from backend.domain.indicators import ema
-            df = df.copy()
-            c = df['Close']
-            macd_line = ema(c, 12) - ema(c, 26)
-            macd_signal = ema(macd_line, 9)
-            df['macd'] = macd_line
-            df['macd_signal'] = macd_signal
-            df['macd_hist'] = macd_line - macd_signal
+        # Use MACD columns if present, else the memoized MACD(12,26,9)
+        if 'macd' in df.columns and 'macd_signal' in df.columns and 'macd_hist' in df.columns:
+            macd_line, macd_signal, macd_hist = df['macd'], df['macd_signal'], df['macd_hist']
+        else:
+            macd_line, macd_signal, macd_hist = get_indicator(df, 'macd')
         
-        signals = []
-        c = df['Close']
-        r = df['rsi_14']
-        a = df['atr_14']
-        macd = df['macd']
-        sig = df['macd_signal']
-        hist = df['macd_hist']
+        r = df['rsi_14'].to_numpy(dtype=float)
+        a = df['atr_14'].to_numpy(dtype=float)
+        macd = macd_line.to_numpy(dtype=float)
+        sig = macd_signal.to_numpy(dtype=float)
+        hist = macd_hist.to_numpy(dtype=float)
         
         # Previous values for crossover detection
-        macd_prev = macd.shift(1)
-        sig_prev = sig.shift(1)
+        macd_prev = np.roll(macd, 1)
+        sig_prev = np.roll(sig, 1)
+        
+        # BUY: MACD crosses above Signal / SELL: MACD crosses below Signal
+        buy = (macd_prev <= sig_prev) & (macd > sig) & (hist > 0) & (r > 50)
+        sell = (macd_prev >= sig_prev) & (macd < sig) & (hist < 0) & (r < 50) & ~buy
         
         # Scan from bar 1 onward
-        for i in range(1, len(df)):
-            price = float(c.iloc[i])
-            rsi_val = float(r.iloc[i])
-            atr_val = float(a.iloc[i])
-            macd_val = float(macd.iloc[i])
-            sig_val = float(sig.iloc[i])
-            hist_val = float(hist.iloc[i])
-            macd_prev_val = float(macd_prev.iloc[i])
-            sig_prev_val = float(sig_prev.iloc[i])
-            
-            # BUY signal: MACD crosses above Signal
-            if (macd_prev_val <= sig_prev_val and macd_val > sig_val and
-                hist_val > 0 and rsi_val > 50):
-                
-                sig_obj = self._build_signal(df, i, 'BUY', atr_val, rsi_val,
-                                           ts_fn, 'macd_crossover', symbol)
-                signals.append(sig_obj)
-            
-            # SELL signal: MACD crosses below Signal
-            elif (macd_prev_val >= sig_prev_val and macd_val < sig_val and
-                  hist_val < 0 and rsi_val < 50):
-                
-                sig_obj = self._build_signal(df, i, 'SELL', atr_val, rsi_val,
-                                           ts_fn, 'macd_crossover', symbol)
-                signals.append(sig_obj)
+        buy[0] = sell[0] = False
         
-        return signals
+        return self._signals_from_masks(df, buy, sell, a, r, ts_fn,
+                                        'macd_crossover', symbol)
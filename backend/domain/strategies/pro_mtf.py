@@ -4,10 +4,9 @@ backend/domain/strategies/pro_mtf.py - Pro MTF Strategy
 EMA 9/21 crossover + RSI 50 + EMA 200 trend + Supertrend confirm
 Best for: 1D, 1W swings (1-3 signals per day)
 """
-from typing import List
 import pandas as pd
 from backend.domain.strategies.base import BaseStrategy
-from backend.core.signal import Signal
+from backend.core.signal import SignalBatch
 
 
 class ProMTFStrategy(BaseStrategy):
@@ -28,58 +27,42 @@ class ProMTFStrategy(BaseStrategy):
     best_for_timeframes = "1D, 1W"
     style = "Swing"
     color = "#3b82f6"
+    required_columns = ('Close', 'ema_200', 'rsi_14', 'atr_14', 'supertrend',
+                        'crossover_9_21', 'crossunder_9_21')
     
-    def generate_signals(self, df: pd.DataFrame, ts_fn, symbol: str = "") -> List[Signal]:
+    def generate_signals(self, df: pd.DataFrame, ts_fn, symbol: str = "") -> SignalBatch:
         """
         Generate signals using Pro MTF logic.
         
         Expects df to have columns: Close, ema_9, ema_21, ema_200, rsi_14, atr_14, supertrend
         """
         if df is None or df.empty or len(df) < 2:
-            return []
+            return SignalBatch.empty(symbol)
         
         # Ensure required columns exist
         required = ['Close', 'ema_9', 'ema_21', 'ema_200', 'rsi_14', 'atr_14', 
                     'crossover_9_21', 'crossunder_9_21', 'supertrend']
         for col in required:
             if col not in df.columns:
-                return []
+                return SignalBatch.empty(symbol)
         
-        signals = []
-        c = df['Close']
-        e9 = df['ema_9']
-        e21 = df['ema_21']
-        e200 = df['ema_200']
-        r = df['rsi_14']
-        a = df['atr_14']
-        st = df['supertrend']
-        cu = df['crossover_9_21']
-        cd = df['crossunder_9_21']
+        c = df['Close'].to_numpy(dtype=float)
+        e200 = df['ema_200'].to_numpy(dtype=float)
+        r = df['rsi_14'].to_numpy(dtype=float)
+        a = df['atr_14'].to_numpy(dtype=float)
+        st = df['supertrend'].to_numpy(dtype=float)
+        cu = df['crossover_9_21'].to_numpy(dtype=bool)
+        cd = df['crossunder_9_21'].to_numpy(dtype=bool)
+        
+        # BUY: EMA 9 crosses above EMA 21, RSI above neutral,
+        # price above EMA 200, Supertrend bullish
+        buy = cu & (r > 50) & (c > e200) & (st < 0)
+        # SELL: EMA 9 crosses below EMA 21, RSI below neutral,
+        # price below EMA 200, Supertrend bearish
+        sell = cd & (r < 50) & (c < e200) & (st > 0) & ~buy
         
         # Scan from bar 1 onward
-        for i in range(1, len(df)):
-            price = float(c.iloc[i])
-            rsi_val = float(r.iloc[i])
-            atr_val = float(a.iloc[i])
-            
-            # BUY signal
-            if (cu.iloc[i] and                  # EMA 9 crosses above EMA 21
-                rsi_val > 50 and                # RSI above neutral
-                price > float(e200.iloc[i]) and # Price above EMA 200
-                float(st.iloc[i]) < 0):         # Supertrend bullish
-                
-                sig = self._build_signal(df, i, 'BUY', atr_val, rsi_val,
-                                       ts_fn, 'pro_mtf', symbol)
-                signals.append(sig)
-            
-            # SELL signal
-            elif (cd.iloc[i] and                 # EMA 9 crosses below EMA 21
-                  rsi_val < 50 and               # RSI below neutral
-                  price < float(e200.iloc[i]) and # Price below EMA 200
-                  float(st.iloc[i]) > 0):         # Supertrend bearish
-                
-                sig = self._build_signal(df, i, 'SELL', atr_val, rsi_val,
-                                       ts_fn, 'pro_mtf', symbol)
-                signals.append(sig)
+        buy[0] = sell[0] = False
         
-        return signals
+        return self._signals_from_masks(df, buy, sell, a, r, ts_fn,
+                                        'pro_mtf', symbol)
@@ -4,10 +4,10 @@ backend/domain/strategies/rsi_reversal.py - RSI Reversal Strategy
 RSI exits oversold/overbought + EMA 50 trend filter
 Best for: Intraday mean reversion (3-6 signals per day)
 """
-from typing import List
 import pandas as pd
 from backend.domain.strategies.base import BaseStrategy
-from backend.core.signal import Signal
+from backend.core.signal import SignalBatch
+from backend.domain.indicators import get_indicator
 
 
 class RSIReversalStrategy(BaseStrategy):
@@ -27,57 +27,45 @@ class RSIReversalStrategy(BaseStrategy):
     best_for_timeframes = "5m, 15m"
     style = "Mean Reversion"
     color = "#a78bfa"
+    required_columns = ('Close', 'rsi_14', 'atr_14', 'ema_50')
     
-    def generate_signals(self, df: pd.DataFrame, ts_fn, symbol: str = "") -> List[Signal]:
+    def generate_signals(self, df: pd.DataFrame, ts_fn, symbol: str = "") -> SignalBatch:
         """
         Generate signals using RSI Reversal logic.
         
         Expects df to have columns: Close, rsi_14, atr_14, and optionally ema_50
         """
         if df is None or df.empty or len(df) < 2:
-            return []
+            return SignalBatch.empty(symbol)
         
         # Ensure required columns exist
         required = ['Close', 'rsi_14', 'atr_14']
         for col in required:
             if col not in df.columns:
-                return []
+                return SignalBatch.empty(symbol)
         
-        # Add EMA 50 if not present
-        if 'ema_50' not in df.columns:
-            from backend.domain.indicators import ema
-            df = df.copy()
-            df['ema_50'] = ema(df['Close'], 50)
+        # EMA 50 column if present, else memoized per frame
+        if 'ema_50' in df.columns:
+            ema_50 = df['ema_50']
+        else:
+            ema_50 = get_indicator(df, 'ema', length=50)
         
-        signals = []
-        c = df['Close']
-        r = df['rsi_14']
-        a = df['atr_14']
-        e50 = df['ema_50']
-        r_prev = r.shift(1).fillna(50)
+        c = df['Close'].to_numpy(dtype=float)
+        r = df['rsi_14'].to_numpy(dtype=float)
+        a = df['atr_14'].to_numpy(dtype=float)
+        e50 = ema_50.to_numpy(dtype=float)
+        r_prev = df['rsi_14'].shift(1).fillna(50).to_numpy(dtype=float)
         
         # RSI crosses 30 upward (exit oversold → BUY)
         cross30_up = (r_prev < 30) & (r >= 30)
         # RSI crosses 70 downward (exit overbought → SELL)
         cross70_down = (r_prev > 70) & (r <= 70)
         
+        buy = cross30_up & (c > e50)
+        sell = cross70_down & (c < e50) & ~buy
+        
         # Scan from bar 1 onward
-        for i in range(1, len(df)):
-            price = float(c.iloc[i])
-            rsi_val = float(r.iloc[i])
-            atr_val = float(a.iloc[i])
-            e50_val = float(e50.iloc[i])
-            
-            # BUY signal
-            if cross30_up.iloc[i] and price > e50_val:
-                sig = self._build_signal(df, i, 'BUY', atr_val, rsi_val,
-                                       ts_fn, 'rsi_reversal', symbol)
-                signals.append(sig)
-            
-            # SELL signal
-            elif cross70_down.iloc[i] and price < e50_val:
-                sig = self._build_signal(df, i, 'SELL', atr_val, rsi_val,
-                                       ts_fn, 'rsi_reversal', symbol)
-                signals.append(sig)
+        buy[0] = sell[0] = False
         
-        return signals
+        return self._signals_from_masks(df, buy, sell, a, r, ts_fn,
+                                        'rsi_reversal', symbol)
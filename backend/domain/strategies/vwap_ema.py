@@ -4,11 +4,12 @@ backend/domain/strategies/vwap_ema.py - VWAP + EMA Strategy
 Price vs VWAP crossover + EMA 9/21 direction + RSI momentum
 Best for: Intraday (4-6 signals per day)
 """
-from typing import List
 import pandas as pd
 import numpy as np
 from backend.domain.strategies.base import BaseStrategy
-from backend.core.signal import Signal
+from backend.core.signal import SignalBatch
+from backend.config.settings import MarketHours
+from backend.domain.indicators import get_indicator, is_intraday
 
 
 class VWAPEMAStrategy(BaseStrategy):
@@ -19,6 +20,10 @@ class VWAPEMAStrategy(BaseStrategy):
     - BUY: Price crosses above VWAP AND EMA 9 > EMA 21 AND RSI > 50
     - SELL: Price crosses below VWAP AND EMA 9 < EMA 21 AND RSI < 50
     
+    On intraday bars VWAP resets at each session open of the symbol's
+    market (UTC midnight for crypto/futures); on daily+ bars it is
+    cumulative.
+    
     Generates 4-6 signals per day on intraday timeframes.
     """
     
@@ -28,60 +33,52 @@ class VWAPEMAStrategy(BaseStrategy):
     best_for_timeframes = "5m, 15m"
     style = "Intraday"
     color = "#00d084"
+    required_columns = ('High', 'Low', 'Close', 'Volume', 'ema_9', 'ema_21',
+                        'rsi_14', 'atr_14')
     
-    def generate_signals(self, df: pd.DataFrame, ts_fn, symbol: str = "") -> List[Signal]:
+    def generate_signals(self, df: pd.DataFrame, ts_fn, symbol: str = "") -> SignalBatch:
         """
         Generate signals using VWAP + EMA logic.
         
         Expects df to have columns: Close, Volume, ema_9, ema_21, rsi_14, atr_14
         """
         if df is None or df.empty or len(df) < 2:
-            return []
+            return SignalBatch.empty(symbol)
         
-        # Calculate VWAP
+        # VWAP (memoized per frame)
         try:
-            tp = (df['High'] + df['Low'] + df['Close']) / 3
-            vwap = (tp * df['Volume']).cumsum() / df['Volume'].replace(0, np.nan).cumsum()
+            if is_intraday(df.index):
+                tz, session_open = MarketHours.session_open(symbol)
+                vwap = get_indicator(df, 'session_vwap', tz=tz, session_open=session_open)
+            else:
+                vwap = get_indicator(df, 'vwap')
         except Exception:
-            return []
+            return SignalBatch.empty(symbol)
         
         # Ensure required columns exist
         required = ['Close', 'ema_9', 'ema_21', 'rsi_14', 'atr_14']
         for col in required:
             if col not in df.columns:
-                return []
+                return SignalBatch.empty(symbol)
         
-        signals = []
-        c = df['Close']
-        e9 = df['ema_9']
-        e21 = df['ema_21']
-        r = df['rsi_14']
-        a = df['atr_14']
+        c = df['Close'].to_numpy(dtype=float)
+        e9 = df['ema_9'].to_numpy(dtype=float)
+        e21 = df['ema_21'].to_numpy(dtype=float)
+        r = df['rsi_14'].to_numpy(dtype=float)
+        a = df['atr_14'].to_numpy(dtype=float)
+        vw = vwap.to_numpy(dtype=float)
         
         # VWAP crossovers
-        c_prev = c.shift(1)
-        vwap_prev = vwap.shift(1)
-        cv_up = (c_prev <= vwap_prev) & (c > vwap)
-        cv_dn = (c_prev >= vwap_prev) & (c < vwap)
+        c_prev = np.roll(c, 1)
+        vwap_prev = np.roll(vw, 1)
+        cv_up = (c_prev <= vwap_prev) & (c > vw)
+        cv_dn = (c_prev >= vwap_prev) & (c < vw)
+        
+        buy = cv_up & (e9 > e21) & (r > 50)
+        sell = cv_dn & (e9 < e21) & (r < 50) & ~buy
         
-        # Scan from bar 1 onward
-        for i in range(1, len(df)):
-            price = float(c.iloc[i])
-            rsi_val = float(r.iloc[i])
-            atr_val = float(a.iloc[i])
-            e9_val = float(e9.iloc[i])
-            e21_val = float(e21.iloc[i])
-            
-            # BUY signal
-            if cv_up.iloc[i] and e9_val > e21_val and rsi_val > 50:
-                sig = self._build_signal(df, i, 'BUY', atr_val, rsi_val,
-                                       ts_fn, 'vwap_ema', symbol)
-                signals.append(sig)
-            
-            # SELL signal
-            elif cv_dn.iloc[i] and e9_val < e21_val and rsi_val < 50:
-                sig = self._build_signal(df, i, 'SELL', atr_val, rsi_val,
-                                       ts_fn, 'vwap_ema', symbol)
-                signals.append(sig)
+        # Scan from bar 1 onward (bar 0 has no previous bar)
+        buy[0] = sell[0] = False
         
-        return signals
+        return self._signals_from_masks(df, buy, sell, a, r, ts_fn,
+                                        'vwap_ema', symbol)
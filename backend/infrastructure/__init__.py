@@ -0,0 +1 @@
+# backend/infrastructure/__init__.py
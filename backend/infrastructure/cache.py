@@ -0,0 +1,148 @@
+"""
+backend/infrastructure/cache.py - In-process candle cache
+
+Keeps downloaded OHLCV frames in memory so repeated chart loads and
+strategy switches on the same symbol don't hit the network again.
+
+Features:
+    - Keyed by (symbol, interval, period)
+    - TTL expiry (Settings.CANDLE_CACHE_TTL); expired frames are kept
+      as stale entries so providers can refresh only the missing tail
+    - LRU eviction bounded by total bytes (Settings.CANDLE_CACHE_MAX_BYTES)
+    - Hit / miss / eviction counters
+"""
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, Tuple
+import threading
+import time
+
+import pandas as pd
+
+from backend.config.settings import Settings
+
+
+CacheKey = Tuple[str, str, str]  # (symbol, interval, period)
+
+
+@dataclass
+class CacheEntry:
+    """A cached frame with its bookkeeping."""
+
+    frame: pd.DataFrame
+    stored_at: float  # time.monotonic() when stored
+    nbytes: int
+
+
+class CandleCache:
+    """
+    TTL + LRU cache for OHLCV DataFrames, bounded by total bytes.
+
+    Thread-safe: FastAPI runs sync endpoints in a thread pool, so every
+    access goes through a lock.
+
+    Cached frames are shared between callers and must be treated as
+    read-only (apply_indicators builds a new frame, it never writes to them).
+    """
+
+    def __init__(self, ttl: float = Settings.CANDLE_CACHE_TTL,
+                 max_bytes: int = Settings.CANDLE_CACHE_MAX_BYTES):
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[CacheKey, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def make_key(symbol: str, interval: str, period: str) -> CacheKey:
+        """Normalize a cache key (symbols are case-insensitive)."""
+        return (symbol.upper(), interval, period)
+
+    def get(self, key: CacheKey) -> Optional[pd.DataFrame]:
+        """
+        Get a fresh frame for key.
+
+        Returns:
+            Cached DataFrame, or None if missing or expired
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+
+            if time.monotonic() - entry.stored_at > self.ttl:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry.frame
+
+    def get_stale(self, key: CacheKey) -> Optional[pd.DataFrame]:
+        """
+        Get the frame for key regardless of age (no counters touched).
+
+        Used to refresh an expired entry incrementally instead of
+        re-downloading the whole window.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry.frame if entry is not None else None
+
+    def set(self, key: CacheKey, frame: pd.DataFrame) -> None:
+        """
+        Store a frame, evicting least recently used entries if over budget.
+
+        Frames larger than the whole budget are not cached.
+        """
+        nbytes = int(frame.memory_usage(index=True, deep=False).sum())
+        if nbytes > self.max_bytes:
+            return
+
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+
+            self._entries[key] = CacheEntry(frame, time.monotonic(), nbytes)
+            self._total_bytes += nbytes
+
+            while self._total_bytes > self.max_bytes and self._entries:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def invalidate(self, key: Optional[CacheKey] = None) -> None:
+        """Drop one entry, or everything if key is None."""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+                self._total_bytes = 0
+            elif key in self._entries:
+                self._remove(key)
+
+    def stats(self) -> dict:
+        """Counters and size for monitoring."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'bytes': self._total_bytes,
+                'max_bytes': self.max_bytes,
+                'ttl': self.ttl,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': round(self.hits / lookups, 3) if lookups else 0.0,
+            }
+
+    def _remove(self, key: CacheKey) -> None:
+        """Remove an entry (caller holds the lock)."""
+        entry = self._entries.pop(key)
+        self._total_bytes -= entry.nbytes
+
+    def __len__(self) -> int:
+        return len(self._entries)
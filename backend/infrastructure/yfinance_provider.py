@@ -0,0 +1,194 @@
+"""
+backend/infrastructure/yfinance_provider.py - yfinance OHLCV data provider
+
+Fetches candles via yf.download, with an optional CandleCache in front.
+When a cached frame expires only the bars since its last timestamp are
+downloaded and merged in, so refresh cost scales with new bars rather
+than with history length.
+"""
+from typing import Optional
+import re
+
+import pandas as pd
+
+from backend.config.settings import DataPeriodMap
+from backend.infrastructure.cache import CandleCache
+
+
+class YFinanceProvider:
+    """
+    OHLCV provider backed by yfinance.
+
+    Usage:
+        provider = YFinanceProvider(CandleCache())
+        df = provider.fetch_candles('BTC-USD', '5m')
+    """
+
+    def __init__(self, cache: Optional[CandleCache] = None):
+        self.cache = cache
+        self.full_fetches = 0
+        self.tail_fetches = 0
+
+    @staticmethod
+    def period_for(interval: str) -> str:
+        """History length to request for an interval (enough for EMA 200)."""
+        return DataPeriodMap.get(interval, "60d")
+
+    def fetch_candles(self, symbol: str, interval: str,
+                      period: Optional[str] = None) -> Optional[pd.DataFrame]:
+        """
+        Get OHLCV candles, served from cache when fresh.
+
+        Args:
+            symbol: Trading symbol (e.g., BTC-USD, AAPL)
+            interval: Timeframe (5m, 15m, 1h, 1d, 1wk)
+            period: History length (defaults to DataPeriodMap)
+
+        Returns:
+            DataFrame with Open, High, Low, Close, Volume columns,
+            or None if no data was returned
+        """
+        period = period or self.period_for(interval)
+
+        key = None
+        if self.cache is not None:
+            key = CandleCache.make_key(symbol, interval, period)
+            cached = self.cache.get(key)
+            if cached is not None:
+                return cached
+
+            stale = self.cache.get_stale(key)
+            if stale is not None:
+                df = self._refresh_tail(symbol, interval, period, stale)
+                if df is not None:
+                    self.cache.set(key, df)
+                    return df
+                # Tail fetch failed: fall back to a full download below
+
+        return self._full_fetch(symbol, interval, period, key)
+
+    def fetch_latest(self, symbol: str, interval: str,
+                     period: Optional[str] = None) -> Optional[pd.DataFrame]:
+        """
+        Get candles with the forming bar refreshed now, ignoring the TTL.
+
+        Used by the live tick engine: when a frame is cached (fresh or
+        stale) only its tail is re-downloaded and merged, so a poll costs
+        one small request however long the history is.
+
+        Args:
+            symbol: Trading symbol
+            interval: Timeframe
+            period: History length (defaults to DataPeriodMap)
+
+        Returns:
+            DataFrame with Open, High, Low, Close, Volume columns,
+            or None if no data was returned
+        """
+        period = period or self.period_for(interval)
+        if self.cache is None:
+            return self.fetch_candles(symbol, interval, period)
+
+        key = CandleCache.make_key(symbol, interval, period)
+        cached = self.cache.get_stale(key)
+        if cached is None:
+            return self.fetch_candles(symbol, interval, period)
+
+        df = self._refresh_tail(symbol, interval, period, cached)
+        if df is None:
+            return self._full_fetch(symbol, interval, period, key)
+        self.cache.set(key, df)
+        return df
+
+    def stats(self) -> dict:
+        """Fetch counters for monitoring."""
+        return {
+            'full_fetches': self.full_fetches,
+            'tail_fetches': self.tail_fetches,
+        }
+
+    def _full_fetch(self, symbol: str, interval: str, period: str,
+                    key: Optional[tuple]) -> Optional[pd.DataFrame]:
+        """
+        Download the whole period and cache it.
+
+        If the download fails, an existing (stale) cached frame is returned
+        as is but not stored again, so it stays expired and the next call
+        retries.
+        """
+        df = self._download(symbol, interval, period=period)
+        self.full_fetches += 1
+        if df is None or df.empty:
+            if key is not None:
+                return self.cache.get_stale(key)
+            return None
+
+        if key is not None:
+            self.cache.set(key, df)
+        return df
+
+    def _refresh_tail(self, symbol: str, interval: str, period: str,
+                      stale: pd.DataFrame) -> Optional[pd.DataFrame]:
+        """
+        Download bars from the cached last timestamp onward and merge them.
+
+        The cached last bar is re-downloaded too, because it may still have
+        been forming when it was cached; the fresh copy replaces it. The
+        merged frame is trimmed back to the period window.
+
+        Since start is inclusive, a working fetch always returns at least
+        that last bar. An empty result means the fetch failed (e.g. the
+        gap is longer than yfinance allows for intraday start=).
+
+        Args:
+            symbol: Trading symbol
+            interval: Timeframe
+            period: History length the frame represents
+            stale: Expired cached frame
+
+        Returns:
+            Merged frame, or None if the tail fetch failed
+        """
+        last_ts = stale.index[-1]
+        tail = self._download(symbol, interval, start=last_ts)
+        self.tail_fetches += 1
+        if tail is None or tail.empty:
+            return None
+
+        tail = tail[tail.index >= last_ts]
+        if tail.empty:
+            return None
+
+        head = stale[stale.index < tail.index[0]]
+        merged = pd.concat([head, tail[stale.columns]])
+        merged = merged[~merged.index.duplicated(keep='last')]
+
+        window = _period_to_timedelta(period)
+        if window is not None:
+            merged = merged[merged.index > merged.index[-1] - window]
+        return merged
+
+    @staticmethod
+    def _download(symbol: str, interval: str, **kwargs) -> Optional[pd.DataFrame]:
+        """Call yf.download and flatten MultiIndex columns."""
+        import yfinance as yf
+
+        df = yf.download(symbol, interval=interval, progress=False,
+                         auto_adjust=True, **kwargs)
+        if df is None or df.empty:
+            return None
+
+        # Flatten MultiIndex columns if yfinance returns them
+        if isinstance(df.columns, pd.MultiIndex):
+            df.columns = df.columns.get_level_values(0)
+        return df
+
+
+def _period_to_timedelta(period: str) -> Optional[pd.Timedelta]:
+    """Convert a yfinance period ('60d', '2y', '3mo') to a Timedelta."""
+    match = re.fullmatch(r'(\d+)(d|wk|mo|y)', period)
+    if not match:
+        return None
+    count, unit = int(match.group(1)), match.group(2)
+    days_per_unit = {'d': 1, 'wk': 7, 'mo': 30, 'y': 365}
+    return pd.Timedelta(days=count * days_per_unit[unit])
@@ -0,0 +1,389 @@
+"""
+backend/services/connection_manager.py - WebSocket connections and fan-out
+
+Tracks connected clients and their (symbol, interval) subscriptions, and
+delivers messages through a bounded outbound queue per client drained by
+that client's own writer task. Fan-out only enqueues, so one slow client
+never delays delivery to the others.
+
+Subscriptions are indexed both ways - topic → sockets and socket →
+topics - so subscribe/unsubscribe and disconnect cleanup are O(1) per
+topic and a tick or signal reaches only the sockets subscribed to it.
+
+Slow consumers (Settings.WS_SLOW_CLIENT_POLICY), applied to ticks:
+    - 'drop_oldest': a full queue drops its oldest queued tick
+    - 'coalesce': a tick replaces the still-queued tick for the same
+      topic (only the latest price per symbol is delivered); a full
+      queue then drops its oldest tick
+    - 'disconnect': a full queue closes the connection
+Other messages (signals, status, pong) are never dropped; a queue full
+of them closes the connection under every policy.
+
+Every message is serialized once, however many clients receive it
+(orjson when installed, else the json module), and the same text is
+queued for each recipient.
+
+Batched mode (per client, opt-in): ticks are held for a window and sent
+as one frame, {type: 'ticks', ticks: [tick, ...]}, with only the latest
+tick per topic. The frame is assembled from the already-encoded ticks.
+While the writer is busy, ticks keep coalescing into the next frame, so
+a batching client's queue never fills with ticks.
+"""
+from collections import deque
+from typing import Dict, Hashable, Optional, Set, Tuple
+import asyncio
+import json
+
+from fastapi import WebSocket
+
+from backend.config.settings import Settings
+
+
+Topic = Tuple[str, str]  # (symbol, interval)
+
+SLOW_CLIENT_POLICIES = ('drop_oldest', 'coalesce', 'disconnect')
+
+# Close code for connections dropped as slow consumers ("try again later")
+_SLOW_CLIENT_CLOSE_CODE = 1013
+
+# Optional: orjson is several times faster than json.dumps
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def encode_message(message: dict) -> str:
+    """Serialize a message to JSON text (compact, like WebSocket.send_json)."""
+    if orjson is not None:
+        return orjson.dumps(message).decode()
+    return json.dumps(message, separators=(',', ':'), ensure_ascii=False)
+
+
+class ClientQueue:
+    """
+    Bounded outbound queue of one connection.
+
+    Entries are [key, text] with the message already encoded; ticks carry
+    their topic as key (so they can be dropped or coalesced), other
+    messages carry None.
+    """
+
+    def __init__(self, websocket: WebSocket, maxsize: int, policy: str,
+                 batch_window: float = 0.0):
+        self.websocket = websocket
+        self.maxsize = maxsize
+        self.policy = policy
+        self.batch_window = batch_window
+        self._entries: deque = deque()
+        self._by_key: Dict[Hashable, list] = {}
+        # Batched mode: topic -> latest encoded tick, and when to send them
+        self._batch: Dict[Hashable, str] = {}
+        self._batch_due = 0.0
+        self._ready = asyncio.Event()
+        self.task: Optional[asyncio.Task] = None
+        self.sent = 0
+        self.dropped = 0
+        self.coalesced = 0
+        self.batched = 0
+        self.max_depth = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def put(self, text: str, key: Optional[Hashable] = None) -> bool:
+        """
+        Queue an encoded message.
+
+        Args:
+            text: Message JSON (shared by every recipient)
+            key: Topic for droppable ticks, None for everything else
+
+        Returns:
+            False if the client must be disconnected (queue overflow)
+        """
+        if key is not None and self.batch_window > 0:
+            if key in self._batch:
+                self.coalesced += 1
+            elif not self._batch:
+                self._batch_due = asyncio.get_running_loop().time() + self.batch_window
+            self._batch[key] = text
+            self._ready.set()
+            return True
+
+        if key is not None and self.policy == 'coalesce':
+            entry = self._by_key.get(key)
+            if entry is not None:
+                entry[1] = text
+                self.coalesced += 1
+                return True
+
+        if len(self._entries) >= self.maxsize:
+            if self.policy == 'disconnect' or not self._drop_oldest_tick():
+                return False
+
+        entry = [key, text]
+        self._entries.append(entry)
+        if key is not None:
+            self._by_key[key] = entry
+        self.max_depth = max(self.max_depth, len(self._entries))
+        self._ready.set()
+        return True
+
+    def _drop_oldest_tick(self) -> bool:
+        """Remove the oldest droppable entry; False if there is none."""
+        for entry in self._entries:
+            if entry[0] is not None:
+                self._entries.remove(entry)
+                self._forget(entry)
+                self.dropped += 1
+                return True
+        return False
+
+    def _forget(self, entry: list) -> None:
+        if self._by_key.get(entry[0]) is entry:
+            del self._by_key[entry[0]]
+
+    def set_batch_window(self, seconds: float) -> None:
+        """Switch batched mode on (seconds > 0) or off; pending ticks go out now."""
+        self.batch_window = seconds
+        if seconds <= 0 and self._batch:
+            self._batch_due = 0.0
+            self._ready.set()
+
+    def _take_batch(self) -> str:
+        """The pending ticks as one 'ticks' frame (built from their encoded text)."""
+        ticks = list(self._batch.values())
+        self._batch.clear()
+        self.batched += len(ticks)
+        return '{"type":"ticks","ticks":[' + ','.join(ticks) + ']}'
+
+    async def drain(self) -> None:
+        """Writer loop: send queued messages in order until cancelled or a send fails."""
+        while True:
+            if self._entries:
+                entry = self._entries.popleft()
+                self._forget(entry)
+                await self.websocket.send_text(entry[1])
+                self.sent += 1
+                continue
+
+            self._ready.clear()
+            if not self._batch:
+                await self._ready.wait()
+                continue
+
+            wait = self._batch_due - asyncio.get_running_loop().time()
+            if wait > 0:
+                # Wake early for non-tick messages; they don't wait for the batch
+                try:
+                    await asyncio.wait_for(self._ready.wait(), wait)
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            await self.websocket.send_text(self._take_batch())
+            self.sent += 1
+
+
+class ConnectionManager:
+    """
+    Tracks WebSocket connections, their subscriptions and outbound queues.
+
+    All methods run on the event loop (no locking needed).
+
+    Usage:
+        manager = ConnectionManager()
+        await manager.connect(websocket)
+        manager.subscribe(websocket, 'BTC-USD', '5m')
+        await manager.publish({('BTC-USD', '5m'): tick})
+    """
+
+    def __init__(self, queue_size: int = Settings.WS_SEND_QUEUE_SIZE,
+                 policy: str = Settings.WS_SLOW_CLIENT_POLICY,
+                 max_topics: int = Settings.WS_MAX_TOPICS_PER_CONNECTION):
+        if policy not in SLOW_CLIENT_POLICIES:
+            raise ValueError(f"Unknown slow client policy: {policy}")
+        self.queue_size = queue_size
+        self.policy = policy
+        self.max_topics = max_topics
+        self.active_connections: Set[WebSocket] = set()
+        # (symbol, interval) -> sockets subscribed to it
+        self.subscribers: Dict[Topic, Set[WebSocket]] = {}
+        # socket -> (symbol, interval) topics it is subscribed to
+        self.client_topics: Dict[WebSocket, Set[Topic]] = {}
+        self.queues: Dict[WebSocket, ClientQueue] = {}
+        # Totals of connections already gone (live ones are summed in stats())
+        self._closed_totals = {'sent': 0, 'dropped': 0, 'coalesced': 0, 'batched': 0}
+        self.slow_disconnects = 0
+
+    async def connect(self, websocket: WebSocket):
+        await websocket.accept()
+        self.active_connections.add(websocket)
+        self.client_topics[websocket] = set()
+        queue = ClientQueue(websocket, self.queue_size, self.policy)
+        queue.task = asyncio.create_task(self._write(queue))
+        self.queues[websocket] = queue
+        print(f"WebSocket connected. Total connections: {len(self.active_connections)}")
+
+    def disconnect(self, websocket: WebSocket):
+        if websocket not in self.active_connections:
+            return
+        self.active_connections.discard(websocket)
+        for topic in self.client_topics.pop(websocket, ()):
+            self._remove_subscriber(topic, websocket)
+
+        queue = self.queues.pop(websocket, None)
+        if queue is not None:
+            for name in self._closed_totals:
+                self._closed_totals[name] += getattr(queue, name)
+            if queue.task is not None and queue.task is not asyncio.current_task():
+                queue.task.cancel()
+        print(f"WebSocket disconnected. Total connections: {len(self.active_connections)}")
+
+    def subscribe(self, websocket: WebSocket, symbol: str, interval: str) -> bool:
+        """
+        Add (symbol, interval) to a connection's topics.
+
+        Returns:
+            False if the connection is closed (e.g. dropped as a slow
+            client while its messages were still being handled) or
+            already has max_topics other topics
+        """
+        topic = (symbol, interval)
+        topics = self.client_topics.get(websocket)
+        if topics is None:
+            return False
+        if topic not in topics and len(topics) >= self.max_topics:
+            return False
+        topics.add(topic)
+        self.subscribers.setdefault(topic, set()).add(websocket)
+        return True
+
+    def unsubscribe(self, websocket: WebSocket, symbol: Optional[str] = None,
+                    interval: Optional[str] = None):
+        """Remove one topic from a connection, or all of them if symbol is None"""
+        topics = self.client_topics.get(websocket)
+        if not topics:
+            return
+        if symbol is None:
+            removed = list(topics)
+            topics.clear()
+        else:
+            topic = (symbol, interval)
+            if topic not in topics:
+                return
+            topics.discard(topic)
+            removed = [topic]
+        for topic in removed:
+            self._remove_subscriber(topic, websocket)
+
+    def _remove_subscriber(self, topic: Topic, websocket: WebSocket):
+        sockets = self.subscribers.get(topic)
+        if sockets is None:
+            return
+        sockets.discard(websocket)
+        if not sockets:
+            del self.subscribers[topic]
+
+    def topics(self):
+        """Subscribed (symbol, interval) pairs, each once"""
+        return list(self.subscribers)
+
+    def set_batch_window(self, websocket: WebSocket, milliseconds: float):
+        """
+        Batch a connection's ticks into one 'ticks' frame per window.
+
+        Args:
+            websocket: Connection
+            milliseconds: Window length (0 = one frame per tick); clamped
+                          to Settings.WS_TICK_BATCH_MAX_MS
+        """
+        queue = self.queues.get(websocket)
+        if queue is None:
+            return
+        try:
+            window = min(max(float(milliseconds), 0.0), Settings.WS_TICK_BATCH_MAX_MS)
+        except (TypeError, ValueError):
+            return
+        queue.set_batch_window(window / 1000)
+
+    async def send(self, websocket: WebSocket, message: dict):
+        """Queue a message for one connection (replies like status and pong)"""
+        self._enqueue(websocket, encode_message(message))
+
+    async def send_to_topic(self, symbol: str, interval: str, message: dict):
+        """Queue a message (e.g. a signal) for the subscribers of one topic; never dropped"""
+        text = encode_message(message)
+        for connection in list(self.subscribers.get((symbol, interval), ())):
+            self._enqueue(connection, text)
+
+    async def publish(self, messages: dict):
+        """Queue each topic's tick for its subscribers ({topic: message})"""
+        for topic, message in messages.items():
+            connections = self.subscribers.get(topic)
+            if not connections:
+                continue
+            text = encode_message(message)
+            for connection in list(connections):
+                self._enqueue(connection, text, key=topic)
+
+    async def broadcast(self, message: dict):
+        """Queue a message for every connection (market status and the like)"""
+        text = encode_message(message)
+        for connection in list(self.active_connections):
+            self._enqueue(connection, text)
+
+    def _enqueue(self, websocket: WebSocket, text: str, key: Optional[Hashable] = None):
+        queue = self.queues.get(websocket)
+        if queue is None:
+            return
+        if not queue.put(text, key):
+            self.slow_disconnects += 1
+            print(f"WebSocket send queue full ({len(queue)}), disconnecting slow client")
+            self.disconnect(websocket)
+            asyncio.create_task(self._close(websocket))
+
+    async def _write(self, queue: ClientQueue):
+        """Writer task of one connection; a failed send disconnects it"""
+        try:
+            await queue.drain()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"Error sending message: {e}")
+            self.disconnect(queue.websocket)
+
+    @staticmethod
+    async def _close(websocket: WebSocket):
+        try:
+            await websocket.close(code=_SLOW_CLIENT_CLOSE_CODE)
+        except Exception:
+            pass
+
+    def stats(self) -> dict:
+        """Connection, subscription and send queue counters for monitoring"""
+        queues = list(self.queues.values())
+        depths = [len(q) for q in queues]
+
+        def total(name: str) -> int:
+            return self._closed_totals[name] + sum(getattr(q, name) for q in queues)
+
+        return {
+            "connections": len(self.active_connections),
+            "topics": len(self.subscribers),
+            "subscriptions": sum(len(t) for t in self.client_topics.values()),
+            "max_topics": self.max_topics,
+            "policy": self.policy,
+            "encoder": "orjson" if orjson is not None else "json",
+            "queue_size": self.queue_size,
+            "queue_depth_total": sum(depths),
+            "queue_depth_max": max(depths, default=0),
+            "queue_depth_peak": max((q.max_depth for q in queues), default=0),
+            "sent": total('sent'),
+            "dropped": total('dropped'),
+            "coalesced": total('coalesced'),
+            "batching_clients": sum(1 for q in queues if q.batch_window > 0),
+            "batched_ticks": total('batched'),
+            "slow_disconnects": self.slow_disconnects,
+        }
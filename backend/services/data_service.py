@@ -0,0 +1,93 @@
+"""
+backend/services/data_service.py - Candle fetching + indicator computation
+
+High-level data operation used by the chart endpoint: fetch OHLCV from the
+provider and apply indicators. Concurrent requests for the same
+(symbol, interval) share one candle fetch via SingleFlight, whichever
+indicator columns they need, and requests that also want the same
+columns share one indicator pass. A burst of chart loads (several tabs,
+watchlist reload at market open, different strategies on one symbol)
+costs a single download.
+
+Callers can name the indicator columns they need; only those (and their
+dependencies) are computed. Frames keep every bar; warmup rows are
+reported as valid_from rather than dropped. With an IndicatorCache,
+unchanged candles reuse the computed frame (switching strategies only
+computes the columns the new strategy adds).
+"""
+from typing import Iterable, Optional, Tuple
+
+import pandas as pd
+
+from backend.config.settings import Settings
+from backend.domain.indicators import IndicatorCache, compute_indicators
+from backend.domain.indicators.plan import OHLCV_COLUMNS
+from backend.infrastructure.yfinance_provider import YFinanceProvider
+from backend.utils.single_flight import SingleFlight
+
+
+class DataService:
+    """
+    Fetch candles and compute indicators, coalescing concurrent requests.
+
+    Returned frames are shared between coalesced callers and must be
+    treated as read-only.
+    """
+
+    def __init__(self, provider: YFinanceProvider,
+                 indicator_cache: Optional[IndicatorCache] = None):
+        self.provider = provider
+        self.indicator_cache = indicator_cache
+        self._fetch_flight = SingleFlight()
+        self._flight = SingleFlight()
+
+    def get_indicator_frame(self, symbol: str, interval: str,
+                            columns: Optional[Iterable[str]] = None) -> Tuple[pd.DataFrame, int]:
+        """
+        Get OHLCV with indicators applied.
+
+        Args:
+            symbol: Trading symbol
+            interval: Timeframe
+            columns: Indicator columns needed (None = all)
+
+        Returns:
+            Tuple of (DataFrame with indicator columns, valid_from row)
+
+        Raises:
+            ValueError: If no data or too few bars were returned
+        """
+        columns = frozenset(columns) if columns is not None else None
+        key = (symbol.upper(), interval, columns)
+        return self._flight.do(key, self._load, symbol, interval, columns)
+
+    def stats(self) -> dict:
+        """Coalescing counters for monitoring."""
+        return {
+            'candles': self._fetch_flight.stats(),
+            'indicators': self._flight.stats(),
+        }
+
+    def _load(self, symbol: str, interval: str,
+              columns: Optional[frozenset]) -> Tuple[pd.DataFrame, int]:
+        """Fetch + compute (runs once per in-flight key)."""
+        df = self._fetch_flight.do((symbol.upper(), interval), self._fetch, symbol, interval)
+
+        if self.indicator_cache is not None:
+            return self.indicator_cache.get_or_compute(symbol, interval, df, columns)
+        return compute_indicators(df, columns)
+
+    def _fetch(self, symbol: str, interval: str) -> pd.DataFrame:
+        """Fetch and clean candles (runs once per in-flight symbol/interval)."""
+        df = self.provider.fetch_candles(symbol, interval)
+
+        if df is None or df.empty:
+            raise ValueError(f"No data for {symbol}")
+
+        # Bars with missing prices (yfinance gaps) can't be charted or traded
+        if df[list(OHLCV_COLUMNS)].isna().to_numpy().any():
+            df = df.dropna(subset=list(OHLCV_COLUMNS))
+
+        if len(df) < Settings.DATA_MIN_BARS:
+            raise ValueError(f"Insufficient data for {symbol}")
+        return df
@@ -0,0 +1,314 @@
+"""
+backend/services/tick_engine.py - Live tick engine
+
+One asyncio task polls the latest candles once per subscribed symbol
+every Settings.WS_TICK_INTERVAL seconds, updates the forming candle of
+each subscribed interval and hands one tick message per (symbol,
+interval) to the connection manager for fan-out. Polling and candle
+work scale with the number of subscribed symbols, not with the number
+of connected clients: a hundred clients watching BTC-USD cost one poll.
+
+A symbol subscribed on several intervals is polled once, on its finest
+interval; the coarser forming candles are aggregated from those bars.
+Ticks are only published for topics whose candle or price changed.
+
+A topic whose poll returns no data (unknown symbol, unsupported
+interval) is not polled again for Settings.WS_NO_DATA_RETRY seconds,
+doubling per empty poll up to WS_NO_DATA_RETRY_MAX, so a bad
+subscription doesn't cost a full history download every cycle.
+
+Tick message:
+    {type: 'tick', symbol, interval, price, change, change_pct,
+     bar: {time, open, high, low, close}, active_trade, live_pnl}
+
+change / change_pct are against the previous bar's close.
+"""
+from typing import Dict, Iterable, List, Optional, Tuple
+import asyncio
+import time
+
+import numpy as np
+import pandas as pd
+
+from backend.config.settings import Settings, TimeframeMinutes
+from backend.infrastructure.yfinance_provider import YFinanceProvider
+
+
+Topic = Tuple[str, str]  # (symbol, interval)
+
+
+class TickEngine:
+    """
+    Poll subscribed symbols and publish live ticks.
+
+    The publisher (the WebSocket ConnectionManager) provides:
+        topics() → iterable of subscribed (symbol, interval) pairs
+        async publish(messages) → fan out {topic: tick message}
+
+    Usage:
+        engine = TickEngine(candle_provider, manager)
+        engine.start()          # inside the running event loop
+        await engine.stop()
+    """
+
+    def __init__(self, provider: YFinanceProvider, publisher,
+                 interval: float = Settings.WS_TICK_INTERVAL):
+        self.provider = provider
+        self.publisher = publisher
+        self.interval = interval
+        self._task: Optional[asyncio.Task] = None
+        self._last_sent: Dict[Topic, tuple] = {}
+        # Topics that returned no data → (monotonic retry time, current wait)
+        self._no_data: Dict[Topic, Tuple[float, float]] = {}
+        self.cycles = 0
+        self.polls = 0
+        self.ticks = 0
+        self.errors = 0
+        self.last_cycle_ms = 0.0
+
+    def start(self) -> None:
+        """Start the polling loop (no-op if already running)."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Cancel the polling loop and wait for it to finish."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def tick_once(self) -> Dict[Topic, dict]:
+        """
+        Run one poll + publish cycle.
+
+        Returns:
+            Messages published this cycle, by topic
+        """
+        started = time.perf_counter()
+        by_symbol: Dict[str, List[str]] = {}
+        for symbol, interval in self.publisher.topics():
+            by_symbol.setdefault(symbol, []).append(interval)
+
+        # Blocking downloads run in worker threads, one per symbol
+        results = await asyncio.gather(
+            *(asyncio.to_thread(self._poll_symbol, symbol, intervals)
+              for symbol, intervals in by_symbol.items()),
+            return_exceptions=True,
+        )
+
+        messages: Dict[Topic, dict] = {}
+        for symbol, result in zip(by_symbol, results):
+            self.polls += 1
+            if isinstance(result, BaseException):
+                self.errors += 1
+                print(f"Tick poll failed for {symbol}: {result}")
+                continue
+            for topic, message in result.items():
+                state = (message['price'], tuple(message['bar'].values()))
+                if self._last_sent.get(topic) != state:
+                    self._last_sent[topic] = state
+                    messages[topic] = message
+
+        # Forget topics nobody subscribes to any more
+        subscribed = {(s, i) for s, intervals in by_symbol.items() for i in intervals}
+        for topic in [t for t in self._last_sent if t not in subscribed]:
+            del self._last_sent[topic]
+        for topic in [t for t in self._no_data if t not in subscribed]:
+            del self._no_data[topic]
+
+        if messages:
+            await self.publisher.publish(messages)
+        self.cycles += 1
+        self.ticks += len(messages)
+        self.last_cycle_ms = round((time.perf_counter() - started) * 1000, 2)
+        return messages
+
+    def stats(self) -> dict:
+        """Counters for monitoring."""
+        return {
+            'running': self._task is not None and not self._task.done(),
+            'interval': self.interval,
+            'topics': len(self._last_sent),
+            'no_data_topics': len(self._no_data),
+            'cycles': self.cycles,
+            'polls': self.polls,
+            'ticks': self.ticks,
+            'errors': self.errors,
+            'last_cycle_ms': self.last_cycle_ms,
+        }
+
+    async def _run(self) -> None:
+        """Poll every self.interval seconds until cancelled."""
+        while True:
+            started = time.monotonic()
+            try:
+                await self.tick_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                self.errors += 1
+                print(f"Tick engine error: {e}")
+            await asyncio.sleep(max(0.0, self.interval - (time.monotonic() - started)))
+
+    def _poll_symbol(self, symbol: str, intervals: Iterable[str]) -> Dict[Topic, dict]:
+        """Fetch the symbol once and build a tick for each subscribed interval."""
+        now = time.monotonic()
+        intervals = [i for i in dict.fromkeys(intervals)
+                     if self._no_data.get((symbol, i), (0.0,))[0] <= now]
+        if not intervals:
+            return {}
+        finest = min(intervals, key=TimeframeMinutes.get)
+        fine = complete_bars(self.provider.fetch_latest(symbol, finest))
+        if len(fine) == 0:
+            self._mark_no_data((symbol, finest), now)
+            return {}
+        self._no_data.pop((symbol, finest), None)
+
+        out = {}
+        for interval in intervals:
+            if interval == finest:
+                formed = last_bar(fine)
+            else:
+                coarse = complete_bars(self.provider.fetch_candles(symbol, interval))
+                if len(coarse) == 0:
+                    self._mark_no_data((symbol, interval), now)
+                    continue
+                self._no_data.pop((symbol, interval), None)
+                formed = forming_bar(fine, coarse, interval)
+            if formed is not None:
+                bar, prev_close = formed
+                out[(symbol, interval)] = tick_message(symbol, interval, bar, prev_close)
+        return out
+
+    def _mark_no_data(self, topic: Topic, now: float) -> None:
+        """Back off from a topic that returned no data (doubling the wait)."""
+        _, wait = self._no_data.get(topic, (0.0, Settings.WS_NO_DATA_RETRY / 2))
+        wait = min(wait * 2, Settings.WS_NO_DATA_RETRY_MAX)
+        self._no_data[topic] = (now + wait, wait)
+        print(f"No data for {topic[0]} {topic[1]}, retrying in {wait:.0f}s")
+
+
+# ─────────────────────────────────────────────────────────────────────
+# Forming Candle
+# ─────────────────────────────────────────────────────────────────────
+
+OHLC_COLUMNS = ['Open', 'High', 'Low', 'Close']
+
+
+def complete_bars(df: Optional[pd.DataFrame]) -> pd.DataFrame:
+    """
+    Rows with all of Open/High/Low/Close set.
+
+    yfinance often returns the forming bar with NaN prices; a tick built
+    from it would carry NaN (invalid JSON) and never compare equal to the
+    last one sent.
+    """
+    if df is None:
+        return pd.DataFrame(columns=OHLC_COLUMNS)
+    return df.dropna(subset=OHLC_COLUMNS)
+
+
+def _epoch_seconds(index: pd.Index) -> np.ndarray:
+    """Unix seconds for a DatetimeIndex (naive timestamps are taken as UTC)."""
+    return pd.DatetimeIndex(index).values.astype('datetime64[s]').astype(np.int64)
+
+
+def last_bar(df: pd.DataFrame) -> Optional[Tuple[dict, float]]:
+    """
+    The frame's last (forming) bar.
+
+    Returns:
+        Tuple of ({time, open, high, low, close}, previous bar's close),
+        or None for an empty frame
+    """
+    if len(df) == 0:
+        return None
+    row = df.iloc[-1]
+    bar = {
+        'time': int(_epoch_seconds(df.index[-1:])[0]),
+        'open': float(row['Open']),
+        'high': float(row['High']),
+        'low': float(row['Low']),
+        'close': float(row['Close']),
+    }
+    prev_close = float(df['Close'].iloc[-2]) if len(df) > 1 else bar['open']
+    return bar, prev_close
+
+
+def forming_bar(fine: pd.DataFrame, coarse: pd.DataFrame,
+                interval: str) -> Optional[Tuple[dict, float]]:
+    """
+    Forming candle of a coarse interval, brought up to date from finer bars.
+
+    The coarse frame (possibly a few minutes old, from the candle cache)
+    gives the current bar's start and open. The fine bars at or after that
+    start supply the live high, low and close. Once the fine bars run past
+    the coarse bar's end, a new bar is started at fixed interval steps
+    (until the coarse frame is refreshed and anchors it again).
+
+    Args:
+        fine: Freshly polled frame on a finer interval
+        coarse: Frame on the subscribed interval
+        interval: Coarse timeframe (for its length)
+
+    Returns:
+        Tuple of ({time, open, high, low, close}, previous bar's close),
+        or None when the fine frame doesn't reach the forming bar
+    """
+    seconds = TimeframeMinutes.get(interval) * 60
+    fine_times = _epoch_seconds(fine.index)
+    anchored = last_bar(coarse)
+    if anchored is None or len(fine_times) == 0:
+        return None
+    bar, prev_close = anchored
+    start = bar['time']
+
+    latest = int(fine_times[-1])
+    if latest < start:
+        return bar, prev_close
+    if latest >= start + seconds:
+        start += (latest - start) // seconds * seconds
+        bar = None
+
+    first = int(np.searchsorted(fine_times, start, side='left'))
+    seg = fine.iloc[first:]
+    high = float(seg['High'].max())
+    low = float(seg['Low'].min())
+    close = float(seg['Close'].iloc[-1])
+
+    if bar is not None:
+        bar = {'time': start, 'open': bar['open'], 'high': max(bar['high'], high),
+               'low': min(bar['low'], low), 'close': close}
+        return bar, prev_close
+
+    if first > 0:
+        prev_close = float(fine['Close'].iloc[first - 1])
+    else:
+        prev_close = anchored[0]['close']
+    bar = {'time': start, 'open': float(seg['Open'].iloc[0]), 'high': high,
+           'low': low, 'close': close}
+    return bar, prev_close
+
+
+def tick_message(symbol: str, interval: str, bar: dict, prev_close: float) -> dict:
+    """Build the 'tick' WebSocket message for a forming bar."""
+    price = bar['close']
+    change = price - prev_close
+    change_pct = change / prev_close * 100 if prev_close else 0.0
+    return {
+        'type': 'tick',
+        'symbol': symbol,
+        'interval': interval,
+        'price': round(price, 4),
+        'change': round(change, 4),
+        'change_pct': round(change_pct, 2),
+        'bar': {k: (v if k == 'time' else round(v, 4)) for k, v in bar.items()},
+        # No trade store yet: trades endpoints report no active trade
+        'active_trade': None,
+        'live_pnl': None,
+    }
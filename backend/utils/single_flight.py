@@ -0,0 +1,74 @@
+"""
+backend/utils/single_flight.py - In-flight request coalescing
+
+Concurrent calls with the same key share one execution: the first caller
+runs the function, later callers block on its Future and receive the same
+result (or exception). Nothing is cached once the call completes.
+"""
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable
+import threading
+
+
+class SingleFlight:
+    """
+    Deduplicate concurrent calls by key.
+
+    Usage:
+        flight = SingleFlight()
+        df = flight.do(('BTC-USD', '5m'), load_frame, 'BTC-USD', '5m')
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._in_flight: Dict[Hashable, Future] = {}
+        self.executions = 0
+        self.shared = 0
+
+    def do(self, key: Hashable, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        Run fn(*args, **kwargs) unless a call for key is already running.
+
+        Args:
+            key: Dedup key (must be hashable)
+            fn: Function to execute
+
+        Returns:
+            Result of the (possibly shared) call
+
+        Raises:
+            Whatever fn raised, in every caller that shared the call
+        """
+        with self._lock:
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._in_flight[key] = future
+                self.executions += 1
+            else:
+                self.shared += 1
+
+        if not leader:
+            return future.result()
+
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+    def stats(self) -> dict:
+        """Counters for monitoring."""
+        with self._lock:
+            return {
+                'in_flight': len(self._in_flight),
+                'executions': self.executions,
+                'shared': self.shared,
+            }
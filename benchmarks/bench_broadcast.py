@@ -0,0 +1,117 @@
+"""
+benchmarks/bench_broadcast.py - Tick fan-out to many WebSocket clients
+
+Simulates N clients subscribed to one topic (in-memory sockets, no
+network) and measures process CPU time per broadcast of a ~230-byte tick:
+
+    - send_json loop: the previous fan-out, one send_json (one json.dumps)
+      per client
+    - publish: ConnectionManager.publish (encode once, enqueue per
+      client) plus the writer tasks that send the queued text, with the
+      json module and, when installed, orjson
+
+Usage:
+    python benchmarks/bench_broadcast.py [clients] [broadcasts]   (default: 1000 200)
+"""
+from contextlib import redirect_stdout
+import asyncio
+import io
+import json
+import sys
+import time
+
+from common import report
+
+import backend.services.connection_manager as cm
+
+TICK = {
+    'type': 'tick', 'symbol': 'BTC-USD', 'interval': '5m',
+    'price': 67123.4521, 'change': -12.3456, 'change_pct': -0.02,
+    'bar': {'time': 1792152000, 'open': 67100.1, 'high': 67150.25,
+            'low': 67090.5, 'close': 67123.4521},
+    'active_trade': None, 'live_pnl': None,
+}
+TOPIC = ('BTC-USD', '5m')
+
+
+class FakeWebSocket:
+    """Accepts and discards frames; send_json encodes like Starlette's."""
+
+    def __init__(self):
+        self.frames = 0
+
+    async def accept(self):
+        pass
+
+    async def close(self, code: int = 1000):
+        pass
+
+    async def send_text(self, text: str):
+        self.frames += 1
+
+    async def send_json(self, message: dict):
+        await self.send_text(json.dumps(message, separators=(',', ':'), ensure_ascii=False))
+
+
+async def send_json_loop(clients: int, rounds: int) -> float:
+    sockets = [FakeWebSocket() for _ in range(clients)]
+    started = time.process_time()
+    for _ in range(rounds):
+        for ws in sockets:
+            await ws.send_json(TICK)
+    return (time.process_time() - started) / rounds
+
+
+async def publish(clients: int, rounds: int, encoder) -> tuple:
+    """(total CPU, publish-only CPU) per broadcast, in seconds."""
+    cm.orjson = encoder
+    manager = cm.ConnectionManager(policy='coalesce')
+    sockets = [FakeWebSocket() for _ in range(clients)]
+    with redirect_stdout(io.StringIO()):
+        for ws in sockets:
+            await manager.connect(ws)
+            manager.subscribe(ws, *TOPIC)
+    await asyncio.sleep(0)
+
+    started = time.process_time()
+    publishing = 0.0
+    for _ in range(rounds):
+        t = time.process_time()
+        await manager.publish({TOPIC: TICK})
+        publishing += time.process_time() - t
+        # Let every writer task send its queued tick
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+    total = time.process_time() - started
+
+    delivered = sum(ws.frames for ws in sockets)
+    with redirect_stdout(io.StringIO()):
+        for ws in sockets:
+            manager.disconnect(ws)
+    await asyncio.sleep(0)
+    assert delivered == clients * rounds, f'{delivered} of {clients * rounds} frames sent'
+    return total / rounds, publishing / rounds
+
+
+async def main(clients: int, rounds: int):
+    default_encoder = cm.orjson
+    lines = [f'{clients} clients, one topic, {len(cm.encode_message(TICK))}-byte tick, '
+             f'CPU per broadcast (best of 3 runs)']
+
+    loop = min([await send_json_loop(clients, rounds) for _ in range(3)])
+    lines.append(f'  send_json per client     {loop * 1e3:6.2f}ms')
+
+    encoders = [('json', None)]
+    if default_encoder is not None:
+        encoders.append(('orjson', default_encoder))
+    for name, encoder in encoders:
+        total, pub = min([await publish(clients, rounds, encoder) for _ in range(3)])
+        lines.append(f'  publish + writers {name:<7}{total * 1e3:6.2f}ms  '
+                     f'(publish alone {pub * 1e3:.2f}ms)  x{loop / total:.1f}')
+    cm.orjson = default_encoder
+    report('WebSocket broadcast', lines)
+
+
+if __name__ == '__main__':
+    args = [int(a) for a in sys.argv[1:]]
+    asyncio.run(main(*(args + [1000, 200][len(args):])))
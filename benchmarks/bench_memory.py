@@ -0,0 +1,97 @@
+"""
+benchmarks/bench_memory.py - Peak memory of one chart computation
+
+Measures the tracemalloc peak of computing all indicators, and of that
+plus running all six strategies, for the 1m/7d and 1h/730d frame shapes
+and each apply_all_indicators() mode. The "copy + dropna" baseline is
+how indicators used to be applied: copy the frame, add the columns,
+then dropna().
+
+Every measurement runs in a fresh interpreter, so earlier runs and warm
+caches don't skew the peak.
+
+Usage:
+    python benchmarks/bench_memory.py
+"""
+import subprocess
+import sys
+
+from common import report
+
+SHAPES = [('1m/7d', '1min', 7 * 24 * 60), ('1h/730d', '1h', 730 * 24)]
+MODES = ['copy', 'default', 'keep_nan', 'inplace', 'inplace32']
+LABELS = {
+    'copy': 'copy + dropna',
+    'default': 'default',
+    'keep_nan': 'dropna=False',
+    'inplace': 'inplace',
+    'inplace32': 'inplace+float32',
+}
+
+
+def measure(mode: str, freq: str, n: int) -> tuple:
+    """(indicators, indicators + strategies) peak traced MiB; runs in this process."""
+    import gc
+    import tracemalloc
+
+    import numpy as np
+
+    from backend.domain.indicators import apply_all_indicators
+    from backend.domain.strategies import StrategyRegistry
+    from conftest import make_candles
+
+    def ts_fn(idx):
+        return int(idx.timestamp())
+
+    raw = make_candles(n, freq=freq, seed=7)
+    strategies = [StrategyRegistry.get(key) for key in StrategyRegistry.all_keys()]
+
+    # Warm imports and lazily built tables outside the measurement
+    warm = apply_all_indicators(raw.iloc[:500])
+    for strategy in strategies:
+        strategy.run(warm, ts_fn, 'X')
+    del warm
+    gc.collect()
+
+    tracemalloc.start()
+    if mode == 'copy':
+        df = apply_all_indicators(raw.copy(), inplace=True).dropna()
+    elif mode == 'default':
+        df = apply_all_indicators(raw)
+    elif mode == 'keep_nan':
+        df = apply_all_indicators(raw, dropna=False)
+    elif mode == 'inplace':
+        df = apply_all_indicators(raw, inplace=True)
+    else:
+        df = apply_all_indicators(raw, inplace=True, dtype=np.float32)
+    _, indicators_peak = tracemalloc.get_traced_memory()
+    for strategy in strategies:
+        strategy.run(df, ts_fn, 'X')
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return indicators_peak / 2**20, peak / 2**20
+
+
+def main():
+    header = f'{"frame":<18}' + ''.join(f'{LABELS[m]:>17}' for m in MODES)
+    tables = {'indicators': [header], 'indicators + strategies': [header]}
+    for name, freq, n in SHAPES:
+        rows = [f'{name} ({n})'.ljust(18)] * 2
+        for mode in MODES:
+            out = subprocess.run([sys.executable, __file__, mode, freq, str(n)],
+                                 capture_output=True, text=True, check=True)
+            peaks = out.stdout.strip().splitlines()[-1].split()
+            rows = [row + f'{float(peak):>14.2f}MiB' for row, peak in zip(rows, peaks)]
+        for table, row in zip(tables.values(), rows):
+            table.append(row)
+    lines = []
+    for title, table in tables.items():
+        lines += [title] + table
+    report('chart computation peak memory (tracemalloc)', lines)
+
+
+if __name__ == '__main__':
+    if len(sys.argv) == 4:
+        print(*measure(sys.argv[1], sys.argv[2], int(sys.argv[3])))
+    else:
+        main()
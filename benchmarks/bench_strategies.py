@@ -0,0 +1,42 @@
+"""
+benchmarks/bench_strategies.py - Vectorized vs per-bar strategy signal extraction
+
+For each strategy, times generate_signals() against the per-bar reference
+loop (tests/strategy_reference.py) on synthetic 5m candles, and checks the
+two produce identical signals.
+
+Usage:
+    python benchmarks/bench_strategies.py [bars ...]   (default: 4700 50000)
+"""
+import sys
+
+from common import best_of, report
+
+from backend.domain.indicators import compute_indicators
+from backend.domain.strategies import StrategyRegistry
+from conftest import make_candles
+from strategy_reference import REFERENCE
+
+
+def ts_fn(idx):
+    return int(idx.timestamp())
+
+
+def main(sizes):
+    lines = []
+    for n in sizes:
+        df, _ = compute_indicators(make_candles(n, seed=1))
+        for key, reference in REFERENCE.items():
+            strategy = StrategyRegistry.get(key)
+            got = list(strategy.generate_signals(df, ts_fn, 'BTC-USD'))
+            expected = reference(df, ts_fn, 'BTC-USD')
+            loop = best_of(lambda: reference(df, ts_fn, 'BTC-USD'), repeat=1)
+            vec = best_of(lambda: strategy.generate_signals(df, ts_fn, 'BTC-USD'))
+            lines.append(f'{n:>7} bars  {key:<20} loop {loop * 1e3:8.1f}ms  '
+                         f'vectorized {vec * 1e3:7.2f}ms  x{loop / vec:6.1f}  '
+                         f'signals {len(got):>5}  identical={got == expected}')
+    report('strategy signal extraction', lines)
+
+
+if __name__ == '__main__':
+    main([int(a) for a in sys.argv[1:]] or [4700, 50000])
@@ -0,0 +1,91 @@
+"""
+benchmarks/bench_supertrend.py - Supertrend kernel timings
+
+Times supertrend(3, 10) (ATR included) on synthetic 5m candles against
+the per-bar NumPy-array loop it replaced, and checks the directions are
+identical. The pure-Python kernel is timed separately when numba is
+installed, so both paths of the scalar kernel are covered.
+
+Usage:
+    python benchmarks/bench_supertrend.py [bars ...]   (default: 5000 50000 500000)
+"""
+import sys
+
+import numpy as np
+import pandas as pd
+
+from common import best_of, report
+
+from backend.domain import indicators
+from backend.domain.indicators import atr, supertrend
+from conftest import make_candles
+
+
+def supertrend_array_loop(high, low, close, factor=3.0, atr_len=10):
+    """The previous implementation: band state kept in NumPy arrays."""
+    atr_vals = atr(high, low, close, atr_len)
+    hl2 = (high + low) / 2.0
+    upper_arr = (hl2 + factor * atr_vals).values
+    lower_arr = (hl2 - factor * atr_vals).values
+    close_arr = close.values
+
+    n = len(close)
+    upper = np.zeros(n)
+    lower = np.zeros(n)
+    st_dir = np.zeros(n)
+    upper[0] = upper_arr[0]
+    lower[0] = lower_arr[0]
+    st_dir[0] = 1
+
+    for i in range(1, n):
+        if lower_arr[i] > lower[i-1] or close_arr[i-1] < lower[i-1]:
+            lower[i] = lower_arr[i]
+        else:
+            lower[i] = lower[i-1]
+        if upper_arr[i] < upper[i-1] or close_arr[i-1] > upper[i-1]:
+            upper[i] = upper_arr[i]
+        else:
+            upper[i] = upper[i-1]
+        if st_dir[i-1] == 1:
+            st_dir[i] = -1 if close_arr[i] > upper[i] else 1
+        else:
+            st_dir[i] = 1 if close_arr[i] < lower[i] else -1
+
+    return pd.Series(st_dir, index=close.index)
+
+
+def pure_python(high, low, close):
+    """supertrend() with the numba kernel disabled."""
+    jit = indicators._supertrend_kernel_jit
+    indicators._supertrend_kernel_jit = None
+    try:
+        return supertrend(high, low, close, 3.0, 10)
+    finally:
+        indicators._supertrend_kernel_jit = jit
+
+
+def main(sizes):
+    has_numba = indicators._supertrend_kernel_jit is not None
+    lines = [f'numba: {"yes" if has_numba else "not installed"}']
+    for n in sizes:
+        df = make_candles(n, seed=4)
+        h, l, c = df['High'], df['Low'], df['Close']
+        repeat = 5 if n <= 50000 else 2
+
+        expected = supertrend_array_loop(h, l, c)
+        got = supertrend(h, l, c, 3.0, 10)
+        loop = best_of(lambda: supertrend_array_loop(h, l, c), repeat=1)
+        py = best_of(lambda: pure_python(h, l, c), repeat=repeat)
+        line = (f'{n:>7} bars  array loop {loop * 1e3:8.1f}ms  '
+                f'python kernel {py * 1e3:7.1f}ms  x{loop / py:4.1f}')
+        if has_numba:
+            jit = best_of(lambda: supertrend(h, l, c, 3.0, 10), repeat=repeat)
+            line += f'  numba {jit * 1e3:7.1f}ms  x{loop / jit:4.1f}'
+        identical = (np.array_equal(got.values, expected.values)
+                     and np.array_equal(pure_python(h, l, c).values, expected.values))
+        lines.append(f'{line}  identical={identical}')
+    report('supertrend(3, 10)', lines)
+
+
+if __name__ == '__main__':
+    main([int(a) for a in sys.argv[1:]] or [5000, 50000, 500000])
@@ -0,0 +1,37 @@
+"""
+benchmarks/common.py - Shared helpers for the benchmark scripts
+
+Scripts are run from the repo root, e.g. `python benchmarks/bench_strategies.py`.
+Results are printed and appended to bench_output.txt (git-ignored).
+"""
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Iterable
+import sys
+import time
+
+ROOT = Path(__file__).resolve().parents[1]
+for path in (ROOT, ROOT / 'tests'):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
+
+OUTPUT = ROOT / 'bench_output.txt'
+
+
+def best_of(fn: Callable[[], object], repeat: int = 3) -> float:
+    """Fastest wall time of repeat calls, in seconds."""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def report(title: str, lines: Iterable[str]) -> None:
+    """Print a result block and append it to bench_output.txt."""
+    block = [f'== {title} ({datetime.now():%Y-%m-%d %H:%M}) =='] + list(lines)
+    text = '\n'.join(block) + '\n'
+    print(text)
+    with open(OUTPUT, 'a') as f:
+        f.write(text + '\n')
@@ -9,6 +9,9 @@ class ChartManager {
     this.ema200Series = null;
     this.buyMarkers = [];
     this.sellMarkers = [];
+    this.signals = [];
+    this.current = null;  // {symbol, interval, strategy} of the loaded chart
+    this.lastTime = null;  // time of the last loaded bar (for delta refresh)
     this.init();
   }
 
@@ -62,18 +65,22 @@ class ChartManager {
     const loadDiv = document.getElementById('chart-load');
     loadDiv.style.display = 'flex';
 
-    fetch(`${API_BASE}/api/chartdata?symbol=${symbol}&interval=${interval}&strategy=${strategy}`)
+    fetch(`${API_BASE}/api/chartdata?symbol=${symbol}&interval=${interval}&strategy=${strategy}&format=columnar`)
       .then(r => r.json())
-      .then(data => {
-        if (data.error) {
-          alert(data.error);
+      .then(payload => {
+        if (payload.error) {
+          alert(payload.error);
           return;
         }
+        const data = payload.columns ? DataManager.decodeColumnarChart(payload) : payload;
 
         this.candleSeries.setData(data.candles);
         this.ema9Series.setData(data.ema9);
         this.ema21Series.setData(data.ema21);
         this.ema200Series.setData(data.ema200);
+        this.current = { symbol, interval, strategy };
+        this.lastTime = data.candles.length ? data.candles[data.candles.length - 1].time : null;
+        this.signals = data.signals || [];
 
         // Clear old markers
         this.buyMarkers.forEach(m => this.candleSeries.removeMarker(m));
@@ -114,6 +121,41 @@ class ChartManager {
       });
   }
 
+  /**
+   * Fetch only bars/signals since the last loaded bar and apply them with
+   * series.update() instead of re-downloading and setData-ing the window.
+   */
+  refreshChart() {
+    if (!this.current || this.lastTime === null) return Promise.resolve();
+    const { symbol, interval, strategy } = this.current;
+
+    return fetch(`${API_BASE}/api/chartdata?symbol=${symbol}&interval=${interval}&strategy=${strategy}&format=columnar&since=${this.lastTime}`)
+      .then(r => r.json())
+      .then(payload => {
+        if (payload.error || !payload.columns) return;
+        // Ignore responses for a chart that was switched meanwhile
+        if (!this.current || this.current.symbol !== symbol || this.current.interval !== interval ||
+            this.current.strategy !== strategy) return;
+
+        const data = DataManager.decodeColumnarChart(payload);
+        data.candles.forEach(bar => this.candleSeries.update(bar));
+        data.ema9.forEach(pt => this.ema9Series.update(pt));
+        data.ema21.forEach(pt => this.ema21Series.update(pt));
+        data.ema200.forEach(pt => this.ema200Series.update(pt));
+        if (data.candles.length) this.lastTime = data.candles[data.candles.length - 1].time;
+
+        const known = new Set(this.signals.map(sig => `${sig.time}:${sig.type}`));
+        const fresh = data.signals.filter(sig => !known.has(`${sig.time}:${sig.type}`));
+        fresh.forEach(sig => this.addSignal(sig));
+        if (fresh.length) {
+          this.signals = this.signals.concat(fresh);
+          if (window.uiManager) uiManager.updateSignalList(this.signals);
+        }
+        document.getElementById('ct-sigs').textContent = `${payload.signals_count} signals`;
+      })
+      .catch(e => console.error('Failed to refresh chart', e));
+  }
+
   updateLiveCandle(bar) {
     if (!bar || !this.candleSeries) return;
     this.candleSeries.update(bar);
@@ -2,6 +2,7 @@
 
 const API_BASE = 'http://localhost:8000';
 const WS_URL = 'ws://localhost:8000/ws';
+const WS_TICK_BATCH_MS = 250;  // Tick batching window while watching several symbols (one symbol: off)
 
 const TIMEFRAMES = ['5m', '15m', '1h', '1d', '1wk'];
 const STRATEGIES = {};
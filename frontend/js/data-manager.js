@@ -11,6 +11,102 @@ class DataManager {
     }
   }
 
+  /**
+   * Fetch chart data as a packed binary frame (format=binary).
+   * Returns the same shape as a columnar payload, with typed-array columns.
+   */
+  static async getChartDataBinary(symbol, interval, strategy, limit = 300) {
+    try {
+      const resp = await fetch(`${API_BASE}/api/chartdata?symbol=${symbol}&interval=${interval}&strategy=${strategy}&format=binary&limit=${limit}`);
+      if (!(resp.headers.get('content-type') || '').includes('octet-stream')) {
+        return await resp.json();  // error payloads stay JSON
+      }
+      return DataManager.decodeBinaryChart(await resp.arrayBuffer());
+    } catch (e) {
+      console.error('getChartDataBinary failed:', e);
+      return null;
+    }
+  }
+
+  /**
+   * Decode a binary chart frame:
+   *   magic "PTTB" | version u16 | reserved u16 | header_len u32 |
+   *   JSON header (padded to 8 bytes) | rows x 8-byte column blocks
+   */
+  static decodeBinaryChart(buffer) {
+    const view = new DataView(buffer);
+    const magic = String.fromCharCode(...new Uint8Array(buffer, 0, 4));
+    if (magic !== 'PTTB') throw new Error(`Bad chart frame magic: ${magic}`);
+    const headerLen = view.getUint32(8, true);
+    const header = JSON.parse(new TextDecoder().decode(new Uint8Array(buffer, 12, headerLen)));
+
+    const rows = header.rows;
+    const columns = {};
+    let offset = 12 + headerLen;
+    header.columns.forEach(col => {
+      if (col.dtype === 'int64') {
+        // Unix seconds fit comfortably in a double
+        columns[col.name] = Array.from(new BigInt64Array(buffer, offset, rows), Number);
+      } else {
+        columns[col.name] = new Float64Array(buffer, offset, rows);
+      }
+      offset += rows * 8;
+    });
+    return { ...header, format: 'binary', columns };
+  }
+
+  /**
+   * Convert a format=columnar (or decoded binary) chartdata payload to the
+   * row shape used by Lightweight Charts and the UI
+   * ({candles, ema9, ema21, ema200, signals}).
+   */
+  static decodeColumnarChart(data) {
+    const cols = data.columns;
+    const n = cols.time.length;
+    const candles = new Array(n);
+    const ema9 = new Array(n);
+    const ema21 = new Array(n);
+    const ema200 = new Array(n);
+    for (let i = 0; i < n; i++) {
+      const time = cols.time[i];
+      candles[i] = {
+        time,
+        open: cols.open[i],
+        high: cols.high[i],
+        low: cols.low[i],
+        close: cols.close[i],
+        volume: cols.volume[i],
+      };
+      ema9[i] = { time, value: cols.ema9[i] };
+      ema21[i] = { time, value: cols.ema21[i] };
+      ema200[i] = { time, value: cols.ema200[i] };
+    }
+    return {
+      ...data,
+      candles,
+      ema9,
+      ema21,
+      ema200,
+      signals: DataManager.decodeColumnarSignals(data.signals),
+    };
+  }
+
+  static decodeColumnarSignals(sigs) {
+    if (!sigs || !sigs.type) return [];
+    return sigs.type.map((type, i) => ({
+      type,
+      symbol: sigs.symbol,
+      strategy: sigs.strategy,
+      price: sigs.price[i],
+      sl: sigs.sl[i],
+      tp: sigs.tp[i],
+      rsi: sigs.rsi[i],
+      atr: sigs.atr[i],
+      confidence: sigs.confidence[i],
+      time: sigs.time[i],
+    }));
+  }
+
   static async getStrategies() {
     try {
       const resp = await fetch(`${API_BASE}/api/strategies`);
@@ -60,10 +60,25 @@ class WebSocketManager {
     if (!this.connected) return;
     this.currentSymbol = symbol;
     this.currentInterval = interval;
+    // One symbol: batching would only delay its ticks, so it is off
     this.send({
       type: 'subscribe',
       symbol: symbol,
       interval: interval,
+      batch_ms: 0,
+    });
+  }
+
+  watch(symbols, interval) {
+    // Adds symbols (e.g. a watchlist) to the charted one. With several
+    // symbols ticking, one batched frame per window saves frames and redraws.
+    if (!this.connected || !symbols.length) return;
+    this.send({
+      type: 'subscribe',
+      symbols: symbols,
+      interval: interval || this.currentInterval,
+      add: true,
+      batch_ms: WS_TICK_BATCH_MS,
     });
   }
 
@@ -81,6 +96,9 @@ class WebSocketManager {
       case 'tick':
         this.handleTick(msg);
         break;
+      case 'ticks':
+        this.handleTicks(msg);
+        break;
       case 'signal':
         this.handleSignal(msg);
         break;
@@ -110,8 +128,9 @@ class WebSocketManager {
       uiManager.setPrice(msg.symbol, msg.price, msg.change, msg.change_pct);
     }
 
-    // Update live candle in chart
-    if (msg.bar && window.chartManager) {
+    // Update live candle in chart (only the charted symbol/interval)
+    if (msg.bar && window.chartManager && msg.symbol === this.currentSymbol &&
+        (!msg.interval || msg.interval === this.currentInterval)) {
       chartManager.updateLiveCandle(msg.bar);
     }
 
@@ -122,22 +141,24 @@ class WebSocketManager {
     }
   }
 
-  handleSignal(msg) {
-    console.log('New signal:', msg);
-    // Add to signals list in UI
-    if (window.uiManager) {
-      // Reload signal list for current symbol
-      DataManager.getChartData(msg.symbol, uiManager.currentInterval, uiManager.currentStrategy)
-        .then(data => {
-          if (data && data.signals) {
-            uiManager.updateSignalList(data.signals);
-          }
-        });
+  handleTicks(msg) {
+    // Batched frame: latest tick per symbol/interval for the window.
+    // Only the charted one touches the DOM; the rest need no redraw.
+    const ticks = msg.ticks || [];
+    for (const tick of ticks) {
+      if (tick.symbol === this.currentSymbol &&
+          (!tick.interval || tick.interval === this.currentInterval)) {
+        this.handleTick(tick);
+      }
     }
+  }
 
-    // Add marker to chart if current symbol
+  handleSignal(msg) {
+    console.log('New signal:', msg);
+    // Pull only the bars/signals since the last loaded bar; this adds the
+    // marker and updates the signal list for the current symbol
     if (msg.symbol === uiManager.currentSymbol && window.chartManager) {
-      chartManager.addSignal(msg);
+      chartManager.refreshChart();
     }
 
     // Reload watchlist to update signal badges
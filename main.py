@@ -5,26 +5,44 @@ Main entry point for the trading terminal application
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, Response
 from fastapi.staticfiles import StaticFiles
 import os
+import re
 import json
+import struct
 from datetime import datetime
+from contextlib import asynccontextmanager
 from pathlib import Path
+from typing import List, Optional, Tuple
 import asyncio
 
 # Import backend modules
-from backend.config.settings import Settings
+from backend.config.settings import Settings, TimeFrame
 from backend.domain.strategies import StrategyRegistry
-from backend.domain.indicators import apply_all_indicators
+from backend.domain.indicators import IndicatorCache, frame_cache_stats
 from backend.core.candle import Candle
+from backend.infrastructure.cache import CandleCache
+from backend.infrastructure.yfinance_provider import YFinanceProvider
+from backend.services.connection_manager import ConnectionManager
+from backend.services.data_service import DataService
+from backend.services.tick_engine import TickEngine
 import pandas as pd
+import numpy as np
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run the live tick engine for the lifetime of the server"""
+    tick_engine.start()
+    yield
+    await tick_engine.stop()
 
 # Create FastAPI app
 app = FastAPI(
     title="Pro Trading Terminal v4.0",
     description="Professional trading system with 6 strategies",
-    version="4.0.0"
+    version="4.0.0",
+    lifespan=lifespan
 )
 
 # Add CORS middleware (allow all origins for development)
@@ -40,40 +58,51 @@ app.add_middleware(
 # WEBSOCKET CONNECTION MANAGER
 # ═══════════════════════════════════════════════════════════════════════════
 
-class ConnectionManager:
-    def __init__(self):
-        self.active_connections: list = []
-
-    async def connect(self, websocket: WebSocket):
-        await websocket.accept()
-        self.active_connections.append(websocket)
-        print(f"WebSocket connected. Total connections: {len(self.active_connections)}")
-
-    def disconnect(self, websocket: WebSocket):
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
-        print(f"WebSocket disconnected. Total connections: {len(self.active_connections)}")
-
-    async def broadcast(self, message: dict):
-        disconnected = []
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except Exception as e:
-                print(f"Error sending message: {e}")
-                disconnected.append(connection)
-        
-        # Remove disconnected clients
-        for connection in disconnected:
-            if connection in self.active_connections:
-                self.active_connections.remove(connection)
-
+# Connected clients, their subscriptions and send queues
 manager = ConnectionManager()
 
+# Candle data source (shared in-process cache in front of yfinance)
+candle_cache = CandleCache()
+candle_provider = YFinanceProvider(candle_cache)
+indicator_cache = IndicatorCache()
+data_service = DataService(candle_provider, indicator_cache)
+
+# Live ticks: one poll per subscribed symbol, fanned out by the manager
+tick_engine = TickEngine(candle_provider, manager)
+
 # ═══════════════════════════════════════════════════════════════════════════
 # WEBSOCKET ENDPOINT
 # ═══════════════════════════════════════════════════════════════════════════
 
+# Ticker format accepted on subscribe (BTC-USD, ^GSPC, EURUSD=X, RELIANCE.NS)
+SYMBOL_PATTERN = re.compile(r'[A-Za-z0-9^=.\-]{1,20}')
+
+def subscription_request(message: dict) -> Tuple[List[str], str]:
+    """
+    Validate the symbols and interval of a subscribe message.
+    
+    Returns:
+        (symbols, interval)
+    
+    Raises:
+        ValueError: If symbols isn't a list of ticker strings (at most
+                    Settings.WS_MAX_TOPICS_PER_CONNECTION) or interval
+                    isn't a supported TimeFrame
+    """
+    symbols = message.get("symbols") or [message.get("symbol", "BTC-USD")]
+    interval = message.get("interval", "5m")
+    if not isinstance(symbols, list) or len(symbols) > Settings.WS_MAX_TOPICS_PER_CONNECTION:
+        raise ValueError(f"symbols must be a list of at most "
+                         f"{Settings.WS_MAX_TOPICS_PER_CONNECTION} tickers")
+    symbols = [s.strip() if isinstance(s, str) else s for s in symbols]
+    if not all(isinstance(s, str) and SYMBOL_PATTERN.fullmatch(s) for s in symbols):
+        raise ValueError("symbols must be ticker strings")
+    try:
+        TimeFrame(interval)
+    except ValueError:
+        raise ValueError(f"unsupported interval: {interval!r}") from None
+    return symbols, interval
+
 @app.websocket("/ws")
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket endpoint for real-time updates"""
@@ -85,8 +114,25 @@ async def websocket_endpoint(websocket: WebSocket):
             
             # Handle different message types
             if message.get("type") == "subscribe":
-                symbol = message.get("symbol", "BTC-USD")
-                interval = message.get("interval", "5m")
+                # {symbol, interval} follows one chart (replaces previous topics);
+                # {symbols: [...], interval, add: true} adds watched symbols
+                try:
+                    symbols, interval = subscription_request(message)
+                except ValueError as e:
+                    await manager.send(websocket, {"type": "error", "message": str(e)})
+                    continue
+                if not message.get("add"):
+                    manager.unsubscribe(websocket)
+                for symbol in symbols:
+                    if not manager.subscribe(websocket, symbol, interval):
+                        await manager.send(websocket, {
+                            "type": "error",
+                            "message": f"topic limit reached ({manager.max_topics} per connection)"
+                        })
+                        break
+                # Optional batched ticks: {batch_ms: 250} → one 'ticks' frame per window
+                if "batch_ms" in message:
+                    manager.set_batch_window(websocket, message.get("batch_ms") or 0)
                 
                 # Send status message
                 status_msg = {
@@ -94,11 +140,18 @@ async def websocket_endpoint(websocket: WebSocket):
                     "open_markets": ["US", "Crypto"],
                     "any_open": True
                 }
-                await websocket.send_json(status_msg)
+                await manager.send(websocket, status_msg)
+                
+            elif message.get("type") == "unsubscribe":
+                # {symbol, interval} drops one topic; no symbol drops all
+                symbol = message.get("symbol")
+                if symbol is None or isinstance(symbol, str):
+                    manager.unsubscribe(websocket, symbol and symbol.strip(),
+                                        message.get("interval", "5m"))
                 
             elif message.get("type") == "ping":
                 # Respond to ping
-                await websocket.send_json({"type": "pong"})
+                await manager.send(websocket, {"type": "pong"})
                 
     except WebSocketDisconnect:
         manager.disconnect(websocket)
@@ -106,6 +159,122 @@ async def websocket_endpoint(websocket: WebSocket):
         print(f"WebSocket error: {e}")
         manager.disconnect(websocket)
 
+# ═══════════════════════════════════════════════════════════════════════════
+# RESPONSE FORMATTING
+# ═══════════════════════════════════════════════════════════════════════════
+
+def unix_seconds(index: pd.Index) -> np.ndarray:
+    """Unix timestamps (seconds) for a whole index in one pass"""
+    if isinstance(index, pd.DatetimeIndex):
+        # .values is UTC datetime64 for tz-aware and naive indexes alike
+        return index.values.astype('datetime64[s]').astype(np.int64)
+    return np.array([int(pd.Timestamp(idx).timestamp()) for idx in index], dtype=np.int64)
+
+def chart_window(df: pd.DataFrame, window: int = Settings.CHART_CANDLES,
+                 since: Optional[int] = None) -> pd.DataFrame:
+    """
+    Slice the bars a chart response covers.
+    
+    Args:
+        df: Indicator frame
+        window: Maximum number of most recent bars
+        since: Unix seconds; when given, only bars at or after it
+               (the bar at `since` is included because it may have been
+               still forming when the client received it)
+    
+    Returns:
+        Row slice of df (a view, no copy)
+    """
+    start = max(0, len(df) - window)
+    if since is not None and isinstance(df.index, pd.DatetimeIndex):
+        since_ts = pd.Timestamp(since, unit='s', tz='UTC' if df.index.tz is not None else None)
+        start = max(start, int(df.index.searchsorted(since_ts, side='left')))
+    elif since is not None:
+        start = max(start, int(np.searchsorted(unix_seconds(df.index), since, side='left')))
+    return df.iloc[start:]
+
+# Indicator columns the chart itself draws (EMA lines)
+CHART_INDICATOR_COLUMNS = ('ema_9', 'ema_21', 'ema_200')
+
+def chart_window_columns(tail: pd.DataFrame) -> dict:
+    """
+    Chart window as rounded column lists (struct-of-arrays).
+    
+    Works on the already-sliced window: rounds whole columns with NumPy
+    and converts each to a Python list once, so the work is O(window)
+    regardless of how much history the frame holds.
+    
+    Returns:
+        {time, open, high, low, close, volume, ema9, ema21, ema200} lists
+    """
+    def column(name: str, decimals: int) -> list:
+        return np.round(tail[name].to_numpy(dtype=float), decimals).tolist()
+    
+    return {
+        "time": unix_seconds(tail.index).tolist(),
+        "open": column('Open', 4),
+        "high": column('High', 4),
+        "low": column('Low', 4),
+        "close": column('Close', 4),
+        "volume": column('Volume', 2),
+        "ema9": column('ema_9', 4),
+        "ema21": column('ema_21', 4),
+        "ema200": column('ema_200', 4),
+    }
+
+# Binary chart frame layout (all little-endian):
+#   magic b"PTTB" | version u16 | reserved u16 | header_len u32
+#   header: UTF-8 JSON, space-padded so column blocks start 8-byte aligned
+#   column blocks: rows x 8 bytes each, in header["columns"] order
+CHART_BINARY_MAGIC = b"PTTB"
+CHART_BINARY_VERSION = 1
+_CHART_BINARY_PREFIX = struct.Struct("<4sHHI")
+
+def encode_chart_binary(tail: pd.DataFrame, meta: dict) -> bytes:
+    """
+    Encode a chart window as a packed binary frame.
+    
+    time is int64 (Unix seconds); OHLCV and EMA columns are float64,
+    unrounded. meta (symbol, signals, counts, ...) goes into the JSON
+    header alongside the column directory.
+    """
+    blocks = [("time", unix_seconds(tail.index).astype("<i8"))]
+    for name, source in (("open", "Open"), ("high", "High"), ("low", "Low"),
+                         ("close", "Close"), ("volume", "Volume"),
+                         ("ema9", "ema_9"), ("ema21", "ema_21"), ("ema200", "ema_200")):
+        blocks.append((name, tail[source].to_numpy(dtype="<f8")))
+    
+    header = dict(meta)
+    header["rows"] = len(tail)
+    header["columns"] = [{"name": name, "dtype": values.dtype.name} for name, values in blocks]
+    header_bytes = json.dumps(header, separators=(",", ":")).encode("utf-8")
+    header_bytes += b" " * (-(_CHART_BINARY_PREFIX.size + len(header_bytes)) % 8)
+    
+    parts = [_CHART_BINARY_PREFIX.pack(CHART_BINARY_MAGIC, CHART_BINARY_VERSION, 0,
+                                       len(header_bytes)),
+             header_bytes]
+    parts.extend(np.ascontiguousarray(values).tobytes() for _, values in blocks)
+    return b"".join(parts)
+
+def format_chart_window(columns: dict) -> dict:
+    """Row-oriented candles + EMA lines (Lightweight Charts shape) from columns"""
+    times = columns["time"]
+    candles = [
+        {"time": t, "open": o, "high": h, "low": l, "close": c, "volume": v}
+        for t, o, h, l, c, v in zip(times, columns["open"], columns["high"],
+                                    columns["low"], columns["close"], columns["volume"])
+    ]
+    
+    def line(name: str) -> list:
+        return [{"time": t, "value": v} for t, v in zip(times, columns[name])]
+    
+    return {
+        "candles": candles,
+        "ema9": line("ema9"),
+        "ema21": line("ema21"),
+        "ema200": line("ema200"),
+    }
+
 # ═══════════════════════════════════════════════════════════════════════════
 # REST API ENDPOINTS
 # ═══════════════════════════════════════════════════════════════════════════
@@ -164,7 +333,9 @@ def list_strategies():
     return strategies
 
 @app.get("/api/chartdata")
-def get_chart_data(symbol: str = "BTC-USD", interval: str = "5m", strategy: str = "pro_mtf"):
+def get_chart_data(symbol: str = "BTC-USD", interval: str = "5m", strategy: str = "pro_mtf",
+                   format: str = "rows", limit: int = Settings.CHART_CANDLES,
+                   since: Optional[int] = None):
     """
     Get chart data with indicators and signals
     
@@ -172,34 +343,30 @@ def get_chart_data(symbol: str = "BTC-USD", interval: str = "5m", strategy: str
         symbol: Trading symbol (e.g., BTC-USD, AAPL)
         interval: Timeframe (5m, 15m, 1h, 1d, 1wk)
         strategy: Strategy name (pro_mtf, vwap_ema, etc.)
+        format: "rows" (one object per candle/point), "columnar"
+                (one array per field, shared time axis) or "binary"
+                (packed little-endian column blocks, see encode_chart_binary)
+        limit: Number of most recent candles to return
+        since: Unix seconds; return only bars, indicator points and
+               signals at or after this time (delta refresh)
     """
     try:
-        import yfinance as yf
-        
-        # Determine period based on interval
-        period_map = {
-            "1m": "7d", "2m": "7d", "5m": "60d", "15m": "60d",
-            "30m": "60d", "1h": "730d", "1d": "2y", "1wk": "10y"
-        }
-        period = period_map.get(interval, "60d")
-        
-        # Fetch data
-        df = yf.download(symbol, period=period, interval=interval, progress=False, auto_adjust=True)
-        
-        if df is None or df.empty:
-            return {"error": f"No data for {symbol}"}
-        
-        if len(df) < 50:
-            return {"error": f"Insufficient data for {symbol}"}
-        
-        # Apply indicators
-        df = apply_all_indicators(df)
-        
-        # Get strategy and generate signals
         strat = StrategyRegistry.get(strategy)
         if not strat:
             return {"error": f"Strategy {strategy} not found"}
         
+        # Only the indicators the chart and this strategy read
+        columns = None
+        if strat.required_columns is not None:
+            columns = set(CHART_INDICATOR_COLUMNS) | set(strat.required_columns)
+        
+        # Fetch data and apply indicators (cached candles, coalesced
+        # with concurrent requests for the same symbol/interval/columns)
+        try:
+            df, valid_from = data_service.get_indicator_frame(symbol, interval, columns)
+        except ValueError as e:
+            return {"error": str(e)}
+        
         # Prepare timestamp function
         def ts_fn(idx):
             if hasattr(idx, 'timestamp'):
@@ -207,43 +374,49 @@ def get_chart_data(symbol: str = "BTC-USD", interval: str = "5m", strategy: str
             return int(pd.Timestamp(idx).timestamp())
         
         # Generate signals
-        signals = strat.run(df, ts_fn, symbol)
-        
-        # Format candles
-        candles = []
-        for idx, row in df.iterrows():
-            candles.append({
-                "time": ts_fn(idx),
-                "open": round(float(row['Open']), 4),
-                "high": round(float(row['High']), 4),
-                "low": round(float(row['Low']), 4),
-                "close": round(float(row['Close']), 4),
-                "volume": round(float(row['Volume']), 2) if 'Volume' in row else 0
-            })
+        signals = strat.run(df, ts_fn, symbol, valid_from)
         
-        # Format indicators
-        ema9 = [{"time": ts_fn(idx), "value": round(float(val), 4)} 
-                for idx, val in df['ema_9'].items()]
-        ema21 = [{"time": ts_fn(idx), "value": round(float(val), 4)} 
-                 for idx, val in df['ema_21'].items()]
-        ema200 = [{"time": ts_fn(idx), "value": round(float(val), 4)} 
-                  for idx, val in df['ema_200'].items()]
+        # Bars to return: last `limit`, or only those since the client's last bar
+        window = max(1, min(limit, Settings.CHART_MAX_CANDLES))
+        tail = chart_window(df, window, since)
+        new_signals = signals.since(since) if since is not None else signals
         
-        # Format signals
-        signal_list = [sig.to_dict() for sig in signals]
-        
-        return {
+        meta = {
             "symbol": symbol,
             "interval": interval,
             "strategy": strategy,
-            "candles": candles[-300:],  # Last 300 candles
-            "ema9": ema9[-300:],
-            "ema21": ema21[-300:],
-            "ema200": ema200[-300:],
-            "signals": signal_list,
-            "data_count": len(candles),
+            "data_count": len(df),
             "signals_count": len(signals)
         }
+        if since is not None:
+            meta["since"] = since
+        
+        if format == "binary":
+            meta["signals"] = new_signals.to_dict()
+            return Response(content=encode_chart_binary(tail, meta),
+                            media_type="application/octet-stream")
+        
+        columns = chart_window_columns(tail)
+        
+        if format == "columnar":
+            return {
+                **meta,
+                "format": "columnar",
+                "columns": columns,
+                "signals": new_signals.to_dict(),
+            }
+        
+        chart = format_chart_window(columns)
+        
+        return {
+            **meta,
+            "candles": chart["candles"],
+            "ema9": chart["ema9"],
+            "ema21": chart["ema21"],
+            "ema200": chart["ema200"],
+            # Row dicts straight from the columnar batch
+            "signals": new_signals.to_records(),
+        }
         
     except Exception as e:
         print(f"Error in get_chart_data: {e}")
@@ -254,6 +427,19 @@ def get_chart_data(symbol: str = "BTC-USD", interval: str = "5m", strategy: str
             "strategy": strategy
         }
 
+@app.get("/api/cache/stats")
+def get_cache_stats():
+    """Data layer and live feed counters (cache hits/misses, tail fetches, coalesced requests, subscriptions)"""
+    return {
+        "candles": candle_cache.stats(),
+        "provider": candle_provider.stats(),
+        "coalescing": data_service.stats(),
+        "indicator_frames": indicator_cache.stats(),
+        "indicators": frame_cache_stats(),
+        "websocket": manager.stats(),
+        "ticks": tick_engine.stats(),
+    }
+
 @app.get("/api/watchlist")
 def get_watchlist():
     """Get watchlist"""
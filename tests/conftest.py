@@ -0,0 +1,86 @@
+"""
+tests/conftest.py - Shared fixtures
+
+Synthetic OHLCV data and a stand-in for the yfinance module, so tests run
+offline and deterministically.
+"""
+import sys
+import time
+import types
+import zlib
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# Make `backend` and `main` importable when running `pytest` from anywhere
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+FREQS = {'1m': '1min', '5m': '5min', '15m': '15min', '1h': '1h', '1d': '1D'}
+
+
+def make_candles(n: int = 3000, freq: str = '5min', seed: int = 0,
+                 end: str = '2026-10-16 12:00') -> pd.DataFrame:
+    """Random-walk OHLCV frame with a UTC DatetimeIndex."""
+    rng = np.random.default_rng(seed)
+    index = pd.date_range(end=pd.Timestamp(end, tz='UTC'), periods=n, freq=freq)
+    close = 100 + np.cumsum(rng.standard_t(2, n) * 0.4) + 6 * np.sin(np.arange(n) / 15)
+    open_ = close + rng.normal(0, 0.2, n)
+    high = np.maximum(open_, close) + np.abs(rng.normal(0, 0.3, n))
+    low = np.minimum(open_, close) - np.abs(rng.normal(0, 0.3, n))
+    volume = rng.integers(100, 10000, n).astype(float)
+    return pd.DataFrame({'Open': open_, 'High': high, 'Low': low,
+                         'Close': close, 'Volume': volume}, index=index)
+
+
+class FakeYFinance:
+    """
+    yfinance stand-in: yf.download over fixed synthetic frames.
+
+    Attributes:
+        calls: kwargs of every download() call
+        fail_tail: when True, start= downloads return an empty frame
+        delay: seconds each download takes (to keep calls in flight)
+    """
+
+    def __init__(self, n: int = 3000):
+        self.n = n
+        self.calls = []
+        self.frames = {}
+        self.fail_tail = False
+        self.delay = 0.0
+
+    def frame(self, symbol: str, interval: str) -> pd.DataFrame:
+        key = (symbol, interval)
+        if key not in self.frames:
+            seed = zlib.crc32(f'{symbol}{interval}'.encode())
+            self.frames[key] = make_candles(self.n, FREQS.get(interval, '5min'), seed)
+        return self.frames[key]
+
+    def download(self, symbol, interval='5m', progress=False, auto_adjust=True,
+                 period=None, start=None, **kwargs):
+        self.calls.append(dict(symbol=symbol, interval=interval, period=period, start=start))
+        if self.delay:
+            time.sleep(self.delay)
+        df = self.frame(symbol, interval)
+        if start is not None:
+            if self.fail_tail:
+                return pd.DataFrame()
+            df = df[df.index >= pd.Timestamp(start)]
+        # yfinance returns (field, ticker) MultiIndex columns
+        out = df.copy()
+        out.columns = pd.MultiIndex.from_product([out.columns, [symbol]])
+        return out
+
+
+@pytest.fixture
+def fake_yf(monkeypatch):
+    """Install a FakeYFinance as the yfinance module."""
+    fake = FakeYFinance()
+    module = types.ModuleType('yfinance')
+    module.download = fake.download
+    monkeypatch.setitem(sys.modules, 'yfinance', module)
+    return fake
@@ -0,0 +1,117 @@
+"""
+tests/strategy_reference.py - Per-bar reference implementations of the strategies
+
+The bar-by-bar loops the strategies used before their signal extraction was
+vectorized, kept as the reference for equivalence tests and the strategy
+benchmark. Each reads the same indicator inputs as the current strategy
+(columns, or the memoized get_indicator() fallbacks) and builds signals one
+at a time with BaseStrategy._build_signal.
+"""
+from typing import Callable, List
+
+import pandas as pd
+
+from backend.config.settings import MarketHours
+from backend.core.signal import Signal
+from backend.domain.indicators import get_indicator, is_intraday
+from backend.domain.strategies.base import BaseStrategy
+
+
+def _scan(df: pd.DataFrame, key: str, symbol: str, ts_fn, start: int,
+          is_buy: Callable[[int], bool], is_sell: Callable[[int], bool]) -> List[Signal]:
+    """Loop over bars from start; BUY takes precedence over SELL (if/elif)."""
+    r = df['rsi_14']
+    a = df['atr_14']
+    signals = []
+    for i in range(start, len(df)):
+        if is_buy(i):
+            side = 'BUY'
+        elif is_sell(i):
+            side = 'SELL'
+        else:
+            continue
+        signals.append(BaseStrategy._build_signal(df, i, side, float(a.iloc[i]),
+                                                  float(r.iloc[i]), ts_fn, key, symbol))
+    return signals
+
+
+def pro_mtf(df, ts_fn, symbol=""):
+    c, e200, r = df['Close'], df['ema_200'], df['rsi_14']
+    st, cu, cd = df['supertrend'], df['crossover_9_21'], df['crossunder_9_21']
+    return _scan(df, 'pro_mtf', symbol, ts_fn, 1,
+                 lambda i: bool(cu.iloc[i]) and r.iloc[i] > 50
+                 and c.iloc[i] > e200.iloc[i] and st.iloc[i] < 0,
+                 lambda i: bool(cd.iloc[i]) and r.iloc[i] < 50
+                 and c.iloc[i] < e200.iloc[i] and st.iloc[i] > 0)
+
+
+def vwap_ema(df, ts_fn, symbol=""):
+    if is_intraday(df.index):
+        tz, session_open = MarketHours.session_open(symbol)
+        vwap = get_indicator(df, 'session_vwap', tz=tz, session_open=session_open)
+    else:
+        vwap = get_indicator(df, 'vwap')
+    c, e9, e21, r = df['Close'], df['ema_9'], df['ema_21'], df['rsi_14']
+    c_prev, vwap_prev = c.shift(1), vwap.shift(1)
+    cv_up = (c_prev <= vwap_prev) & (c > vwap)
+    cv_dn = (c_prev >= vwap_prev) & (c < vwap)
+    return _scan(df, 'vwap_ema', symbol, ts_fn, 1,
+                 lambda i: bool(cv_up.iloc[i]) and e9.iloc[i] > e21.iloc[i] and r.iloc[i] > 50,
+                 lambda i: bool(cv_dn.iloc[i]) and e9.iloc[i] < e21.iloc[i] and r.iloc[i] < 50)
+
+
+def rsi_reversal(df, ts_fn, symbol=""):
+    c, r = df['Close'], df['rsi_14']
+    e50 = df['ema_50'] if 'ema_50' in df.columns else get_indicator(df, 'ema', length=50)
+    r_prev = r.shift(1).fillna(50)
+    cross30_up = (r_prev < 30) & (r >= 30)
+    cross70_down = (r_prev > 70) & (r <= 70)
+    return _scan(df, 'rsi_reversal', symbol, ts_fn, 1,
+                 lambda i: bool(cross30_up.iloc[i]) and c.iloc[i] > e50.iloc[i],
+                 lambda i: bool(cross70_down.iloc[i]) and c.iloc[i] < e50.iloc[i])
+
+
+def bollinger_breakout(df, ts_fn, symbol=""):
+    c, r, v = df['Close'], df['rsi_14'], df['Volume']
+    upper, lower = df['bb_upper'], df['bb_lower']
+    vm = v.rolling(20).mean()
+    c_prev, up_prev, lo_prev = c.shift(1), upper.shift(1), lower.shift(1)
+
+    def vol_ok(i):
+        return v.iloc[i] > vm.iloc[i] * 1.3
+
+    return _scan(df, 'bollinger_breakout', symbol, ts_fn, 20,
+                 lambda i: c_prev.iloc[i] <= up_prev.iloc[i] and c.iloc[i] > upper.iloc[i]
+                 and r.iloc[i] > 55 and vol_ok(i),
+                 lambda i: c_prev.iloc[i] >= lo_prev.iloc[i] and c.iloc[i] < lower.iloc[i]
+                 and r.iloc[i] < 45 and vol_ok(i))
+
+
+def macd_crossover(df, ts_fn, symbol=""):
+    r = df['rsi_14']
+    macd, sig, hist = df['macd'], df['macd_signal'], df['macd_hist']
+    macd_prev, sig_prev = macd.shift(1), sig.shift(1)
+    return _scan(df, 'macd_crossover', symbol, ts_fn, 1,
+                 lambda i: macd_prev.iloc[i] <= sig_prev.iloc[i] and macd.iloc[i] > sig.iloc[i]
+                 and hist.iloc[i] > 0 and r.iloc[i] > 50,
+                 lambda i: macd_prev.iloc[i] >= sig_prev.iloc[i] and macd.iloc[i] < sig.iloc[i]
+                 and hist.iloc[i] < 0 and r.iloc[i] < 50)
+
+
+def supertrend_scalper(df, ts_fn, symbol=""):
+    r = df['rsi_14']
+    st = get_indicator(df, 'supertrend', factor=2.0, atr_len=7)
+    st_prev = st.shift(1)
+    return _scan(df, 'supertrend_scalper', symbol, ts_fn, 1,
+                 lambda i: st_prev.iloc[i] > 0 and st.iloc[i] < 0 and r.iloc[i] > 45,
+                 lambda i: st_prev.iloc[i] < 0 and st.iloc[i] > 0 and r.iloc[i] < 55)
+
+
+REFERENCE = {
+    'pro_mtf': pro_mtf,
+    'vwap_ema': vwap_ema,
+    'rsi_reversal': rsi_reversal,
+    'bollinger_breakout': bollinger_breakout,
+    'macd_crossover': macd_crossover,
+    'supertrend_scalper': supertrend_scalper,
+}
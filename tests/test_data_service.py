@@ -0,0 +1,35 @@
+"""Tests for DataService request coalescing."""
+import threading
+
+from backend.domain.indicators import IndicatorCache
+from backend.domain.strategies import StrategyRegistry
+from backend.infrastructure.cache import CandleCache
+from backend.infrastructure.yfinance_provider import YFinanceProvider
+from backend.services.data_service import DataService
+
+
+def test_concurrent_loads_with_different_columns_share_one_download(fake_yf):
+    fake_yf.delay = 0.2  # keep the first fetch in flight while the others arrive
+    service = DataService(YFinanceProvider(CandleCache()), IndicatorCache())
+    column_sets = [StrategyRegistry.get(k).required_columns
+                   for k in StrategyRegistry.all_keys()] * 2
+    barrier = threading.Barrier(len(column_sets))
+    results, errors = [], []
+
+    def load(columns):
+        barrier.wait()
+        try:
+            results.append(service.get_indicator_frame('AAPL', '5m', columns))
+        except Exception as e:  # pragma: no cover - reported below
+            errors.append(e)
+
+    threads = [threading.Thread(target=load, args=(c,)) for c in column_sets]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert not errors
+    assert len(results) == len(column_sets)
+    assert len(fake_yf.calls) == 1
+    assert service.stats()['candles']['executions'] == 1
@@ -0,0 +1,125 @@
+"""Streaming indicator states vs the batch functions, bar for bar."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.domain.indicators import (
+    ATRState, BollingerState, EMAState, MACDState, RSIState, SMAState, SupertrendState,
+    VWAPState, atr, bollinger_bands, ema, macd, rsi, session_vwap, sma, supertrend,
+)
+from conftest import make_candles
+
+N = 1500
+
+
+@pytest.fixture(scope='module')
+def df():
+    return make_candles(N, seed=7)
+
+
+def _cols(*series):
+    return np.column_stack([np.asarray(s, dtype=float) for s in series])
+
+
+# name → (state factory, bar fields, batch outputs as (bars × outputs))
+CASES = {
+    'ema': (lambda: EMAState(21), ('Close',),
+            lambda d: _cols(ema(d['Close'], 21))),
+    'sma': (lambda: SMAState(20), ('Volume',),
+            lambda d: _cols(sma(d['Volume'], 20))),
+    'rsi': (lambda: RSIState(14), ('Close',),
+            lambda d: _cols(rsi(d['Close'], 14))),
+    'atr': (lambda: ATRState(14), ('High', 'Low', 'Close'),
+            lambda d: _cols(atr(d['High'], d['Low'], d['Close'], 14))),
+    'macd': (lambda: MACDState(12, 26, 9), ('Close',),
+             lambda d: _cols(*macd(d['Close'], 12, 26, 9))),
+    'bollinger': (lambda: BollingerState(20, 2.0), ('Close',),
+                  lambda d: _cols(*bollinger_bands(d['Close'], 20, 2.0))),
+    'supertrend': (lambda: SupertrendState(2.0, 7), ('High', 'Low', 'Close'),
+                   lambda d: _cols(supertrend(d['High'], d['Low'], d['Close'], 2.0, 7))),
+    'session_vwap': (lambda: VWAPState('America/New_York', (9, 30)),
+                     ('ts', 'High', 'Low', 'Close', 'Volume'),
+                     lambda d: _cols(session_vwap(d['High'], d['Low'], d['Close'], d['Volume'],
+                                                  'America/New_York', (9, 30)))),
+}
+
+
+def _bars(df, fields):
+    columns = [df.index if f == 'ts' else df[f].to_numpy(dtype=float) for f in fields]
+    return list(zip(*columns))
+
+
+def _perturb(bar, factor):
+    # Prices/volume scaled; the timestamp (VWAP) is kept
+    return tuple(v * factor if isinstance(v, float) else v for v in bar)
+
+
+def _run(state, bars, revise: bool):
+    out = []
+    for bar in bars:
+        if revise:
+            # Forming bar updated twice before its final value
+            state.update(*_perturb(bar, 1.01))
+            state.update(*_perturb(bar, 0.99), replace_last=True)
+            value = state.update(*bar, replace_last=True)
+        else:
+            value = state.update(*bar)
+        out.append(np.atleast_1d(np.asarray(value, dtype=float)))
+    return np.vstack(out)
+
+
+@pytest.mark.parametrize('name', sorted(CASES))
+@pytest.mark.parametrize('revise', [False, True], ids=['append', 'replace_last'])
+def test_matches_batch(df, name, revise):
+    factory, fields, batch = CASES[name]
+    expected = batch(df)
+    got = _run(factory(), _bars(df, fields), revise)
+
+    assert got.shape == expected.shape
+    # Same NaN warmup positions, same values
+    np.testing.assert_array_equal(np.isnan(got), np.isnan(expected))
+    np.testing.assert_allclose(got, expected, rtol=1e-9, atol=1e-9, equal_nan=True)
+
+
+def test_warmup_is_nan(df):
+    bb = BollingerState(20)
+    values = [bb.update(c) for c in df['Close'].iloc[:20]]
+    assert all(np.isnan(v).all() for v in values[:19])
+    assert not np.isnan(values[19]).any()
+
+
+@pytest.fixture(scope='module')
+def df_gaps(df):
+    # yfinance-style gaps: whole bars missing, and a lone missing close
+    gaps = df.copy()
+    gaps.iloc[[40, 41, 42, 500, 1200], :] = np.nan
+    gaps.iloc[[300, 900], gaps.columns.get_loc('Close')] = np.nan
+    return gaps
+
+
+@pytest.mark.parametrize('name', ['ema', 'rsi', 'atr', 'macd', 'sma', 'bollinger'])
+@pytest.mark.parametrize('revise', [False, True], ids=['append', 'replace_last'])
+def test_matches_batch_across_nan_bars(df_gaps, name, revise):
+    factory, fields, batch = CASES[name]
+    expected = batch(df_gaps)
+    got = _run(factory(), _bars(df_gaps, fields), revise)
+
+    np.testing.assert_array_equal(np.isnan(got), np.isnan(expected))
+    np.testing.assert_allclose(got, expected, rtol=1e-9, atol=1e-9, equal_nan=True)
+
+
+@pytest.mark.parametrize('length', [3, 9])
+def test_ema_reweights_after_nan(length):
+    # length 3 is com == 1, which pandas weights differently
+    values = [1.0, 2.0, 3.0, np.nan, 5.0, 6.0, np.nan, np.nan, 8.0]
+    state = EMAState(length)
+    got = [state.update(v) for v in values]
+    np.testing.assert_allclose(got, ema(pd.Series(values), length), rtol=1e-12)
+
+
+def test_rolling_recovers_after_nan():
+    values = [1.0, 2.0, 3.0, np.nan, 5.0, 6.0, 7.0, 8.0]
+    state = SMAState(3)
+    got = [state.update(v) for v in values]
+    np.testing.assert_array_equal(got, sma(pd.Series(values), 3))
+    assert got[-2:] == [6.0, 7.0]
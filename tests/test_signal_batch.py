@@ -0,0 +1,24 @@
+"""Tests for SignalBatch.concat."""
+import pytest
+
+from backend.core.signal import SignalBatch
+
+
+def batch(symbol, strategy, times):
+    n = len(times)
+    return SignalBatch(symbol, strategy, [True] * n, [100.0] * n, [99.0] * n,
+                       [102.0] * n, [55.0] * n, [1.0] * n, [80.0] * n, times)
+
+
+def test_concat_same_symbol_and_strategy():
+    out = SignalBatch.concat([batch('AAPL', 'macd_crossover', [1, 2]),
+                              SignalBatch.empty(),
+                              batch('AAPL', 'macd_crossover', [3])])
+    assert (out.symbol, out.strategy) == ('AAPL', 'macd_crossover')
+    assert out.time.tolist() == [1, 2, 3]
+
+
+@pytest.mark.parametrize('other', [('BTC-USD', 'macd_crossover'), ('AAPL', 'pro_mtf')])
+def test_concat_refuses_mixed_labels(other):
+    with pytest.raises(ValueError):
+        SignalBatch.concat([batch('AAPL', 'macd_crossover', [1]), batch(*other, [2])])
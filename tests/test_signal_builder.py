@@ -0,0 +1,42 @@
+"""Tests for BaseStrategy._build_signals (vectorized signal construction)."""
+import numpy as np
+import pandas as pd
+import pytest
+
+from backend.domain.strategies.base import BaseStrategy
+from conftest import make_candles
+
+
+def build(df, ts_fn):
+    n = len(df)
+    idx = np.array([3, 10, n - 1])
+    return BaseStrategy._build_signals(df, idx, np.array([True, False, True]),
+                                       np.full(n, 0.5), np.full(n, 60.0), ts_fn, 'test')
+
+
+def no_ts_fn(idx):
+    raise AssertionError("ts_fn must not be called for a DatetimeIndex")
+
+
+@pytest.mark.parametrize('tz', ['UTC', 'America/New_York', None])
+def test_datetime_index_times_in_one_pass(tz):
+    df = make_candles(50)
+    df.index = df.index.tz_convert(tz) if tz else df.index.tz_localize(None)
+    batch = build(df, no_ts_fn)
+    expected = [int(df.index[i].timestamp()) for i in (3, 10, 49)]
+    assert batch.time.tolist() == expected
+    assert batch.time.dtype == np.int64
+
+
+def test_other_index_uses_ts_fn():
+    df = make_candles(50).reset_index(drop=True)
+    batch = build(df, lambda i: 1_000 + i)
+    assert batch.time.tolist() == [1_003, 1_010, 1_049]
+
+
+def test_builds_same_rows_as_build_signal():
+    df = make_candles(50)
+    ts_fn = lambda t: int(pd.Timestamp(t).timestamp())
+    batch = build(df, ts_fn)
+    for signal, i, side in zip(batch, (3, 10, 49), ('BUY', 'SELL', 'BUY')):
+        assert signal == BaseStrategy._build_signal(df, i, side, 0.5, 60.0, ts_fn, 'test')
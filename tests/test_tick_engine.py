@@ -0,0 +1,71 @@
+"""Tests for the live tick engine's polling."""
+import asyncio
+import json
+import math
+
+import numpy as np
+import pytest
+
+from backend.config.settings import Settings
+from backend.infrastructure.cache import CandleCache
+from backend.infrastructure.yfinance_provider import YFinanceProvider
+from backend.services.tick_engine import TickEngine
+from conftest import make_candles
+
+
+class Publisher:
+    """ConnectionManager stand-in: fixed topics, records published ticks."""
+
+    def __init__(self, *topics):
+        self.subscribed = list(topics)
+        self.published = []
+
+    def topics(self):
+        return self.subscribed
+
+    async def publish(self, messages):
+        self.published.append(messages)
+
+
+@pytest.fixture
+def provider(fake_yf):
+    return YFinanceProvider(CandleCache())
+
+
+def test_nan_forming_bar_is_skipped(fake_yf, provider):
+    frame = fake_yf.frame('BTC-USD', '5m')
+    frame.iloc[-1, frame.columns.get_indexer(['Open', 'High', 'Low', 'Close'])] = np.nan
+    engine = TickEngine(provider, Publisher(('BTC-USD', '5m')))
+
+    message = asyncio.run(engine.tick_once())[('BTC-USD', '5m')]
+    assert message['price'] == round(frame['Close'].iloc[-2], 4)
+    assert message['bar']['time'] == int(frame.index[-2].timestamp())
+    json.dumps(message, allow_nan=False)
+    assert all(math.isfinite(v) for v in message['bar'].values())
+
+    # Unchanged on the next cycle, so not published again
+    assert asyncio.run(engine.tick_once()) == {}
+
+
+def test_topics_without_data_back_off(fake_yf, provider):
+    for symbol in ('NOPE', 'GONE'):
+        fake_yf.frames[(symbol, '5m')] = make_candles(0)
+    engine = TickEngine(provider, Publisher(('NOPE', '5m'), ('GONE', '5m'), ('BTC-USD', '5m')))
+
+    for _ in range(3):
+        asyncio.run(engine.tick_once())
+    downloads = [c['symbol'] for c in fake_yf.calls]
+    assert downloads.count('NOPE') == downloads.count('GONE') == 1
+    assert engine.stats()['no_data_topics'] == 2
+
+    # Retried once the wait is over; the wait then doubles
+    engine._no_data = {topic: (0.0, wait) for topic, (_, wait) in engine._no_data.items()}
+    asyncio.run(engine.tick_once())
+    asyncio.run(engine.tick_once())
+    assert [c['symbol'] for c in fake_yf.calls].count('NOPE') == 2
+    assert engine._no_data[('NOPE', '5m')][1] == 2 * Settings.WS_NO_DATA_RETRY
+
+    # Unsubscribed topics are forgotten
+    engine.publisher.subscribed = [('BTC-USD', '5m')]
+    asyncio.run(engine.tick_once())
+    assert engine.stats()['no_data_topics'] == 0
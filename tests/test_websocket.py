@@ -0,0 +1,95 @@
+"""WebSocket subscribe handling: message validation and the per-connection topic cap."""
+import asyncio
+import io
+from contextlib import redirect_stdout
+
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+from backend.services.connection_manager import ConnectionManager
+
+
+class FakeWebSocket:
+    async def accept(self):
+        pass
+
+    async def send_text(self, text):
+        pass
+
+
+@pytest.fixture
+def client(fake_yf, monkeypatch):
+    monkeypatch.setattr(main.manager, 'max_topics', 3)
+    # No live ticks interleaved with the replies under test
+    monkeypatch.setattr(main.tick_engine, 'start', lambda: None)
+    with TestClient(main.app) as test_client:
+        yield test_client
+
+
+def subscriptions(ws):
+    """Topics of the only live connection (after a ping round trip)."""
+    ws.send_json({'type': 'ping'})
+    assert ws.receive_json() == {'type': 'pong'}
+    (topics,) = main.manager.client_topics.values()
+    return topics
+
+
+@pytest.mark.parametrize('request_fields', [
+    {'symbols': 'BTC-USD'},
+    {'symbols': ['BTC-USD', '']},
+    {'symbols': ['AAPL', 7]},
+    {'symbols': ['  ']},
+    {'symbols': ['AAPL; DROP']},
+    {'symbol': 'AAPL', 'interval': 'bogus'},
+    {'symbol': 'AAPL', 'interval': ['5m']},
+], ids=['string', 'empty', 'number', 'blank', 'format', 'interval', 'interval-type'])
+def test_invalid_subscriptions_are_rejected(client, request_fields):
+    with client.websocket_connect('/ws') as ws:
+        ws.send_json({'type': 'subscribe', 'symbol': 'AAPL', 'interval': '5m'})
+        assert ws.receive_json()['type'] == 'status'
+
+        ws.send_json({'type': 'subscribe', 'interval': '5m', **request_fields})
+        assert ws.receive_json()['type'] == 'error'
+        # The previous subscription is kept, nothing was split into characters
+        assert subscriptions(ws) == {('AAPL', '5m')}
+
+
+def test_symbols_list_subscribes_each(client):
+    with client.websocket_connect('/ws') as ws:
+        ws.send_json({'type': 'subscribe', 'symbols': ['BTC-USD', ' AAPL '], 'interval': '1h'})
+        assert ws.receive_json()['type'] == 'status'
+        assert subscriptions(ws) == {('BTC-USD', '1h'), ('AAPL', '1h')}
+
+
+def test_topics_capped_per_connection(client):
+    with client.websocket_connect('/ws') as ws:
+        ws.send_json({'type': 'subscribe', 'symbols': ['A', 'B'], 'interval': '5m'})
+        assert ws.receive_json()['type'] == 'status'
+
+        ws.send_json({'type': 'subscribe', 'symbols': ['C', 'D'], 'interval': '5m', 'add': True})
+        error = ws.receive_json()
+        assert error['type'] == 'error' and '3 per connection' in error['message']
+        assert ws.receive_json()['type'] == 'status'
+        assert subscriptions(ws) == {('A', '5m'), ('B', '5m'), ('C', '5m')}
+
+        # Replacing the subscription frees the slots again
+        ws.send_json({'type': 'subscribe', 'symbol': 'D', 'interval': '5m'})
+        assert ws.receive_json()['type'] == 'status'
+        assert subscriptions(ws) == {('D', '5m')}
+
+
+def test_subscribe_after_disconnect_is_ignored():
+    # A subscribe still being handled after a slow-client disconnect
+    manager = ConnectionManager()
+    ws = FakeWebSocket()
+
+    async def scenario():
+        await manager.connect(ws)
+        manager.disconnect(ws)
+        return manager.subscribe(ws, 'BTC-USD', '5m')
+
+    with redirect_stdout(io.StringIO()):
+        assert asyncio.run(scenario()) is False
+    assert manager.subscribers == {} and manager.client_topics == {}
+    assert manager.topics() == []
@@ -0,0 +1,57 @@
+"""Tests for YFinanceProvider cache refresh behaviour."""
+from backend.infrastructure.cache import CandleCache
+from backend.infrastructure.yfinance_provider import YFinanceProvider
+
+
+def expire(cache: CandleCache) -> None:
+    for entry in cache._entries.values():
+        entry.stored_at -= cache.ttl + 1
+
+
+def test_expired_frame_refreshes_tail_only(fake_yf):
+    cache = CandleCache()
+    provider = YFinanceProvider(cache)
+    first = provider.fetch_candles('BTC-USD', '5m')
+    expire(cache)
+
+    second = provider.fetch_candles('BTC-USD', '5m')
+    assert provider.stats() == {'full_fetches': 1, 'tail_fetches': 1}
+    assert second.index.equals(first.index)
+
+
+def test_failed_tail_falls_back_to_full_download(fake_yf):
+    cache = CandleCache()
+    provider = YFinanceProvider(cache)
+    provider.fetch_candles('BTC-USD', '5m')
+    expire(cache)
+    fake_yf.fail_tail = True
+
+    df = provider.fetch_candles('BTC-USD', '5m')
+    assert df is not None and len(df) == fake_yf.n
+    assert provider.stats() == {'full_fetches': 2, 'tail_fetches': 1}
+    # The full download was stored, so the entry is fresh again
+    key = CandleCache.make_key('BTC-USD', '5m', provider.period_for('5m'))
+    assert cache.get(key) is not None
+
+
+def test_failed_refresh_does_not_mark_stale_frame_fresh(fake_yf, monkeypatch):
+    cache = CandleCache()
+    provider = YFinanceProvider(cache)
+    stale = provider.fetch_candles('BTC-USD', '5m')
+    expire(cache)
+    monkeypatch.setattr(YFinanceProvider, '_download', staticmethod(lambda *a, **k: None))
+
+    assert provider.fetch_candles('BTC-USD', '5m') is stale
+    key = CandleCache.make_key('BTC-USD', '5m', provider.period_for('5m'))
+    assert cache.get(key) is None
+
+
+def test_fetch_latest_falls_back_to_full_download(fake_yf):
+    cache = CandleCache()
+    provider = YFinanceProvider(cache)
+    provider.fetch_candles('BTC-USD', '5m')
+    fake_yf.fail_tail = True
+
+    df = provider.fetch_latest('BTC-USD', '5m')
+    assert df is not None and len(df) == fake_yf.n
+    assert provider.stats()['full_fetches'] == 2